@@ -0,0 +1,109 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""ANTA circuit breaker classes."""
+
+from __future__ import annotations
+
+import logging
+from enum import Enum
+from time import monotonic
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """States of a `CircuitBreaker`."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+class CircuitOpenError(Exception):
+    """Exception raised when a request is not sent because the circuit breaker of the device is open."""
+
+    def __init__(self, name: str, failures: int) -> None:
+        """Initialize a CircuitOpenError."""
+        super().__init__(f"Circuit breaker open after {failures} consecutive transport errors on {name}, request not sent")
+
+
+class CircuitBreaker:
+    """Fail fast the requests of a device after repeated transport errors.
+
+    The circuit breaker is closed by default and the requests are sent to the device. After `threshold` consecutive
+    transport errors, the breaker opens and the requests fail immediately instead of waiting for their own timeout.
+    Once `cooldown` seconds have passed, the breaker is half-open: a single request is sent to probe the device while the
+    other requests keep failing. The breaker closes if the probe succeeds and opens again for `cooldown` seconds otherwise.
+
+    Attributes
+    ----------
+    name : str
+        Name of the device.
+    threshold : int
+        Number of consecutive transport errors opening the breaker.
+    cooldown : float
+        Time in seconds before the breaker is half-open. Also the time after which a probe without outcome, e.g. a cancelled
+        request, is replaced by a new probe.
+    state : CircuitState
+        Current state of the breaker.
+    failures : int
+        Number of consecutive transport errors.
+    opened : int
+        Number of times the breaker opened.
+    rejected : int
+        Number of requests that failed fast while the breaker was open.
+    """
+
+    def __init__(self, name: str, threshold: int, cooldown: float = 30.0) -> None:
+        """Initialize a CircuitBreaker."""
+        self.name = name
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened = 0
+        self.rejected = 0
+        # Time of the last opening of the breaker or of the last probe
+        self._timestamp = 0.0
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        """Return the circuit breaker statistics of the device."""
+        return {"opened": self.opened, "rejected": self.rejected}
+
+    def before_request(self) -> None:
+        """Check that a request can be sent to the device.
+
+        Raises
+        ------
+        CircuitOpenError
+            If the breaker is open, or half-open with a probe in flight.
+        """
+        if self.state == CircuitState.CLOSED:
+            return
+        if monotonic() - self._timestamp < self.cooldown:
+            self.rejected += 1
+            raise CircuitOpenError(self.name, self.failures)
+        # The cooldown is over, send a probe
+        logger.debug("Circuit breaker of %s half-open, probing the device", self.name)
+        self.state = CircuitState.HALF_OPEN
+        self._timestamp = monotonic()
+
+    def record_success(self) -> None:
+        """Record a request that reached the device and close the breaker."""
+        if self.state != CircuitState.CLOSED:
+            logger.info("Circuit breaker of %s closed, the device is responding again", self.name)
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        """Record a transport error and open the breaker after `threshold` consecutive errors or if the probe failed."""
+        self.failures += 1
+        if self.state == CircuitState.HALF_OPEN or (self.state == CircuitState.CLOSED and self.failures >= self.threshold):
+            logger.warning(
+                "Circuit breaker of %s opened after %d consecutive transport errors, failing its requests for %g seconds", self.name, self.failures, self.cooldown
+            )
+            self.state = CircuitState.OPEN
+            self.opened += 1
+            self._timestamp = monotonic()
@@ -0,0 +1,217 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""ANTA run cost estimate classes."""
+
+from __future__ import annotations
+
+import json
+import math
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from statistics import median
+from typing import TYPE_CHECKING, Any
+
+from anta.device import MAX_CONCURRENT_REQUESTS
+from anta.result_manager.models import AntaTestStatus
+
+if TYPE_CHECKING:
+    from anta.device import AntaDevice
+    from anta.models import AntaCommand, AntaTest
+    from anta.result_manager import ResultManager
+
+
+def _get_request_size(commands: list[AntaCommand]) -> int:
+    """Return the estimated size in bytes of the body of an eAPI request collecting the provided commands."""
+    request = {
+        "jsonrpc": "2.0",
+        "method": "runCmds",
+        "params": {
+            "version": commands[0].version,
+            "cmds": [{"cmd": command.command, "revision": command.revision} if command.revision else {"cmd": command.command} for command in commands],
+            "format": commands[0].ofmt,
+        },
+        "id": f"ANTA-{id(commands[0])}",
+    }
+    return len(json.dumps(request))
+
+
+@dataclass
+class DeviceCostEstimate:
+    """Estimate the cost of the ANTA run on a device.
+
+    Attributes
+    ----------
+    name : str
+        Name of the device.
+    tests : int
+        Number of tests scheduled on the device.
+    commands : int
+        Number of commands of the tests.
+    unique_commands : int
+        Number of unique commands after deduplication, i.e. commands sharing the same UID are collected once.
+    requests : int
+        Number of eAPI requests without batching. Commands are deduplicated if the commands are prefetched or
+        if the device cache is enabled.
+    request_bytes : int
+        Estimated size in bytes of the bodies of the eAPI requests without batching.
+    batched_requests : int
+        Number of eAPI requests with batching, grouping the unique commands by output format and version.
+    batched_request_bytes : int
+        Estimated size in bytes of the bodies of the eAPI requests with batching.
+    connections : int
+        Expected number of concurrent connections to the device, bounded by the maximum connections of the device.
+    """
+
+    name: str
+    tests: int = 0
+    commands: int = 0
+    unique_commands: int = 0
+    requests: int = 0
+    request_bytes: int = 0
+    batched_requests: int = 0
+    batched_request_bytes: int = 0
+    connections: int = 0
+
+
+@dataclass
+class RunCostEstimate:
+    """Estimate the cost of an ANTA run from the tests instantiated in dry-run mode.
+
+    The duration is estimated if the `request_latency` is known, e.g. from the test results of a previous run using
+    `get_request_latency()`. The requests of a device are sent in rounds of `connections` concurrent requests, and the
+    requests across all the devices in rounds of `max_concurrency` concurrent requests.
+
+    Attributes
+    ----------
+    devices : list[DeviceCostEstimate]
+        Cost estimate per device.
+    batch_size : int | None
+        Maximum number of commands per request with batching. None means no limit.
+    batching : bool
+        True if the run is configured to send the commands in multi-command requests.
+    max_concurrency : int
+        Maximum number of tests running concurrently across all devices.
+    potential_connections : int | None
+        Maximum number of connections of the selected devices. None if unknown.
+    file_descriptor_limit : int
+        Maximum number of file descriptors available to the ANTA process.
+    request_latency : float | None
+        Estimated latency in seconds of an eAPI request. None if unknown.
+    """
+
+    devices: list[DeviceCostEstimate] = field(default_factory=list)
+    batch_size: int | None = None
+    batching: bool = False
+    max_concurrency: int = MAX_CONCURRENT_REQUESTS
+    potential_connections: int | None = None
+    file_descriptor_limit: int = 0
+    request_latency: float | None = None
+
+    def add_tests(self, tests: list[AntaTest], *, deduplicate: bool) -> None:
+        """Estimate the cost of running the provided tests and add it to the devices estimates.
+
+        Tests that are already in a final state or that have blocked commands are not counted as they do not send any request.
+
+        Parameters
+        ----------
+        tests
+            The `AntaTest` instances of the run.
+        deduplicate
+            True if the commands sharing the same UID are collected once per device, i.e. if the commands are prefetched.
+            The commands are also deduplicated by the device cache if enabled.
+        """
+        devices: dict[AntaDevice, DeviceCostEstimate] = {}
+        commands_per_device: defaultdict[AntaDevice, dict[str, AntaCommand]] = defaultdict(dict)
+        all_commands_per_device: defaultdict[AntaDevice, list[AntaCommand]] = defaultdict(list)
+        for test in tests:
+            device_estimate = devices.setdefault(test.device, DeviceCostEstimate(name=test.device.name))
+            device_estimate.tests += 1
+            if test.result.result != AntaTestStatus.UNSET or any(command.blocked for command in test.instance_commands):
+                continue
+            for command in test.instance_commands:
+                key = command.uid if command.use_cache else f"{command.uid}-{id(command)}"
+                commands_per_device[test.device].setdefault(key, command)
+                all_commands_per_device[test.device].append(command)
+
+        for device, device_estimate in devices.items():
+            all_commands = all_commands_per_device[device]
+            unique_commands = list(commands_per_device[device].values())
+            device_estimate.commands = len(all_commands)
+            device_estimate.unique_commands = len(unique_commands)
+            requests = unique_commands if deduplicate or device.cache is not None else all_commands
+            device_estimate.requests = len(requests)
+            device_estimate.request_bytes = sum(_get_request_size([command]) for command in requests)
+            batches = self._get_batches(unique_commands)
+            device_estimate.batched_requests = len(batches)
+            device_estimate.batched_request_bytes = sum(_get_request_size(batch) for batch in batches)
+            max_connections = device.max_connections if device.max_connections is not None else MAX_CONCURRENT_REQUESTS
+            device_estimate.connections = min(max_connections, device_estimate.batched_requests if self.batching else device_estimate.requests)
+        self.devices.extend(devices.values())
+
+    def _get_batches(self, commands: list[AntaCommand]) -> list[list[AntaCommand]]:
+        """Group the commands by output format and version, then split the groups in batches of at most `batch_size` commands."""
+        groups: defaultdict[tuple[str, int | str], list[AntaCommand]] = defaultdict(list)
+        for command in commands:
+            groups[(command.ofmt, command.version)].append(command)
+        if self.batch_size is None:
+            return list(groups.values())
+        return [group[index : index + self.batch_size] for group in groups.values() for index in range(0, len(group), self.batch_size)]
+
+    @staticmethod
+    def get_request_latency(manager: ResultManager) -> float | None:
+        """Return the median collection time of the tests of a previous run that did not use the cache.
+
+        The commands of a test are collected concurrently, the collection time of a test is used as the latency of a request.
+        Returns None if no test result has timing information.
+        """
+        latencies = [
+            result.timing.collection for result in manager.results if result.timing is not None and result.timing.cache_hits == 0 and result.timing.collection > 0
+        ]
+        return median(latencies) if latencies else None
+
+    @property
+    def total_requests(self) -> int:
+        """Total eAPI requests across all devices with the batching configuration of the run."""
+        return sum(device.batched_requests if self.batching else device.requests for device in self.devices)
+
+    @property
+    def total_connections(self) -> int:
+        """Total expected concurrent connections across all devices."""
+        return sum(device.connections for device in self.devices)
+
+    def get_device_duration(self, device: DeviceCostEstimate) -> float | None:
+        """Return the estimated duration in seconds of the requests of a device. None if the request latency is unknown."""
+        if self.request_latency is None:
+            return None
+        requests = device.batched_requests if self.batching else device.requests
+        return math.ceil(requests / device.connections) * self.request_latency if device.connections else 0.0
+
+    @property
+    def duration(self) -> float | None:
+        """Estimated duration in seconds of the run. None if the request latency is unknown."""
+        if self.request_latency is None:
+            return None
+        global_duration = math.ceil(self.total_requests / self.max_concurrency) * self.request_latency
+        return max([global_duration, *(self.get_device_duration(device) or 0.0 for device in self.devices)])
+
+    @property
+    def dump(self) -> dict[str, Any]:
+        """Get a dictionary representing the cost estimate, including the totals and the estimated durations."""
+        return {
+            "batch_size": self.batch_size,
+            "batching": self.batching,
+            "max_concurrency": self.max_concurrency,
+            "potential_connections": self.potential_connections,
+            "file_descriptor_limit": self.file_descriptor_limit,
+            "request_latency": self.request_latency,
+            "total_requests": self.total_requests,
+            "total_connections": self.total_connections,
+            "duration": self.duration,
+            "devices": [asdict(device) | {"duration": self.get_device_duration(device)} for device in self.devices],
+        }
+
+    @property
+    def json(self) -> str:
+        """Get a JSON representation of the cost estimate."""
+        return json.dumps(self.dump, indent=4)
@@ -0,0 +1,158 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""ANTA persistent command output cache classes."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import zlib
+from time import time
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+PURGE_RATIO = 0.9
+"""Ratio of the maximum size to which the least recently used outputs are evicted, so a purge is not run on every write."""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outputs (
+    namespace TEXT NOT NULL,
+    uid TEXT NOT NULL,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL,
+    size INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (namespace, uid)
+)
+"""
+
+
+class DiskCacheStore:
+    """SQLite database storing the command outputs of the devices across ANTA runs.
+
+    The outputs are serialized in JSON, optionally compressed with zlib, and keyed by a device namespace and the `uid` of
+    the command. Each output has its own expiration time. The total size of the outputs is bounded: once the maximum size is exceeded, the expired outputs
+    and the least recently used outputs are evicted.
+
+    A single store is opened per database file and process, see `DiskCacheStore.open()`. The database uses the SQLite
+    write-ahead log so the worker processes of a sharded run can share it. The methods of the store can be called from any
+    thread, e.g. with `asyncio.to_thread()` so a database locked by another process does not block the event loop: the
+    accesses to the database connection are serialized by a lock.
+
+    Attributes
+    ----------
+    path : Path
+        Path of the SQLite database file. The parent directory is created if it does not exist.
+    max_size : int
+        Maximum total size in bytes of the serialized outputs.
+    evictions : int
+        Number of outputs evicted to stay below the maximum size since the store was opened.
+    """
+
+    _stores: ClassVar[dict[Path, DiskCacheStore]] = {}
+
+    def __init__(self, path: Path, max_size: int) -> None:
+        """Initialize a DiskCacheStore instance."""
+        self.path = path
+        self.max_size = max_size
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Autocommit mode, each write is a transaction
+        self._connection = sqlite3.connect(path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        # With the write-ahead log, the commits are not synced to disk: an output lost on power failure is collected again
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(SCHEMA)
+        self._size = 0
+        self.evictions = 0
+        self.purge()
+
+    @classmethod
+    def open(cls, path: Path, max_size: int) -> DiskCacheStore:
+        """Return the store of the provided database file, opening it on first use in this process."""
+        path = path.resolve()
+        if (store := cls._stores.get(path)) is None:
+            store = cls._stores[path] = cls(path, max_size)
+        return store
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the stored outputs, including the outputs replaced since the last purge."""
+        return self._size
+
+    def close(self) -> None:
+        """Close the database. The store cannot be used anymore."""
+        self._stores.pop(self.path.resolve(), None)
+        with self._lock:
+            self._connection.close()
+
+    def get(self, namespace: str, uid: str) -> Any:  # noqa: ANN401
+        """Return the output of the provided command if cached and not expired, None otherwise."""
+        with self._lock:
+            row = self._connection.execute("SELECT expires, size, value FROM outputs WHERE namespace = ? AND uid = ?", (namespace, uid)).fetchone()
+            if row is None:
+                return None
+            now = time()
+            expires, size, value = row
+            if expires <= now:
+                self._connection.execute("DELETE FROM outputs WHERE namespace = ? AND uid = ?", (namespace, uid))
+                self._size -= size
+                return None
+            self._connection.execute("UPDATE outputs SET accessed = ? WHERE namespace = ? AND uid = ?", (now, namespace, uid))
+        # Compressed outputs are stored as BLOB
+        return json.loads(zlib.decompress(value) if isinstance(value, bytes) else value)
+
+    def set(self, namespace: str, uid: str, value: Any, ttl: float, *, compress_threshold: int | None = None) -> None:  # noqa: ANN401
+        """Store the output of the provided command for `ttl` seconds, compressed if its serialization is larger than `compress_threshold` bytes."""
+        serialized = json.dumps(value)
+        data: str | bytes = serialized
+        if compress_threshold is not None and len(serialized) > compress_threshold:
+            data = zlib.compress(serialized.encode(), level=1)
+        with self._lock:
+            now = time()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO outputs (namespace, uid, expires, accessed, size, value) VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, uid, now + ttl, now, len(data), data),
+            )
+            # The size of a replaced output is not deducted, the exact size is computed by the purge
+            self._size += len(data)
+            if self._size > self.max_size:
+                self._purge()
+
+    def delete(self, namespace: str) -> None:
+        """Delete the outputs of the provided namespace."""
+        with self._lock:
+            deleted = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM outputs WHERE namespace = ?", (namespace,)).fetchone()[0]
+            self._connection.execute("DELETE FROM outputs WHERE namespace = ?", (namespace,))
+            # The outputs stored by other processes since the last purge are not counted in the size
+            self._size = max(0, self._size - deleted)
+
+    def purge(self) -> None:
+        """Delete the expired outputs, then the least recently used outputs until the total size is below `PURGE_RATIO` of the maximum size."""
+        with self._lock:
+            self._purge()
+
+    def _purge(self) -> None:
+        """Purge the database. The lock of the store must be held."""
+        self._connection.execute("DELETE FROM outputs WHERE expires <= ?", (time(),))
+        self._size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM outputs").fetchone()[0]
+        if self._size <= self.max_size:
+            return
+
+        target = int(self.max_size * PURGE_RATIO)
+        evicted: list[tuple[str, str]] = []
+        for namespace, uid, size in self._connection.execute("SELECT namespace, uid, size FROM outputs ORDER BY accessed").fetchall():
+            if self._size <= target:
+                break
+            evicted.append((namespace, uid))
+            self._size -= size
+        self._connection.executemany("DELETE FROM outputs WHERE namespace = ? AND uid = ?", evicted)
+        self.evictions += len(evicted)
+        logger.debug("Evicted %d outputs from the cache %s to stay below %d bytes", len(evicted), self.path, self.max_size)
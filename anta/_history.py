@@ -0,0 +1,100 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""ANTA test duration history classes."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from anta.logger import exc_to_str
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from anta.catalog import AntaTestDefinition
+    from anta.result_manager.models import TestResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMMAND_DURATION = 0.1
+"""Default estimated duration in seconds of a command, used to compute the duration hint of a test class without recorded duration."""
+
+HISTORY_WEIGHT = 0.5
+"""Weight of the new duration of a test when updating its recorded duration with an exponential moving average."""
+
+
+class DurationHistory:
+    """Durations of the tests recorded by previous ANTA runs.
+
+    The durations are stored in a JSON file keyed by device name and test definition fingerprint, and are used to
+    schedule the longest tests first. When a test has no recorded duration, its duration is estimated from the
+    `duration_hint` class attribute of the test, or from the number of commands of the test class.
+
+    Attributes
+    ----------
+    path : Path
+        Path of the JSON history file.
+    durations : dict[str, dict[str, float]]
+        Recorded durations in seconds per device name and test definition fingerprint.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize a DurationHistory instance."""
+        self.path = path if isinstance(path, Path) else Path(path)
+        self.durations: dict[str, dict[str, float]] = {}
+
+    def load(self) -> None:
+        """Load the recorded durations from the history file. A missing or invalid file is ignored."""
+        if not self.path.is_file():
+            logger.debug("No test duration history found at %s", self.path)
+            return
+        try:
+            with self.path.open(encoding="UTF-8") as f:
+                durations = json.load(f)
+            self.durations = {device: {fingerprint: float(duration) for fingerprint, duration in tests.items()} for device, tests in durations.items()}
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning("Ignoring invalid test duration history %s: %s", self.path, exc_to_str(e))
+            self.durations = {}
+
+    def save(self) -> None:
+        """Write the recorded durations to the history file."""
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("w", encoding="UTF-8") as f:
+                json.dump(self.durations, f, indent=2, sort_keys=True)
+            tmp_path.replace(self.path)
+        except OSError as e:
+            logger.warning("Unable to write the test duration history %s: %s", self.path, exc_to_str(e))
+            tmp_path.unlink(missing_ok=True)
+
+    def update(self, results: Iterable[TestResult]) -> None:
+        """Record the durations of the provided test results.
+
+        The recorded duration is an exponential moving average of the durations of the previous runs.
+        The results without timing or test definition fingerprint are ignored.
+        """
+        for result in results:
+            if result.timing is None or result.fingerprint is None:
+                continue
+            tests = self.durations.setdefault(result.name, {})
+            previous = tests.get(result.fingerprint)
+            duration = result.timing.total
+            tests[result.fingerprint] = duration if previous is None else HISTORY_WEIGHT * duration + (1 - HISTORY_WEIGHT) * previous
+
+    def estimate(self, device_name: str, test_def: AntaTestDefinition) -> float:
+        """Return the estimated duration in seconds of a test on a device.
+
+        Returns the recorded duration if any, otherwise the `duration_hint` of the test class if set,
+        otherwise `DEFAULT_COMMAND_DURATION` per command of the test class.
+        """
+        if (duration := self.durations.get(device_name, {}).get(test_def.fingerprint)) is not None:
+            return duration
+        if test_def.test.duration_hint is not None:
+            return test_def.test.duration_hint
+        return DEFAULT_COMMAND_DURATION * len(test_def.test.commands)
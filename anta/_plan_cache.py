@@ -0,0 +1,180 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""ANTA run plan cache classes."""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import logging
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from anta import __version__ as anta_version
+from anta.catalog import AntaCatalog
+from anta.logger import exc_to_str
+
+if TYPE_CHECKING:
+    from anta._runner import AntaRunContext
+
+logger = logging.getLogger(__name__)
+
+
+def _sorted(value: Any) -> list[Any]:  # noqa: ANN401
+    """Serialize the sets of the filters as sorted lists to get a stable JSON representation."""
+    return sorted(value, key=str)
+
+
+def _get_module_digest(name: str) -> str | None:
+    """Return a SHA-256 hash of the source file of a module, importing it if needed. Returns None if the module cannot be read."""
+    try:
+        module = sys.modules.get(name) or importlib.import_module(name)
+        filename = getattr(module, "__file__", None)
+        return hashlib.sha256(Path(filename).read_bytes()).hexdigest() if filename is not None else ""
+    except (ImportError, OSError):
+        return None
+
+
+def _get_test_modules(catalog: AntaCatalog) -> dict[str, str | None]:
+    """Return the hashes of the source files of the loaded modules of the packages defining the tests of a catalog.
+
+    All the loaded modules of these packages are included, as the test inputs can use models defined in other modules of the package.
+    """
+    packages = {test_def.test.__module__.partition(".")[0] for test_def in catalog.tests}
+    names = sorted(name for name in list(sys.modules) if name.partition(".")[0] in packages)
+    return {name: _get_module_digest(name) for name in names}
+
+
+class RunPlanCache:
+    """Persistent on-disk cache of the run plans of ANTA.
+
+    A run plan is made of the parsed test catalog and of the tests selected for each device. Parsing a large catalog
+    and selecting the tests of each device are expensive while the catalog and the inventory rarely change between runs.
+    Each entry of the cache is keyed by a SHA-256 hash of its inputs and of the ANTA version, so an entry is invalidated
+    by any change of the catalog file, the inventory devices, the filters of the run or the ANTA version. A cached catalog
+    also records the hashes of the source files of the packages defining its tests, e.g. a custom test package, and is
+    parsed again when one of them changes so the test inputs are validated by the current test models.
+
+    Entries are serialized with `pickle`: the cache directory must only be writable by trusted users.
+
+    Attributes
+    ----------
+    directory : Path
+        Directory of the cache files. Created if it does not exist.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize a RunPlanCache instance."""
+        self.directory = directory if isinstance(directory, Path) else Path(directory)
+
+    @staticmethod
+    def get_key(*parts: str | bytes) -> str:
+        """Return a SHA-256 hash of the provided parts and of the ANTA version."""
+        digest = hashlib.sha256(anta_version.encode())
+        for part in parts:
+            data = part.encode() if isinstance(part, str) else part
+            # Prefix each part with its length so that different parts cannot produce the same key
+            digest.update(len(data).to_bytes(8, "big"))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def load_catalog(self, filename: str | Path, file_format: Literal["yaml", "json"] = "yaml") -> AntaCatalog:
+        """Load a test catalog from the cache, or parse the catalog file and store it in the cache.
+
+        The entry is keyed by the content of the catalog file, so the catalog is parsed again when the file changes or when
+        the source files of the packages defining the tests of the catalog change.
+
+        Parameters
+        ----------
+        filename
+            Path to test catalog YAML or JSON file.
+        file_format
+            Format of the file, either 'yaml' or 'json'.
+
+        Returns
+        -------
+        AntaCatalog
+            A catalog populated with the file content.
+        """
+        path = filename if isinstance(filename, Path) else Path(filename)
+        key = self.get_key("catalog", str(path), file_format, path.read_bytes())
+        entry = self._load(key, "catalog")
+        if isinstance(entry, tuple) and len(entry) == 2 and isinstance(entry[1], AntaCatalog):  # noqa: PLR2004
+            modules, catalog = entry
+            if all(_get_module_digest(name) == digest for name, digest in modules.items()):
+                logger.info("Test catalog %s loaded from the plan cache", path)
+                return catalog
+            logger.debug("Test modules of catalog %s changed, ignoring the plan cache entry %s", path, key)
+        catalog = AntaCatalog.parse(path, file_format=file_format)
+        self._store(key, "catalog", (_get_test_modules(catalog), catalog))
+        return catalog
+
+    def get_selection_key(self, ctx: AntaRunContext) -> str:
+        """Return the key of the tests selected for the devices of an ANTA run.
+
+        The key is computed from the test definitions of the catalog, the names and tags of the selected devices and the filters of the run.
+        """
+        tests = "\n".join(test_def.fingerprint for test_def in ctx.catalog.tests)
+        devices = json.dumps(sorted((device.name, sorted(device.tags)) for device in ctx.selected_inventory.devices))
+        filters = json.dumps(ctx.filters.model_dump(), sort_keys=True, default=_sorted)
+        return self.get_key("selection", tests, devices, filters)
+
+    def load_selected_tests(self, ctx: AntaRunContext, key: str) -> bool:
+        """Set the tests selected per device of an ANTA run from the cache.
+
+        Returns True if the selection has been found in the cache, otherwise False.
+        """
+        selection = self._load(key, "selection")
+        if not isinstance(selection, dict):
+            return False
+        try:
+            for device in ctx.selected_inventory.devices:
+                if indexes := selection[device.name]:
+                    ctx.selected_tests[device] = {ctx.catalog.tests[index] for index in indexes}
+        except (KeyError, IndexError):
+            # Should not happen as the selection is keyed by the catalog and the devices
+            ctx.selected_tests.clear()
+            return False
+        logger.info("Tests selection loaded from the plan cache")
+        return True
+
+    def save_selected_tests(self, ctx: AntaRunContext, key: str) -> None:
+        """Store the tests selected per device of an ANTA run in the cache, as indexes of the catalog tests."""
+        indexes = {test_def: index for index, test_def in enumerate(ctx.catalog.tests)}
+        selection = {device.name: sorted(indexes[test_def] for test_def in ctx.selected_tests.get(device, set())) for device in ctx.selected_inventory.devices}
+        self._store(key, "selection", selection)
+
+    def _get_path(self, key: str, kind: str) -> Path:
+        """Return the path of a cache entry."""
+        return self.directory / f"{kind}-{key}.pickle"
+
+    def _load(self, key: str, kind: str) -> Any:  # noqa: ANN401
+        """Return the content of a cache entry. Returns None if the entry does not exist or cannot be loaded."""
+        path = self._get_path(key, kind)
+        if not path.is_file():
+            logger.debug("Plan cache miss for %s %s", kind, key)
+            return None
+        try:
+            with path.open("rb") as f:
+                return pickle.load(f)  # noqa: S301
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError, ValueError) as e:
+            logger.warning("Ignoring invalid plan cache entry %s: %s", path, exc_to_str(e))
+            return None
+
+    def _store(self, key: str, kind: str, content: Any) -> None:  # noqa: ANN401
+        """Write a cache entry. The entry is written to a temporary file first so that a concurrent run never reads a partial entry."""
+        path = self._get_path(key, kind)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("wb") as f:
+                pickle.dump(content, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(path)
+        except (OSError, pickle.PicklingError, AttributeError, TypeError) as e:
+            logger.warning("Unable to write plan cache entry %s: %s", path, exc_to_str(e))
+            tmp_path.unlink(missing_ok=True)
@@ -0,0 +1,91 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""ANTA snapshot archive classes."""
+
+from __future__ import annotations
+
+import zipfile
+from contextlib import ExitStack
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import sys
+    from pathlib import Path
+    from types import TracebackType
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+
+class ReplayArchive:
+    """ZIP archive of a snapshot directory written by `anta exec snapshot`, replayed by `ReplayDevice` objects.
+
+    The archive is opened and indexed on first use and can be shared by the devices replaying it, so its central
+    directory is read once. The members are indexed by device name, output format directory and file name, and can be
+    nested in a root directory, e.g. the snapshot directory itself.
+
+    Use the archive as a context manager or call `close()` to close the archive file. A closed archive is opened again on next use.
+    Only the path of the archive is pickled.
+
+    Attributes
+    ----------
+    path : Path
+        Path of the ZIP archive.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize a ReplayArchive instance."""
+        self.path = path
+        self._stack = ExitStack()
+        self._zipfile: zipfile.ZipFile | None = None
+        self._index: dict[tuple[str, str, str], str] = {}
+        self._devices: set[str] = set()
+
+    def __enter__(self) -> Self:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None:
+        """Exit the context manager and close the archive file."""
+        self.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of the ReplayArchive instance for pickling, i.e. its path."""
+        return {"path": self.path}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Re-create the ReplayArchive instance from its pickled path."""
+        self.__init__(**state)  # type: ignore[misc]  # pylint: disable=unnecessary-dunder-call
+
+    @property
+    def devices(self) -> set[str]:
+        """Names of the devices with outputs in the archive."""
+        self._open()
+        return self._devices
+
+    def _open(self) -> zipfile.ZipFile:
+        """Return the archive file, opening and indexing it if needed."""
+        if self._zipfile is None:
+            self._zipfile = self._stack.enter_context(zipfile.ZipFile(self.path))
+            for member in self._zipfile.namelist():
+                parts = member.rstrip("/").split("/")
+                if len(parts) >= 3:  # noqa: PLR2004
+                    self._index[parts[-3], parts[-2], parts[-1]] = member
+            self._devices = {key[0] for key in self._index}
+        return self._zipfile
+
+    def read(self, device: str, directory: str, filename: str) -> str | None:
+        """Return the content of an output file of a device, None if it does not exist in the archive."""
+        archive = self._open()
+        member = self._index.get((device, directory, filename))
+        return archive.read(member).decode("UTF-8") if member is not None else None
+
+    def close(self) -> None:
+        """Close the archive file."""
+        self._stack.close()
+        self._zipfile = None
+        self._index = {}
+        self._devices = set()
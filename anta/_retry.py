@@ -0,0 +1,112 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""ANTA retry policy classes."""
+
+from __future__ import annotations
+
+import logging
+import random
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RETRY_ON = ["TimeoutException", "NetworkError", "RemoteProtocolError"]
+"""Default names of the exception classes of the transient request failures, i.e. HTTPX timeouts, network errors and protocol errors."""
+
+RETRY_BUDGET_RATIO = 0.2
+"""Maximum ratio of retries to requests of a device, on top of `RETRY_BUDGET_MIN` retries."""
+
+RETRY_BUDGET_MIN = 10
+"""Number of retries of a device allowed regardless of the number of requests, so the first requests of a run can be retried."""
+
+
+class RetryPolicy:
+    """Retry the requests of a device failing with a transient error, with exponential backoff and full jitter.
+
+    A request failing with a retryable exception is retried until `max_attempts` attempts have been made. The delay
+    before the retry following the attempt `n` is drawn uniformly between 0 and `backoff * 2 ** (n - 1)` seconds, capped at
+    `max_backoff` seconds, so the retries of concurrent requests are spread over time. The retries are also bounded by
+    a budget of `RETRY_BUDGET_MIN` retries plus `budget_ratio` times the number of requests of the device: once the
+    budget is exhausted, failed requests are not retried anymore so the retries do not amplify the load of a struggling device.
+
+    The policy also records the retry statistics of the device.
+
+    Attributes
+    ----------
+    name : str
+        Name of the device.
+    max_attempts : int
+        Maximum number of attempts of a request, including the first one.
+    backoff : float
+        Base delay in seconds of the exponential backoff.
+    max_backoff : float
+        Upper bound in seconds of the delay before a retry.
+    retry_on : set[str]
+        Names of the retryable exception classes. An exception is retryable if the name of its class or of one of its base classes is in this set.
+    budget_ratio : float
+        Maximum ratio of retries to requests, on top of `RETRY_BUDGET_MIN` retries.
+    requests : int
+        Number of requests sent to the device, excluding the retries.
+    retries : int
+        Number of retries sent to the device.
+    exhausted : int
+        Number of requests that failed with a retryable exception and were not retried anymore, because of `max_attempts` or of the budget.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_attempts: int,
+        *,
+        backoff: float = 0.5,
+        max_backoff: float = 10.0,
+        retry_on: list[str] | set[str] | None = None,
+        budget_ratio: float = RETRY_BUDGET_RATIO,
+    ) -> None:
+        """Initialize a RetryPolicy."""
+        self.name = name
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_on = set(retry_on if retry_on is not None else DEFAULT_RETRY_ON)
+        self.budget_ratio = budget_ratio
+        self.requests = 0
+        self.retries = 0
+        self.exhausted = 0
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        """Return the retry statistics of the device."""
+        return {"requests": self.requests, "retries": self.retries, "exhausted": self.exhausted}
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        """Return True if the provided exception is a transient failure that can be retried."""
+        return any(cls.__name__ in self.retry_on for cls in type(exc).__mro__)
+
+    def get_delay(self, exc: BaseException, attempt: int) -> float | None:
+        """Return the delay in seconds before retrying a request that failed with the provided exception.
+
+        Parameters
+        ----------
+        exc
+            The exception raised by the failed attempt.
+        attempt
+            Number of attempts of the request made so far, starting at 1.
+
+        Returns
+        -------
+        float | None
+            The delay before the retry, or None if the request must not be retried.
+        """
+        if not self.is_retryable(exc):
+            return None
+        if attempt >= self.max_attempts:
+            self.exhausted += 1
+            return None
+        if self.retries >= RETRY_BUDGET_MIN + self.budget_ratio * self.requests:
+            logger.debug("Retry budget of %s exhausted after %d retries for %d requests", self.name, self.retries, self.requests)
+            self.exhausted += 1
+            return None
+        self.retries += 1
+        # Full jitter, the delay is not used for security purposes
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))  # noqa: S311
@@ -5,33 +5,81 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from asyncio import Semaphore, gather
-from collections import defaultdict
+import multiprocessing
+import os
+import sys
+from asyncio import Queue, as_completed, ensure_future, gather, get_running_loop
+from collections import Counter, defaultdict
+from contextlib import suppress
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from inspect import getcoroutinelocals
-from typing import TYPE_CHECKING, Any
+from itertools import chain, repeat, zip_longest
+from logging.handlers import QueueHandler
+from queue import Empty
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, cast
 
 from pydantic import BaseModel, ConfigDict
 
 from anta import GITHUB_SUGGESTION
+from anta._circuit_breaker import CircuitBreaker
+from anta._cost import RunCostEstimate
+from anta._history import DurationHistory
+from anta._plan_cache import RunPlanCache
+from anta._retry import RetryPolicy
+from anta._scheduler import ADAPTIVE_INITIAL_LIMIT, GLOBAL_LIMITER_NAME, AdaptiveLimiter, AntaScheduler
+from anta._statistics import AntaRunStatistics, SweepStatistics
+from anta.device import MAX_CONCURRENT_REQUESTS
 from anta.inventory import AntaInventory
-from anta.logger import anta_log_exception
+from anta.logger import anta_log_exception, exc_to_str
 from anta.models import AntaTest
 from anta.result_manager import ResultManager
+from anta.result_manager.models import AntaTestStatus
 from anta.settings import AntaRunnerSettings
 from anta.tools import Catchtime
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine
+    from collections.abc import AsyncGenerator, AsyncIterator, Coroutine, Iterable, Iterator
+    from multiprocessing.process import BaseProcess
+    from multiprocessing.queues import Queue as ProcessQueue
 
     from anta.catalog import AntaCatalog, AntaTestDefinition
     from anta.device import AntaDevice
+    from anta.models import AntaCommand
     from anta.result_manager.models import TestResult
 
 logger = logging.getLogger(__name__)
 
+ResultCallback = Callable[["TestResult"], None]
+"""Type alias for a callable called with each `TestResult` as soon as the test completes."""
+
+
+SHARD_POLL_INTERVAL = 1.0
+"""Maximum time in seconds to wait for a message from the worker processes of a sharded run before checking their liveness."""
+
+DEADLINE_NOT_STARTED_MESSAGE = "Test not started before the run deadline"
+"""Error message of the tests not started before the deadline of the run."""
+
+DEADLINE_INTERRUPTED_MESSAGE = "Test interrupted by the run deadline"
+"""Error message of the tests still running at the deadline of the run."""
+
+
+def _get_peak_memory() -> int | None:
+    """Return the peak resident set size of the current process in bytes. Returns None on non-POSIX systems."""
+    if os.name != "posix":
+        return None
+
+    # On purpose imported for POSIX only
+    import resource  # noqa: PLC0415
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
 
 class AntaRunFilters(BaseModel):
     """Define filters for an ANTA run.
@@ -54,6 +102,16 @@ class AntaRunFilters(BaseModel):
     established_only : bool, default=True
         When `True`, only includes devices with established connections in the
         test run.
+    included_tests : set[tuple[str, str, str | None]] | None, optional
+        Set of (device name, test name, test definition fingerprint) tuples of
+        the only tests to run, e.g. the failed tests of a previous run. A tuple
+        without fingerprint includes all the definitions of the test for the
+        device. Only the devices of the included tests are connected. If `None`,
+        includes all the tests. Commonly set via the NRFU CLI `--rerun-from` option.
+    excluded_tests : set[tuple[str, str, str]] | None, optional
+        Set of (device name, test name, test definition fingerprint) tuples of
+        the tests not to run, e.g. the tests already recorded in the journal of
+        a resumed run. Commonly set via the NRFU CLI `--resume` option.
     """
 
     model_config = ConfigDict(frozen=True, extra="forbid")
@@ -61,6 +119,8 @@ class AntaRunFilters(BaseModel):
     tests: set[str] | None = None
     tags: set[str] | None = None
     established_only: bool = True
+    included_tests: set[tuple[str, str, str | None]] | None = None
+    excluded_tests: set[tuple[str, str, str]] | None = None
 
 
 @dataclass
@@ -89,6 +149,13 @@ class AntaRunContext:
         List of device names that were found unreachable during the inventory setup phase.
     warnings_at_setup: list[str]
         List of warnings caught during the setup phase.
+    scheduler: AntaScheduler | None
+        Scheduler of the test coroutines, exposing the number of waiting and running tests per device during the run.
+        None if the tests have not been scheduled yet.
+    statistics: AntaRunStatistics
+        Statistics and estimates recorded during the run, grouped by run stage.
+    deadline: float | None
+        Event loop time at which the run must be completed, from the `deadline` setting. None if the run has no deadline.
     start_time: datetime | None
         Start time of the run. None if not set yet.
     end_time: datetime | None
@@ -107,6 +174,9 @@ class AntaRunContext:
     devices_filtered_at_setup: list[str] = field(default_factory=list)
     devices_unreachable_at_setup: list[str] = field(default_factory=list)
     warnings_at_setup: list[str] = field(default_factory=list)
+    scheduler: AntaScheduler | None = None
+    statistics: AntaRunStatistics = field(default_factory=AntaRunStatistics)
+    deadline: float | None = None
     start_time: datetime | None = None
     end_time: datetime | None = None
 
@@ -135,6 +205,16 @@ class AntaRunContext:
         """Total tests scheduled to run across all selected devices."""
         return sum(len(tests) for tests in self.selected_tests.values())
 
+    @property
+    def total_commands_prefetched(self) -> int:
+        """Total unique commands collected during the prefetch stage across all selected devices."""
+        return sum(self.statistics.prefetch.prefetched_commands.values())
+
+    @property
+    def total_commands_deduplicated(self) -> int:
+        """Total duplicate commands served from a shared output during the prefetch stage across all selected devices."""
+        return sum(self.statistics.prefetch.deduplicated_commands.values())
+
     @property
     def duration(self) -> timedelta | None:
         """Calculate the duration of the run. Returns None if start or end time is not set."""
@@ -143,6 +223,31 @@ class AntaRunContext:
         return None
 
 
+@dataclass
+class ShardReport:
+    """Report sent by a worker process to the parent process at the end of a sharded run.
+
+    Attributes
+    ----------
+    index: int
+        Index of the inventory shard run by the worker process.
+    devices_unreachable_at_setup: list[str]
+        List of device names of the shard that were found unreachable during the inventory setup phase.
+    warnings_at_setup: list[str]
+        List of warnings caught during the setup phase of the shard.
+    statistics: AntaRunStatistics
+        Statistics recorded during the run of the shard.
+    error: str | None
+        Error message if the shard failed to run. None otherwise.
+    """
+
+    index: int
+    devices_unreachable_at_setup: list[str] = field(default_factory=list)
+    warnings_at_setup: list[str] = field(default_factory=list)
+    statistics: AntaRunStatistics = field(default_factory=AntaRunStatistics)
+    error: str | None = None
+
+
 # pylint: disable=too-few-public-methods
 class AntaRunner:
     """Run and manage ANTA test execution.
@@ -195,8 +300,35 @@ class AntaRunner:
     def __init__(self, settings: AntaRunnerSettings | None = None) -> None:
         """Initialize AntaRunner."""
         self._settings = settings if settings is not None else AntaRunnerSettings()
+        self._plan_cache = RunPlanCache(self._settings.plan_cache) if self._settings.plan_cache is not None else None
+        self._duration_history = DurationHistory(self._settings.duration_history) if self._settings.duration_history is not None else None
         logger.debug("AntaRunner initialized with settings: %s", self._settings.model_dump())
 
+    @property
+    def _prefetch_enabled(self) -> bool:
+        """Return True if the commands of the tests are prefetched before running the tests."""
+        return self._settings.prefetch or self._settings.batch_size is not None
+
+    @property
+    def _adaptive_concurrency(self) -> bool:
+        """Return True if the request limiters of the devices are set up by this process. Worker processes of a sharded run set up their own."""
+        return self._settings.adaptive_concurrency and self._settings.workers == 1
+
+    @property
+    def _retries_enabled(self) -> bool:
+        """Return True if the retry policies of the devices are set up by this process. Worker processes of a sharded run set up their own."""
+        return self._settings.retry_attempts > 1 and self._settings.workers == 1
+
+    @property
+    def _circuit_breakers_enabled(self) -> bool:
+        """Return True if the circuit breakers of the devices are set up by this process. Worker processes of a sharded run set up their own."""
+        return self._settings.circuit_breaker_threshold is not None and self._settings.workers == 1
+
+    @property
+    def _pipelined(self) -> bool:
+        """Return True if the devices are connected while running the tests. Pipelined mode is not supported in worker pool mode."""
+        return self._settings.pipeline and not self._settings.worker_pool
+
     async def run(
         self,
         inventory: AntaInventory,
@@ -205,6 +337,7 @@ class AntaRunner:
         filters: AntaRunFilters | None = None,
         *,
         dry_run: bool = False,
+        result_callbacks: list[ResultCallback] | None = None,
     ) -> AntaRunContext:
         """Run ANTA.
 
@@ -230,12 +363,185 @@ class AntaRunner:
             Filters for the ANTA run. If `None`, run all tests on all devices.
         dry_run
             Dry-run mode flag. If `True`, run all setup steps but do not execute tests.
+        result_callbacks
+            Callables called with each `TestResult` as soon as the test completes, e.g. to ship results to an external sink.
 
         Returns
         -------
         AntaRunContext
             The complete context and results of this ANTA run.
         """
+        ctx = self._create_context(inventory, catalog, result_manager, filters, dry_run=dry_run)
+
+        if await self._prepare_run(ctx):
+            await self._execute_run(ctx, result_callbacks)
+
+        ctx.end_time = datetime.now(tz=timezone.utc)
+        return ctx
+
+    async def stream(
+        self,
+        inventory: AntaInventory,
+        catalog: AntaCatalog,
+        result_manager: ResultManager | None = None,
+        filters: AntaRunFilters | None = None,
+        *,
+        result_callbacks: list[ResultCallback] | None = None,
+    ) -> AsyncGenerator[TestResult, None]:
+        """Run ANTA and yield each test result as soon as the test completes.
+
+        The run workflow is the same as `run()`, except that results are yielded in completion order
+        instead of being returned at the end of the run. Results are still added to the provided
+        `result_manager` as they are yielded.
+
+        Parameters
+        ----------
+        inventory
+            Inventory of network devices to test.
+        catalog
+            Catalog of tests to run.
+        result_manager
+            Manager for collecting and storing test results. If `None`, a new manager is used for this run.
+        filters
+            Filters for the ANTA run. If `None`, run all tests on all devices.
+        result_callbacks
+            Callables called with each `TestResult` as soon as the test completes, e.g. to ship results to an external sink.
+
+        Yields
+        ------
+        TestResult
+            The result of each test in completion order.
+
+        Examples
+        --------
+        ```python
+        async for result in AntaRunner().stream(inventory, catalog):
+            print(result)
+        ```
+        """
+        ctx = self._create_context(inventory, catalog, result_manager, filters)
+
+        if await self._prepare_run(ctx):
+            with Catchtime(logger=logger, message="Running Tests"):
+                results = self._run_tests(ctx, result_callbacks, ordered=False)
+                try:
+                    async for res in results:
+                        ctx.manager.add(res)
+                        yield res
+                finally:
+                    # Cancel the remaining tests if the consumer stops iterating
+                    await results.aclose()
+                    self._log_concurrency_limits(ctx)
+                    self._log_retry_statistics(ctx)
+                    self._log_circuit_breaker_statistics(ctx)
+
+            self._log_cache_statistics(ctx)
+            self._log_memory_usage(ctx)
+            self._save_duration_history(ctx)
+
+        ctx.end_time = datetime.now(tz=timezone.utc)
+
+    async def watch(
+        self,
+        inventory: AntaInventory,
+        catalog: AntaCatalog,
+        interval: float,
+        filters: AntaRunFilters | None = None,
+        *,
+        iterations: int | None = None,
+        result_callbacks: list[ResultCallback] | None = None,
+    ) -> AsyncIterator[AntaRunContext]:
+        """Run ANTA every `interval` seconds and yield the context of each run.
+
+        The inventory and the tests are set up once, by the first run: the devices are connected and refreshed, and the tests
+        are selected. The next runs only run the selected tests, keeping the sessions of the devices open between the runs, and
+        the devices unreachable during the first run are not tested again. If the setup fails, e.g. no device is reachable, it
+        is attempted again by the next run. Worker processes of a sharded run connect to their devices on each run.
+
+        The device caches are cleared before each run to collect fresh command outputs. When the persistent cache is enabled,
+        the outputs stored in the database are not deleted but replaced by the fresh outputs. If a run lasts longer than
+        `interval`, the next run starts as soon as the previous one is done.
+
+        Parameters
+        ----------
+        inventory
+            Inventory of network devices to test.
+        catalog
+            Catalog of tests to run.
+        interval
+            Time in seconds between the start of two runs.
+        filters
+            Filters for the ANTA runs. If `None`, run all tests on all devices.
+        iterations
+            Number of runs. If `None`, run until the consumer stops iterating.
+        result_callbacks
+            Callables called with each `TestResult` as soon as the test completes, e.g. to ship results to an external sink.
+
+        Yields
+        ------
+        AntaRunContext
+            The complete context and results of each run, with a new `ResultManager` per run.
+        """
+        loop = get_running_loop()
+        # Context of the first run that set up the inventory and the tests
+        setup_ctx: AntaRunContext | None = None
+        iteration = 0
+        while iterations is None or iteration < iterations:
+            start = loop.time()
+            for device in inventory.devices:
+                device.coalesced_commands = 0
+                if device.cache is not None:
+                    device.cache.clear()
+            ctx = self._create_context(inventory, catalog, None, filters)
+            if setup_ctx is None:
+                if await self._prepare_run(ctx):
+                    await self._execute_run(ctx, result_callbacks)
+                    setup_ctx = ctx
+            else:
+                self._restore_setup(ctx, setup_ctx)
+                self._log_run_information(ctx)
+                await self._execute_run(ctx, result_callbacks)
+            ctx.end_time = datetime.now(tz=timezone.utc)
+            yield ctx
+            iteration += 1
+            if iterations is not None and iteration >= iterations:
+                break
+            if (elapsed := loop.time() - start) > interval:
+                logger.warning("ANTA run %d lasted %.1f seconds, longer than the watch interval of %.1f seconds", iteration, elapsed, interval)
+            await asyncio.sleep(max(0.0, interval - elapsed))
+
+    async def _execute_run(self, ctx: AntaRunContext, result_callbacks: list[ResultCallback] | None) -> None:
+        """Run the tests of a prepared ANTA run, add the results to the result manager and record the statistics of the run."""
+        with Catchtime(logger=logger, message="Running Tests"):
+            async for res in self._run_tests(ctx, result_callbacks, ordered=True):
+                ctx.manager.add(res)
+
+        self._log_cache_statistics(ctx)
+        self._log_memory_usage(ctx)
+        self._log_concurrency_limits(ctx)
+        self._log_retry_statistics(ctx)
+        self._log_circuit_breaker_statistics(ctx)
+        self._save_duration_history(ctx)
+
+    @staticmethod
+    def _restore_setup(ctx: AntaRunContext, setup_ctx: AntaRunContext) -> None:
+        """Restore the inventory and the tests selected by a previous run of the same inventory and catalog, without connecting to the devices."""
+        ctx.selected_inventory = setup_ctx.selected_inventory
+        ctx.selected_tests = defaultdict(set, setup_ctx.selected_tests)
+        ctx.devices_filtered_at_setup = list(setup_ctx.devices_filtered_at_setup)
+        ctx.devices_unreachable_at_setup = list(setup_ctx.devices_unreachable_at_setup)
+        ctx.statistics.sweep = setup_ctx.statistics.sweep
+
+    def _create_context(
+        self,
+        inventory: AntaInventory,
+        catalog: AntaCatalog,
+        result_manager: ResultManager | None,
+        filters: AntaRunFilters | None,
+        *,
+        dry_run: bool = False,
+    ) -> AntaRunContext:
+        """Create the context object for the ANTA run."""
         start_time = datetime.now(tz=timezone.utc)
         logger.info("ANTA run starting ...")
 
@@ -245,6 +551,7 @@ class AntaRunner:
             manager=result_manager if result_manager is not None else ResultManager(),
             filters=filters if filters is not None else AntaRunFilters(),
             dry_run=dry_run,
+            deadline=get_running_loop().time() + self._settings.deadline if self._settings.deadline is not None else None,
             start_time=start_time,
         )
 
@@ -255,55 +562,508 @@ class AntaRunner:
             )
             self._log_warning_msg(msg=msg, ctx=ctx)
 
+        return ctx
+
+    async def _prepare_run(self, ctx: AntaRunContext) -> bool:
+        """Set up the inventory and the tests of the ANTA run.
+
+        Returns False if there is no test to run, either because the setup failed or because of the dry-run mode.
+        """
         if not ctx.catalog.tests:
             self._log_warning_msg(msg="The list of tests is empty. Exiting ...", ctx=ctx)
-            ctx.end_time = datetime.now(tz=timezone.utc)
-            return ctx
+            return False
 
         with Catchtime(logger=logger, message="Preparing ANTA NRFU Run"):
             # Set up inventory
             setup_inventory_ok = await self._setup_inventory(ctx)
             if not setup_inventory_ok:
-                ctx.end_time = datetime.now(tz=timezone.utc)
-                return ctx
+                return False
 
             # Set up tests
             with Catchtime(logger=logger, message="Preparing Tests"):
                 setup_tests_ok = self._setup_tests(ctx)
                 if not setup_tests_ok:
-                    ctx.end_time = datetime.now(tz=timezone.utc)
-                    return ctx
-
-            # Get test coroutines
-            test_coroutines = self._get_test_coroutines(ctx)
+                    return False
 
         self._log_run_information(ctx)
 
         if ctx.dry_run:
             logger.info("Dry-run mode, exiting before running the tests.")
+            test_coroutines = self._get_test_coroutines(ctx)
+            self._estimate_cost(ctx, test_coroutines)
             self._close_test_coroutines(test_coroutines, ctx)
-            ctx.end_time = datetime.now(tz=timezone.utc)
-            return ctx
+            return False
+
+        return True
 
+    async def _start_run(self, ctx: AntaRunContext, test_coroutines: list[Coroutine[Any, Any, TestResult]]) -> None:
+        """Start the execution phase of the ANTA run: set up the progress bar and prefetch the commands if configured."""
         if AntaTest.progress is not None:
             AntaTest.nrfu_task = AntaTest.progress.add_task("Running NRFU Tests ...", total=ctx.total_tests_scheduled)
 
-        with Catchtime(logger=logger, message="Running Tests"):
-            sem = Semaphore(self._settings.max_concurrency)
+        if self._adaptive_concurrency:
+            self._setup_request_limiters(ctx)
 
-            async def run_with_sem(test_coro: Coroutine[Any, Any, TestResult]) -> TestResult:
-                """Wrap the test coroutine with semaphore control."""
-                async with sem:
-                    return await test_coro
+        if self._retries_enabled:
+            self._setup_retry_policies(ctx)
 
-            results = await gather(*[run_with_sem(coro) for coro in test_coroutines])
-            for res in results:
-                ctx.manager.add(res)
+        if self._circuit_breakers_enabled:
+            self._setup_circuit_breakers(ctx)
 
-        self._log_cache_statistics(ctx)
+        if not test_coroutines:
+            # Tests are instantiated lazily or by worker processes
+            return
 
-        ctx.end_time = datetime.now(tz=timezone.utc)
-        return ctx
+        if self._prefetch_enabled:
+            with Catchtime(logger=logger, message="Prefetching commands"):
+                await self._prefetch_commands(ctx, test_coroutines)
+
+    async def _run_tests(self, ctx: AntaRunContext, result_callbacks: list[ResultCallback] | None, *, ordered: bool) -> AsyncGenerator[TestResult, None]:
+        """Run the tests of the ANTA run and yield the test results.
+
+        In sharded mode, the tests are run by worker processes, see `_run_sharded()`. In worker pool mode, the results are
+        always yielded in completion order. In pipelined mode, the devices are connected while running the tests, see
+        `_run_pipelined()`. Otherwise, all the tests are instantiated upfront and the results are yielded in completion order,
+        or in schedule order once all the tests are completed if `ordered` is True.
+        """
+        results: AsyncGenerator[TestResult, None] | None = None
+        if self._settings.workers > 1:
+            results = self._run_sharded(ctx, result_callbacks, ordered=ordered)
+        elif self._settings.worker_pool:
+            results = self._run_worker_pool(ctx, result_callbacks)
+        elif self._pipelined:
+            results = self._run_pipelined(ctx, result_callbacks, ordered=ordered)
+
+        if results is not None:
+            try:
+                async for res in results:
+                    yield res
+            finally:
+                await results.aclose()
+            return
+
+        test_coroutines = self._get_test_coroutines(ctx)
+        ctx.statistics.worker_pool.peak_tests_in_memory = len(test_coroutines)
+        await self._start_run(ctx, test_coroutines)
+        wrapped_coroutines = self._wrap_test_coroutines(ctx, test_coroutines, result_callbacks)
+
+        if ordered:
+            for res in await gather(*wrapped_coroutines):
+                yield res
+            return
+
+        tasks = [ensure_future(coro) for coro in wrapped_coroutines]
+        try:
+            for task in as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _run_worker_pool(self, ctx: AntaRunContext, result_callbacks: list[ResultCallback] | None) -> AsyncGenerator[TestResult, None]:
+        """Run the tests with a pool of workers and yield each test result as soon as the test completes.
+
+        The `AntaTest` instances are created lazily, interleaving the devices, when a worker is available. The number of
+        workers is the `max_concurrency` setting, bounding the number of `AntaTest` instances alive at the same time
+        instead of creating all of them upfront.
+        """
+        await self._start_run(ctx, [])
+        ctx.scheduler = AntaScheduler(self._settings.max_concurrency, self._settings.device_max_concurrency)
+        scheduler = ctx.scheduler
+        callbacks = result_callbacks if result_callbacks is not None else []
+        # The generator is shared by all the workers, a test is instantiated when a worker gets the next coroutine
+        test_coroutines = self._iter_test_coroutines(ctx, interleaved=True)
+        results: Queue[TestResult | None] = Queue()
+        worker_pool = ctx.statistics.worker_pool
+        in_memory = 0
+
+        async def worker() -> None:
+            """Run the next test coroutine until there is no test left. Put None in the results queue once done."""
+            nonlocal in_memory
+            try:
+                for coro in test_coroutines:
+                    in_memory += 1
+                    worker_pool.peak_tests_in_memory = max(worker_pool.peak_tests_in_memory, in_memory)
+                    res = await self._run_test_coroutine(scheduler, coro, callbacks, ctx.deadline)
+                    in_memory -= 1
+                    results.put_nowait(res)
+            finally:
+                results.put_nowait(None)
+
+        workers = [ensure_future(worker()) for _ in range(min(self._settings.max_concurrency, ctx.total_tests_scheduled))]
+        try:
+            running_workers = len(workers)
+            while running_workers > 0:
+                res = await results.get()
+                if res is None:
+                    running_workers -= 1
+                    continue
+                yield res
+            # Raise unexpected errors of the workers if any
+            await gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+
+    async def _run_pipelined(self, ctx: AntaRunContext, result_callbacks: list[ResultCallback] | None, *, ordered: bool) -> AsyncGenerator[TestResult, None]:
+        """Connect to each device and run its tests as soon as its own connection attempt completes.
+
+        Unreachable devices waiting on connection timeouts do not delay the tests of the other devices. If `established_only`
+        is set, the unreachable devices are removed from the selection and recorded in `devices_unreachable_at_setup` once
+        all the connection attempts are completed.
+
+        The results are yielded in completion order, or device by device in schedule order once all the tests are completed
+        if `ordered` is True.
+        """
+        await self._start_run(ctx, [])
+        ctx.scheduler = AntaScheduler(self._settings.max_concurrency, self._settings.device_max_concurrency)
+        scheduler = ctx.scheduler
+        callbacks = result_callbacks if result_callbacks is not None else []
+        results: Queue[TestResult | None] = Queue()
+        if not ordered:
+            # Stream the results as soon as the tests complete
+            callbacks = [*callbacks, results.put_nowait]
+        results_per_device: dict[AntaDevice, list[TestResult]] = {}
+        devices = list(ctx.selected_tests)
+        worker_pool = ctx.statistics.worker_pool
+        in_memory = 0
+
+        async def run_device_tests(device: AntaDevice) -> None:
+            """Connect to the device and run its tests. Put None in the results queue once done."""
+            nonlocal in_memory
+            try:
+                if not await self._connect_device(ctx, device):
+                    return
+                test_coroutines = list(self._iter_test_coroutines(ctx, device=device))
+                in_memory += len(test_coroutines)
+                worker_pool.peak_tests_in_memory = max(worker_pool.peak_tests_in_memory, in_memory)
+                if self._prefetch_enabled:
+                    await self._prefetch_commands(ctx, test_coroutines)
+                results_per_device[device] = await gather(*(self._run_test_coroutine(scheduler, coro, callbacks, ctx.deadline) for coro in test_coroutines))
+                in_memory -= len(test_coroutines)
+            finally:
+                results.put_nowait(None)
+
+        tasks = [ensure_future(run_device_tests(device)) for device in devices]
+        try:
+            running_devices = len(tasks)
+            while running_devices > 0:
+                res = await results.get()
+                if res is None:
+                    running_devices -= 1
+                    continue
+                yield res
+            # Raise unexpected errors of the device tasks if any
+            await gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        self._update_context_from_connections(ctx)
+
+        if ordered:
+            for res in chain.from_iterable(results_per_device.get(device, []) for device in devices):
+                yield res
+
+    def _update_context_from_connections(self, ctx: AntaRunContext) -> None:
+        """Update the run context once all the connection attempts of a pipelined run are completed."""
+        self._remove_unreachable_devices(ctx)
+        if ctx.total_devices_unreachable > 0:
+            device_list_str = ", ".join(ctx.devices_unreachable_at_setup)
+            logger.info("%d devices found unreachable after connection attempts: %s", ctx.total_devices_unreachable, device_list_str)
+        if not ctx.selected_inventory:
+            self._log_warning_msg(msg="No reachable devices found for testing after connectivity checks. Exiting ...", ctx=ctx)
+
+    async def _connect_device(self, ctx: AntaRunContext, device: AntaDevice) -> bool:
+        """Connect to a device of a pipelined run. A device already connected by a previous run of `watch()` is not refreshed again.
+
+        Returns False if the device is unreachable and its tests must not be run. A device still connecting at the deadline
+        of the run is not unreachable: its tests are run and marked as error.
+        """
+        if device.established:
+            return True
+        try:
+            await asyncio.wait_for(device.refresh(), self._get_remaining_time(ctx.deadline))
+        except asyncio.TimeoutError:
+            logger.warning("Connection to %s interrupted by the run deadline, its tests are marked as error", device.name)
+            return True
+        except Exception as exc:  # noqa: BLE001
+            # An AntaDevice instance is potentially user-defined code.
+            anta_log_exception(exc, f"Error when refreshing device {device.name}", logger)
+        if device.established or not ctx.filters.established_only:
+            return True
+
+        ctx.devices_unreachable_at_setup.append(device.name)
+        # Do not count the tests of the device anymore
+        del ctx.selected_tests[device]
+        if AntaTest.progress is not None and AntaTest.nrfu_task is not None:
+            AntaTest.progress.update(AntaTest.nrfu_task, total=ctx.total_tests_scheduled)
+        return False
+
+    async def _run_sharded(self, ctx: AntaRunContext, result_callbacks: list[ResultCallback] | None, *, ordered: bool) -> AsyncGenerator[TestResult, None]:
+        """Shard the selected inventory across worker processes and yield the test results streamed back by the workers.
+
+        Each worker process runs ANTA on its inventory shard with its own event loop and device sessions. The test results
+        and the log records of the workers are sent back to this process. The result callbacks are called in this process.
+
+        If `ordered` is True, the results are yielded once all the workers are done, combining the results of each shard
+        with `ResultManager.merge_results()`. Otherwise, the results are yielded as soon as they are received.
+        """
+        await self._start_run(ctx, [])
+        shards = self._get_shards(ctx)
+        callbacks = result_callbacks if result_callbacks is not None else []
+        processes, queue = self._create_shard_processes(ctx, shards)
+        shard_managers = [ResultManager() for _ in shards]
+        reports: dict[int, ShardReport] = {}
+        loop = get_running_loop()
+
+        try:
+            for process in processes:
+                process.start()
+            while len(reports) < len(processes):
+                messages = await loop.run_in_executor(None, _get_shard_messages, queue)
+                if not messages:
+                    self._check_shard_processes(processes, reports)
+                    continue
+                for message in messages:
+                    res = self._handle_shard_message(message, reports, shard_managers)
+                    if res is None:
+                        continue
+                    self._call_result_callbacks(res, callbacks)
+                    if not ordered:
+                        yield res
+        finally:
+            self._stop_shard_processes(processes)
+
+        self._update_context_from_reports(ctx, [reports[index] for index in range(len(shards))], shards)
+
+        if ordered:
+            for res in ResultManager.merge_results(shard_managers).results:
+                yield res
+
+    def _create_shard_processes(self, ctx: AntaRunContext, shards: list[AntaInventory]) -> tuple[list[BaseProcess], ProcessQueue[Any]]:
+        """Create the worker processes of a sharded run and the queue used by the workers to send messages to this process."""
+        # The spawn start method is used on all platforms as forking a process with a running event loop is unsafe
+        mp_context = multiprocessing.get_context("spawn")
+        queue: ProcessQueue[Any] = mp_context.Queue()
+        # The duration history is only read and written by this process, the shards are balanced with the estimated durations
+        shard_settings = self._settings.model_dump() | {"workers": 1, "duration_history": None}
+        if ctx.deadline is not None:
+            # The worker processes run until the deadline of this run
+            shard_settings["deadline"] = max(ctx.deadline - get_running_loop().time(), sys.float_info.min)
+        log_level = logging.getLogger().getEffectiveLevel()
+        processes: list[BaseProcess] = [
+            mp_context.Process(
+                target=_run_shard,
+                args=(index, shard, ctx.catalog, ctx.filters, shard_settings, queue, log_level),
+                name=f"anta-shard-{index}",
+                daemon=True,
+            )
+            for index, shard in enumerate(shards)
+        ]
+        return processes, queue
+
+    @staticmethod
+    def _handle_shard_message(message: Any, reports: dict[int, ShardReport], shard_managers: list[ResultManager]) -> TestResult | None:  # noqa: ANN401
+        """Handle a message sent by a worker process of a sharded run. Returns the test result if the message is a test result."""
+        if isinstance(message, logging.LogRecord):
+            record_logger = logging.getLogger(message.name)
+            if record_logger.isEnabledFor(message.levelno):
+                record_logger.handle(message)
+            return None
+        if isinstance(message, ShardReport):
+            reports[message.index] = message
+            return None
+        index, res = message
+        shard_managers[index].add(res)
+        AntaTest.update_progress()
+        return res
+
+    @staticmethod
+    def _stop_shard_processes(processes: list[BaseProcess]) -> None:
+        """Terminate the worker processes of a sharded run that are still running, e.g. if the consumer stops iterating."""
+        for process in processes:
+            if process.pid is None:
+                # The process has not been started
+                continue
+            if process.is_alive():
+                process.terminate()
+            process.join()
+
+    @staticmethod
+    def _check_shard_processes(processes: list[BaseProcess], reports: dict[int, ShardReport]) -> None:
+        """Create an error report for the worker processes that exited without sending a report, e.g. killed by the system."""
+        for index, process in enumerate(processes):
+            if index not in reports and process.exitcode is not None:
+                reports[index] = ShardReport(index=index, error=f"Worker process exited unexpectedly with exit code {process.exitcode}")
+
+    def _get_shards(self, ctx: AntaRunContext) -> list[AntaInventory]:
+        """Split the selected inventory in `workers` shards, balancing the number of scheduled tests per shard.
+
+        If the duration history is enabled, the shards are balanced with the estimated duration of the tests instead.
+        """
+        shard_count = min(self._settings.workers, len(ctx.selected_inventory))
+        shards = [AntaInventory() for _ in range(shard_count)]
+        cost_per_shard: list[float] = [0] * shard_count
+        if self._duration_history is None:
+            costs = {device: float(len(ctx.selected_tests.get(device, ()))) for device in ctx.selected_inventory.devices}
+        else:
+            costs = {device: self._estimate_device_duration(ctx, device) for device in ctx.selected_inventory.devices}
+        # Assign the most expensive devices first to the least loaded shard
+        for device in sorted(ctx.selected_inventory.devices, key=costs.__getitem__, reverse=True):
+            index = cost_per_shard.index(min(cost_per_shard))
+            shards[index].add_device(device)
+            cost_per_shard[index] += costs[device]
+        unit = "tests" if self._duration_history is None else "seconds"
+        logger.debug("Running the tests in %d worker processes with %s %s per process", shard_count, cost_per_shard, unit)
+        return shards
+
+    def _update_context_from_reports(self, ctx: AntaRunContext, reports: list[ShardReport], shards: list[AntaInventory]) -> None:
+        """Update the run context with the reports of the worker processes of a sharded run."""
+        for report in reports:
+            if report.error is not None:
+                device_list_str = ", ".join(sorted(shards[report.index].keys()))
+                logger.error("Inventory shard %d failed to run, test results may be missing for devices %s: %s", report.index, device_list_str, report.error)
+            ctx.devices_unreachable_at_setup.extend(report.devices_unreachable_at_setup)
+            ctx.warnings_at_setup.extend(warning for warning in report.warnings_at_setup if warning not in ctx.warnings_at_setup)
+            ctx.statistics.merge(report.statistics)
+
+        # Devices are connected by the worker processes, remove the unreachable devices from the selection
+        self._remove_unreachable_devices(ctx)
+
+    @staticmethod
+    def _remove_unreachable_devices(ctx: AntaRunContext) -> None:
+        """Remove the devices of `devices_unreachable_at_setup` from the selection when the devices are connected while running the tests."""
+        if ctx.devices_unreachable_at_setup:
+            ctx.devices_unreachable_at_setup.sort()
+            unreachable_devices = set(ctx.devices_unreachable_at_setup)
+            for device in [device for device in ctx.selected_tests if device.name in unreachable_devices]:
+                del ctx.selected_tests[device]
+            ctx.selected_inventory = ctx.selected_inventory.get_inventory(devices=set(ctx.selected_inventory.keys()) - unreachable_devices)
+
+    def _setup_request_limiters(self, ctx: AntaRunContext) -> None:
+        """Set up the adaptive limits of concurrent requests of the selected devices.
+
+        Each device starts with `ADAPTIVE_INITIAL_LIMIT` concurrent requests, up to `MAX_CONCURRENT_REQUESTS`. The requests
+        across all the devices are also limited by a global limiter, up to the `max_concurrency` setting.
+        """
+        devices = ctx.selected_inventory.devices
+        global_limiter = AdaptiveLimiter(
+            GLOBAL_LIMITER_NAME,
+            initial_limit=ADAPTIVE_INITIAL_LIMIT * len(devices),
+            max_limit=self._settings.max_concurrency,
+            adjustments=ctx.statistics.concurrency.adjustments,
+        )
+        for device in devices:
+            device.request_limiter = AdaptiveLimiter(
+                device.name,
+                initial_limit=ADAPTIVE_INITIAL_LIMIT,
+                max_limit=MAX_CONCURRENT_REQUESTS,
+                parent=global_limiter,
+                adjustments=ctx.statistics.concurrency.adjustments,
+            )
+
+    def _setup_retry_policies(self, ctx: AntaRunContext) -> None:
+        """Set up the retry policies of the requests of the selected devices failing with a transient error."""
+        for device in ctx.selected_inventory.devices:
+            device.retry_policy = RetryPolicy(
+                device.name,
+                self._settings.retry_attempts,
+                backoff=self._settings.retry_backoff,
+                max_backoff=self._settings.retry_max_backoff,
+                retry_on=self._settings.retry_on,
+            )
+
+    def _setup_circuit_breakers(self, ctx: AntaRunContext) -> None:
+        """Set up the circuit breakers failing fast the requests of the selected devices after repeated transport errors."""
+        # Only called when the threshold is set, see `_circuit_breakers_enabled`
+        threshold = cast("int", self._settings.circuit_breaker_threshold)
+        for device in ctx.selected_inventory.devices:
+            device.circuit_breaker = CircuitBreaker(device.name, threshold, cooldown=self._settings.circuit_breaker_cooldown)
+
+    def _wrap_test_coroutines(
+        self, ctx: AntaRunContext, test_coroutines: list[Coroutine[Any, Any, TestResult]], result_callbacks: list[ResultCallback] | None
+    ) -> list[Coroutine[Any, Any, TestResult]]:
+        """Wrap the test coroutines with scheduler control and result callbacks.
+
+        The scheduler grants slots to the tests in a round-robin fashion across devices, within the `max_concurrency`
+        setting and the per-device limit, i.e. the `max_concurrency` attribute of the device or the `device_max_concurrency` setting.
+        """
+        ctx.scheduler = AntaScheduler(self._settings.max_concurrency, self._settings.device_max_concurrency)
+        callbacks = result_callbacks if result_callbacks is not None else []
+        return [self._run_test_coroutine(ctx.scheduler, coro, callbacks, ctx.deadline) for coro in test_coroutines]
+
+    async def _run_test_coroutine(
+        self, scheduler: AntaScheduler, test_coro: Coroutine[Any, Any, TestResult], result_callbacks: list[ResultCallback], deadline: float | None = None
+    ) -> TestResult:
+        """Run the test coroutine with scheduler control and call the result callbacks once completed.
+
+        The time spent waiting for a scheduler slot is recorded in the timing of the test result.
+
+        If `deadline` is set, i.e. the event loop time at which the run must be completed, the tests not started or still
+        running at the deadline are marked as error. The tests running longer than the `test_timeout` setting are marked as error too.
+        """
+        test = self._get_test_from_coroutine(test_coro)
+        start = perf_counter()
+        # Timeouts are only applied to AntaTest instances as their result is needed to report the error
+        remaining = self._get_remaining_time(deadline) if test is not None else None
+        try:
+            async with scheduler.slot(test.device if test is not None else None, timeout=remaining):
+                queue_wait = perf_counter() - start
+                res = await (self._await_test_coroutine(test, test_coro, deadline) if test is not None else test_coro)
+        except asyncio.CancelledError:
+            # Close the test coroutine in case it was cancelled while waiting for a slot, i.e. never awaited
+            test_coro.close()
+            raise
+        except asyncio.TimeoutError:
+            # The run deadline expired while waiting for a slot
+            test_coro.close()
+            res = self._set_timeout_error(cast("AntaTest", test), DEADLINE_NOT_STARTED_MESSAGE)
+        else:
+            if res.timing is not None:
+                res.timing.queue_wait = queue_wait
+        self._call_result_callbacks(res, result_callbacks)
+        return res
+
+    async def _await_test_coroutine(self, test: AntaTest, test_coro: Coroutine[Any, Any, TestResult], deadline: float | None) -> TestResult:
+        """Await the test coroutine within the `test_timeout` setting and the run deadline. The test is marked as error on timeout."""
+        remaining = self._get_remaining_time(deadline)
+        test_timeout = self._settings.test_timeout
+        if remaining is not None and (test_timeout is None or remaining < test_timeout):
+            timeout, message = remaining, DEADLINE_INTERRUPTED_MESSAGE
+        elif test_timeout is not None:
+            timeout, message = test_timeout, f"Test timed out after {test_timeout:g} seconds"
+        else:
+            return await test_coro
+        try:
+            return await asyncio.wait_for(test_coro, timeout)
+        except asyncio.TimeoutError:
+            return self._set_timeout_error(test, message)
+
+    @staticmethod
+    def _get_remaining_time(deadline: float | None) -> float | None:
+        """Return the time in seconds until the provided event loop time. None if there is no deadline."""
+        return deadline - get_running_loop().time() if deadline is not None else None
+
+    @staticmethod
+    def _set_timeout_error(test: AntaTest, message: str) -> TestResult:
+        """Mark a test that timed out as error and return its result."""
+        logger.debug("%s on %s: %s", test.name, test.device.name, message)
+        test.result.is_error(message=message)
+        # The progress of the test is not updated by the `anta_test` decorator when the test is cancelled or never started
+        AntaTest.update_progress()
+        return test.result
+
+    @staticmethod
+    def _call_result_callbacks(res: TestResult, result_callbacks: list[ResultCallback]) -> None:
+        """Call the result callbacks with the provided test result."""
+        for callback in result_callbacks:
+            try:
+                callback(res)
+            except Exception as exc:  # noqa: BLE001, PERF203
+                # A result callback is user-defined code.
+                # We need to catch everything to not interrupt the run.
+                anta_log_exception(exc, f"An error occurred in result callback {callback!r}", logger)
 
     async def _setup_inventory(self, ctx: AntaRunContext) -> bool:
         """Set up the inventory for the ANTA run.
@@ -317,9 +1077,12 @@ class AntaRunner:
             return False
 
         # Filter the inventory based on the provided filters if any
-        filtered_inventory = (
-            ctx.inventory.get_inventory(tags=ctx.filters.tags, devices=ctx.filters.devices) if ctx.filters.tags or ctx.filters.devices else ctx.inventory
-        )
+        devices = ctx.filters.devices
+        if ctx.filters.included_tests is not None:
+            # Only connect to the devices of the included tests
+            included_devices = {device_name for device_name, _, _ in ctx.filters.included_tests}
+            devices = included_devices if devices is None else devices & included_devices
+        filtered_inventory = ctx.inventory.get_inventory(tags=ctx.filters.tags, devices=devices) if ctx.filters.tags or devices is not None else ctx.inventory
         filtered_device_names = set(filtered_inventory.keys())
         ctx.devices_filtered_at_setup = sorted(initial_device_names - filtered_device_names)
 
@@ -334,16 +1097,22 @@ class AntaRunner:
             return False
 
         # In dry-run mode, set the selected inventory to the filtered inventory
-        if ctx.dry_run:
+        # In sharded mode, the devices are swept and connected by the worker processes
+        if ctx.dry_run or self._settings.workers > 1:
             ctx.selected_inventory = filtered_inventory
             return True
 
-        # Attempt to connect to devices that passed filters
-        with Catchtime(logger=logger, message="Connecting to devices"):
-            await filtered_inventory.connect_inventory()
+        if self._settings.sweep_timeout is not None:
+            filtered_inventory = await self._sweep_inventory(ctx, filtered_inventory, self._settings.sweep_timeout)
 
-        # Remove devices that are unreachable if required
-        ctx.selected_inventory = filtered_inventory.get_inventory(established_only=True) if ctx.filters.established_only else filtered_inventory
+        # In pipelined mode, the devices are connected while running the tests
+        if self._pipelined:
+            ctx.selected_inventory = filtered_inventory
+            return True
+
+        # Attempt to connect to devices that passed filters and remove devices that are unreachable if required
+        with Catchtime(logger=logger, message="Connecting to devices"):
+            ctx.selected_inventory = await self._connect_inventory(ctx, filtered_inventory)
         selected_device_names = set(ctx.selected_inventory.keys())
         ctx.devices_unreachable_at_setup = sorted(filtered_device_names - selected_device_names)
 
@@ -354,11 +1123,103 @@ class AntaRunner:
 
         return True
 
+    async def _connect_inventory(self, ctx: AntaRunContext, inventory: AntaInventory) -> AntaInventory:
+        """Connect to the devices of the inventory within the deadline of the run, if any, and return the inventory of the devices to test.
+
+        The connection of the devices still connecting at the deadline is cancelled. These devices are not unreachable: they
+        are kept in the returned inventory and their tests are marked as error when running the tests.
+        """
+        if ctx.deadline is None:
+            await inventory.connect_inventory()
+            return inventory.get_inventory(established_only=True) if ctx.filters.established_only else inventory
+
+        tasks = {device.name: ensure_future(device.refresh()) for device in inventory.devices}
+        remaining = cast("float", self._get_remaining_time(ctx.deadline))
+        _, pending = await asyncio.wait(tasks.values(), timeout=max(remaining, 0.0))
+        for task in pending:
+            task.cancel()
+        await gather(*pending, return_exceptions=True)
+
+        interrupted_devices: set[str] = set()
+        for name, task in tasks.items():
+            if task in pending:
+                interrupted_devices.add(name)
+            elif (exc := task.exception()) is not None:
+                # An AntaDevice instance is potentially user-defined code.
+                anta_log_exception(exc, f"Error when refreshing device {name}", logger)
+        if interrupted_devices:
+            logger.warning(
+                "Connection to %d devices interrupted by the run deadline, their tests are marked as error: %s",
+                len(interrupted_devices),
+                ", ".join(sorted(interrupted_devices)),
+            )
+        if not ctx.filters.established_only:
+            return inventory
+        return inventory.get_inventory(devices={device.name for device in inventory.devices if device.established} | interrupted_devices)
+
+    async def _sweep_inventory(self, ctx: AntaRunContext, inventory: AntaInventory, timeout: float) -> AntaInventory:
+        """Check the management port of the devices with a bounded concurrency and return the inventory of the devices accepting connections.
+
+        The other devices are recorded in `devices_unreachable_at_setup` and are not connected.
+        """
+        semaphore = asyncio.Semaphore(self._settings.sweep_concurrency)
+
+        async def check_port(device: AntaDevice) -> bool:
+            async with semaphore:
+                try:
+                    return await device.check_port(timeout)
+                except Exception as exc:  # noqa: BLE001
+                    # An AntaDevice instance is potentially user-defined code.
+                    anta_log_exception(exc, f"Error when checking the port of device {device.name}", logger)
+                    return False
+
+        devices = inventory.devices
+        start = perf_counter()
+        reachable = await gather(*(check_port(device) for device in devices))
+        elapsed = perf_counter() - start
+
+        live_devices = {device.name for device, is_reachable in zip(devices, reachable) if is_reachable}
+        ctx.devices_unreachable_at_setup = sorted(device.name for device in devices if device.name not in live_devices)
+        ctx.statistics.sweep = SweepStatistics(swept_devices=len(devices), live_devices=len(live_devices), duration=elapsed)
+        logger.info(
+            "Swept %d devices in %.2f seconds (%.0f devices/s): %d accepting connections",
+            len(devices),
+            elapsed,
+            len(devices) / elapsed if elapsed > 0 else 0,
+            len(live_devices),
+        )
+        return inventory.get_inventory(devices=live_devices)
+
     def _setup_tests(self, ctx: AntaRunContext) -> bool:
         """Set up tests for the ANTA run.
 
+        If the plan cache is enabled, the tests selected per device are restored from the cache when available.
+
         Returns True if the test setup was successful, otherwise False.
         """
+        if self._duration_history is not None:
+            self._duration_history.load()
+
+        if self._plan_cache is None:
+            self._select_tests(ctx)
+        elif not self._plan_cache.load_selected_tests(ctx, plan_key := self._plan_cache.get_selection_key(ctx)):
+            self._select_tests(ctx)
+            self._plan_cache.save_selected_tests(ctx, plan_key)
+
+        if ctx.total_tests_scheduled == 0:
+            msg_parts = ["No tests scheduled to run after filtering by tags/tests."]
+            if ctx.filters.tests:
+                msg_parts.append(f"Tests filter: {', '.join(sorted(ctx.filters.tests))}.")
+            if ctx.filters.tags:
+                msg_parts.append(f"Tags filter: {', '.join(sorted(ctx.filters.tags))}.")
+            msg_parts.append("Exiting ...")
+            self._log_warning_msg(msg=" ".join(msg_parts), ctx=ctx)
+            return False
+
+        return True
+
+    def _select_tests(self, ctx: AntaRunContext) -> None:
+        """Select the tests to run per device from the catalog indexes and the filters of the run."""
         # Build indexes for the catalog. If `ctx.filters.tests` is set, filter the indexes based on these tests
         ctx.catalog.build_indexes(filtered_tests=ctx.filters.tests)
 
@@ -378,47 +1239,199 @@ class AntaRunner:
                 # Then add the tests with matching tags from device tags
                 ctx.selected_tests[device].update(ctx.catalog.get_tests_by_tags(device.tags))
 
-        if ctx.total_tests_scheduled == 0:
-            msg_parts = ["No tests scheduled to run after filtering by tags/tests."]
-            if ctx.filters.tests:
-                msg_parts.append(f"Tests filter: {', '.join(sorted(ctx.filters.tests))}.")
-            if ctx.filters.tags:
-                msg_parts.append(f"Tags filter: {', '.join(sorted(ctx.filters.tags))}.")
-            msg_parts.append("Exiting ...")
-            self._log_warning_msg(msg=" ".join(msg_parts), ctx=ctx)
-            return False
+        if ctx.filters.included_tests is not None or ctx.filters.excluded_tests:
+            self._filter_tests(ctx)
 
-        return True
+    @staticmethod
+    def _filter_tests(ctx: AntaRunContext) -> None:
+        """Filter the selected tests with the `included_tests` and `excluded_tests` filters.
+
+        The tests are identified by (device name, test name, test definition fingerprint) tuples.
+        """
+        included_tests = ctx.filters.included_tests
+        excluded_tests = ctx.filters.excluded_tests or set()
+
+        def is_selected(device: AntaDevice, test_def: AntaTestDefinition) -> bool:
+            key = (device.name, test_def.test.name, test_def.fingerprint)
+            if included_tests is not None and key not in included_tests and (device.name, test_def.test.name, None) not in included_tests:
+                return False
+            return key not in excluded_tests
+
+        excluded_count = 0
+        for device, test_definitions in ctx.selected_tests.items():
+            remaining_tests = {test_def for test_def in test_definitions if is_selected(device, test_def)}
+            excluded_count += len(test_definitions) - len(remaining_tests)
+            ctx.selected_tests[device] = remaining_tests
+        logger.info("%d tests excluded from the run", excluded_count)
 
     def _get_test_coroutines(self, ctx: AntaRunContext) -> list[Coroutine[Any, Any, TestResult]]:
         """Get the test coroutines for the ANTA run."""
-        coros = []
-        for device, test_definitions in ctx.selected_tests.items():
-            for test_def in test_definitions:
-                try:
-                    coros.append(test_def.test(device=device, inputs=test_def.inputs).test())
-                except Exception as exc:  # noqa: BLE001, PERF203
-                    # An AntaTest instance is potentially user-defined code.
-                    # We need to catch everything and exit gracefully with an error message.
-                    msg = "\n".join(
-                        [
-                            f"There is an error when creating test {test_def.test.__module__}.{test_def.test.__name__}.",
-                            f"If this is not a custom test implementation: {GITHUB_SUGGESTION}",
-                        ],
-                    )
-                    anta_log_exception(exc, msg, logger)
-        return coros
-
-    def _close_test_coroutines(self, coros: list[Coroutine[Any, Any, TestResult]], ctx: AntaRunContext) -> None:
+        return list(self._iter_test_coroutines(ctx))
+
+    def _iter_test_coroutines(
+        self, ctx: AntaRunContext, *, interleaved: bool = False, device: AntaDevice | None = None
+    ) -> Iterator[Coroutine[Any, Any, TestResult]]:
+        """Yield the test coroutines for the ANTA run, creating the `AntaTest` instances lazily.
+
+        If `interleaved` is True, the test coroutines of the devices are yielded in a round-robin fashion
+        instead of device by device. If `device` is provided, only the test coroutines of this device are yielded.
+        """
+        tests: Iterable[tuple[AntaDevice, AntaTestDefinition]]
+        if device is not None:
+            tests = zip(repeat(device), self._get_device_tests(ctx, device))
+        elif interleaved:
+            tests_per_device = (zip(repeat(device), self._get_device_tests(ctx, device)) for device in self._get_devices(ctx))
+            tests = (test for round_tests in zip_longest(*tests_per_device) for test in round_tests if test is not None)
+        else:
+            tests = ((device, test_def) for device in self._get_devices(ctx) for test_def in self._get_device_tests(ctx, device))
+
+        for test_device, test_def in tests:
+            try:
+                test = test_def.test(device=test_device, inputs=test_def.inputs)
+                test.result.fingerprint = test_def.fingerprint
+                yield test.test()
+            except Exception as exc:  # noqa: BLE001, PERF203
+                # An AntaTest instance is potentially user-defined code.
+                # We need to catch everything and exit gracefully with an error message.
+                msg = "\n".join(
+                    [
+                        f"There is an error when creating test {test_def.test.__module__}.{test_def.test.__name__}.",
+                        f"If this is not a custom test implementation: {GITHUB_SUGGESTION}",
+                    ],
+                )
+                anta_log_exception(exc, msg, logger)
+
+    def _get_devices(self, ctx: AntaRunContext) -> list[AntaDevice]:
+        """Return the devices with selected tests. If the duration history is enabled, the devices with the longest estimated duration come first."""
+        if self._duration_history is None:
+            return list(ctx.selected_tests)
+        return sorted(ctx.selected_tests, key=lambda device: self._estimate_device_duration(ctx, device), reverse=True)
+
+    def _get_device_tests(self, ctx: AntaRunContext, device: AntaDevice) -> Iterable[AntaTestDefinition]:
+        """Return the selected tests of a device. If the duration history is enabled, the tests with the longest estimated duration come first."""
+        if self._duration_history is None:
+            return ctx.selected_tests[device]
+        return sorted(ctx.selected_tests[device], key=partial(self._duration_history.estimate, device.name), reverse=True)
+
+    def _estimate_device_duration(self, ctx: AntaRunContext, device: AntaDevice) -> float:
+        """Return the sum of the estimated durations of the selected tests of a device. Returns 0 if the duration history is disabled."""
+        if self._duration_history is None:
+            return 0.0
+        return sum(self._duration_history.estimate(device.name, test_def) for test_def in ctx.selected_tests.get(device, ()))
+
+    def _save_duration_history(self, ctx: AntaRunContext) -> None:
+        """Record the durations of the tests of the run in the duration history file if enabled."""
+        if self._duration_history is None or len(ctx.manager) == 0:
+            return
+        self._duration_history.update(ctx.manager.results)
+        self._duration_history.save()
+        logger.debug("Test duration history saved to %s", self._duration_history.path)
+
+    @staticmethod
+    def _get_test_from_coroutine(coro: Coroutine[Any, Any, TestResult]) -> AntaTest | None:
+        """Get the AntaTest instance of a test coroutine that has not been started yet. Returns None if not found."""
+        # Get the AntaTest instance from the coroutine locals, can be in `args` when decorated
+        coro_locals = getcoroutinelocals(coro)
+        test = coro_locals.get("self") or coro_locals.get("args")
+        if isinstance(test, AntaTest):
+            return test
+        if test and isinstance(test, tuple) and isinstance(test[0], AntaTest):
+            return test[0]
+        return None
+
+    async def _prefetch_commands(self, ctx: AntaRunContext, coros: list[Coroutine[Any, Any, TestResult]]) -> None:
+        """Prefetch the commands of the test coroutines per device.
+
+        Commands sharing the same UID across all the tests scheduled on a device are collected only once and the output
+        is shared with all the tests, regardless of the device cache. Commands with caching disabled are always collected.
+        If `batch_size` is configured, the commands are collected in multi-command requests.
+
+        Tests that are already in a final state or that have blocked commands are ignored. They are handled
+        when running the test coroutines. The collected outputs are populated in the `AntaCommand` instances
+        of each test so they are not collected again when running the test coroutines.
+        """
+        commands_per_device = self._get_prefetch_commands(coros)
+        statistics = ctx.statistics.prefetch
+        for device, groups in commands_per_device.items():
+            statistics.prefetched_commands[device.name] = len(groups)
+            statistics.deduplicated_commands[device.name] = sum(len(commands) - 1 for commands in groups.values())
+            logger.debug(
+                "Prefetching %d unique commands on %s (%d duplicates)",
+                statistics.prefetched_commands[device.name],
+                device.name,
+                statistics.deduplicated_commands[device.name],
+            )
+
+        batch_size = self._settings.batch_size or 1
+        collections = gather(
+            *(
+                device.collect_batch([commands[0] for commands in groups.values()], batch_size=batch_size, collection_id="prefetch")
+                for device, groups in commands_per_device.items()
+            ),
+            return_exceptions=True,
+        )
+        try:
+            results = await asyncio.wait_for(collections, self._get_remaining_time(ctx.deadline))
+        except asyncio.TimeoutError:
+            # The commands that have not been collected are collected by the tests, within the remaining time of the run
+            logger.warning("Prefetching commands interrupted by the run deadline")
+            return
+        for (device, groups), res in zip(commands_per_device.items(), results):
+            if isinstance(res, Exception):
+                # An AntaDevice instance is potentially user-defined code.
+                # Commands that have not been collected are collected again when running the tests.
+                anta_log_exception(res, f"An error occurred while prefetching commands on {device.name}", logger)
+                continue
+            # Share the output of the collected command with all the duplicates
+            for collected, *duplicates in groups.values():
+                for command in duplicates:
+                    command.output = collected.output
+                    command.errors = list(collected.errors)
+
+        logger.info(
+            "Prefetched %d unique commands across all selected devices, %d duplicate commands avoided",
+            ctx.total_commands_prefetched,
+            ctx.total_commands_deduplicated,
+        )
+
+    def _get_prefetch_commands(self, coros: list[Coroutine[Any, Any, TestResult]]) -> defaultdict[AntaDevice, dict[str, list[AntaCommand]]]:
+        """Return the mapping of device to the commands to prefetch of all the tests, grouped by deduplication key."""
+        commands_per_device: defaultdict[AntaDevice, dict[str, list[AntaCommand]]] = defaultdict(dict)
+        for coro in coros:
+            test = self._get_test_from_coroutine(coro)
+            if test is None or test.result.result != AntaTestStatus.UNSET or any(command.blocked for command in test.instance_commands):
+                continue
+            for command in test.instance_commands:
+                if command.collected:
+                    continue
+                key = command.uid if command.use_cache else f"{command.uid}-{id(command)}"
+                commands_per_device[test.device].setdefault(key, []).append(command)
+        return commands_per_device
+
+    def _estimate_cost(self, ctx: AntaRunContext, coros: list[Coroutine[Any, Any, TestResult]]) -> None:
+        """Estimate the cost of the ANTA run from the test coroutines. Used in dry-run."""
+        cost = RunCostEstimate(
+            batch_size=self._settings.batch_size,
+            batching=self._settings.batch_size is not None,
+            max_concurrency=self._settings.max_concurrency,
+            potential_connections=ctx.selected_inventory.max_potential_connections,
+            file_descriptor_limit=self._settings.file_descriptor_limit,
+        )
+        tests = [test for test in map(self._get_test_from_coroutine, coros) if test is not None]
+        cost.add_tests(tests, deduplicate=self._prefetch_enabled)
+        ctx.statistics.cost = cost
+        logger.info(
+            "%d eAPI requests estimated across all selected devices (%d without batching)",
+            cost.total_requests,
+            sum(device.requests for device in cost.devices),
+        )
+
+    def _close_test_coroutines(self, coros: Iterable[Coroutine[Any, Any, TestResult]], ctx: AntaRunContext) -> None:
         """Close the test coroutines. Used in dry-run."""
         for coro in coros:
-            # Get the AntaTest instance from the coroutine locals, can be in `args` when decorated
-            coro_locals = getcoroutinelocals(coro)
-            test = coro_locals.get("self") or coro_locals.get("args")
-            if isinstance(test, AntaTest):
+            test = self._get_test_from_coroutine(coro)
+            if test is not None:
                 ctx.manager.add(test.result)
-            elif test and isinstance(test, tuple) and isinstance(test[0], AntaTest):
-                ctx.manager.add(test[0].result)
             else:
                 logger.error("Coroutine %s does not have an AntaTest instance.", coro)
             coro.close()
@@ -440,6 +1453,11 @@ class AntaRunner:
 
         # Log debugs for runner settings
         logger.debug("Max concurrent tests configured: %d", self._settings.max_concurrency)
+        if self._settings.device_max_concurrency is not None:
+            logger.debug("Max concurrent tests per device configured: %d", self._settings.device_max_concurrency)
+        self._log_run_modes(ctx)
+        if http2_devices := sum(getattr(device, "http_version", None) == "HTTP/2" for device in ctx.selected_inventory.devices):
+            logger.debug("HTTP/2 negotiated with %d devices, their requests are multiplexed over a single connection", http2_devices)
         if (potential_connections := ctx.selected_inventory.max_potential_connections) is not None:
             logger.debug("Potential device connections estimated for this run: %d", potential_connections)
         logger.debug("System file descriptor limit configured: %d", self._settings.file_descriptor_limit)
@@ -458,20 +1476,154 @@ class AntaRunner:
             )
             self._log_warning_msg(msg=msg, ctx=ctx)
 
+    def _log_run_modes(self, ctx: AntaRunContext) -> None:
+        """Log the execution modes of the ANTA run and the warnings for unsupported combinations."""
+        if self._settings.workers > 1:
+            logger.debug("Sharded mode enabled, tests are run by up to %d worker processes", self._settings.workers)
+        if self._settings.worker_pool:
+            logger.debug("Worker pool mode enabled, tests are instantiated lazily by %d workers", self._settings.max_concurrency)
+        if self._pipelined:
+            logger.debug("Pipelined mode enabled, the tests of each device are scheduled as soon as the device is connected")
+        if self._settings.adaptive_concurrency:
+            logger.debug("Adaptive concurrency enabled, the concurrent requests limits are adjusted to the observed latency")
+        if self._settings.worker_pool and self._prefetch_enabled:
+            msg = "Commands prefetching is not supported in worker pool mode. Commands will be collected by each test."
+            self._log_warning_msg(msg=msg, ctx=ctx)
+        if self._settings.worker_pool and self._settings.pipeline:
+            msg = "Pipelined mode is not supported in worker pool mode. Devices are connected before running the tests."
+            self._log_warning_msg(msg=msg, ctx=ctx)
+
+    def _log_memory_usage(self, ctx: AntaRunContext) -> None:
+        """Record the memory high-water mark of the run in the context and log it.
+
+        In a sharded run, the peak memory of this process is added to the peak memory of the worker processes.
+        """
+        statistics = ctx.statistics.worker_pool
+        statistics.add_peak_memory(_get_peak_memory())
+        logger.debug("Peak AntaTest instances in memory: %d", statistics.peak_tests_in_memory)
+        if statistics.peak_memory is not None:
+            logger.debug("Peak memory usage of the ANTA processes: %.1f MiB", statistics.peak_memory / 2**20)
+
+    def _log_concurrency_limits(self, ctx: AntaRunContext) -> None:
+        """Record the final limits of the adaptive concurrency controller in the context, log them and detach the request limiters from the devices."""
+        if self._adaptive_concurrency:
+            for device in ctx.inventory.devices:
+                if (limiter := device.request_limiter) is None:
+                    continue
+                if device.name in ctx.selected_inventory:
+                    ctx.statistics.concurrency.limits[device.name] = limiter.limit
+                    if limiter.parent is not None:
+                        ctx.statistics.concurrency.limits[limiter.parent.name] = limiter.parent.limit
+                device.request_limiter = None
+
+        adjustments = Counter(adjustment.name for adjustment in ctx.statistics.concurrency.adjustments)
+        for name, limit in ctx.statistics.concurrency.limits.items():
+            logger.debug("Adaptive concurrent requests limit for '%s': %d (%d adjustments)", name, limit, adjustments[name])
+
+    def _log_retry_statistics(self, ctx: AntaRunContext) -> None:
+        """Record the retry statistics of the devices in the context, log them and detach the retry policies from the devices."""
+        if self._retries_enabled:
+            for device in ctx.inventory.devices:
+                if (policy := device.retry_policy) is None:
+                    continue
+                if device.name in ctx.selected_inventory:
+                    ctx.statistics.transport.retries[device.name] = policy.statistics
+                device.retry_policy = None
+
+        for name, statistics in ctx.statistics.transport.retries.items():
+            logger.debug(
+                "Retry statistics for '%s': %d retries / %d requests, %d requests failed after exhausting the retries",
+                name,
+                statistics["retries"],
+                statistics["requests"],
+                statistics["exhausted"],
+            )
+        if retries := sum(statistics["retries"] for statistics in ctx.statistics.transport.retries.values()):
+            logger.info("Retried %d eAPI requests after a transient failure across all selected devices", retries)
+
+    def _log_circuit_breaker_statistics(self, ctx: AntaRunContext) -> None:
+        """Record the circuit breaker statistics of the devices in the context, log them and detach the circuit breakers from the devices."""
+        if self._circuit_breakers_enabled:
+            for device in ctx.inventory.devices:
+                if (breaker := device.circuit_breaker) is None:
+                    continue
+                if device.name in ctx.selected_inventory:
+                    ctx.statistics.transport.circuit_breakers[device.name] = breaker.statistics
+                device.circuit_breaker = None
+
+        for name, statistics in ctx.statistics.transport.circuit_breakers.items():
+            if statistics["opened"]:
+                logger.warning(
+                    "Circuit breaker of '%s' opened %d times, %d eAPI requests failed without being sent", name, statistics["opened"], statistics["rejected"]
+                )
+
     def _log_cache_statistics(self, ctx: AntaRunContext) -> None:
         """Log cache statistics for each device in the inventory."""
+        if self._settings.workers > 1:
+            # The devices of a sharded run are used by the worker processes, which log their own cache statistics
+            return
         for device in ctx.selected_inventory.devices:
             if device.cache_statistics is not None:
                 msg = (
                     f"Cache statistics for '{device.name}': "
                     f"{device.cache_statistics['cache_hits']} hits / {device.cache_statistics['total_commands_sent']} "
-                    f"command(s) ({device.cache_statistics['cache_hit_ratio']})"
+                    f"command(s) ({device.cache_statistics['cache_hit_ratio']}), "
+                    f"{device.cache_statistics['cache_evictions']} evictions, {device.cache_statistics['cache_bytes']} bytes, "
+                    f"{device.cache_statistics['coalesced_commands']} coalesced command(s)"
                 )
                 logger.debug(msg)
             else:
-                logger.debug("Caching is not enabled on %s", device.name)
+                logger.debug("Caching is not enabled on %s, %d coalesced command(s)", device.name, device.coalesced_commands)
 
     def _log_warning_msg(self, msg: str, ctx: AntaRunContext) -> None:
         """Log the provided message at WARNING level and add it to the context warnings_at_setup list."""
         logger.warning(msg)
         ctx.warnings_at_setup.append(msg)
+
+
+def _run_shard(
+    index: int,
+    inventory: AntaInventory,
+    catalog: AntaCatalog,
+    filters: AntaRunFilters,
+    settings: dict[str, Any],
+    queue: ProcessQueue[Any],
+    log_level: int,
+) -> None:
+    """Run ANTA on an inventory shard. Target of the worker processes of a sharded run.
+
+    The test results, the log records and a final `ShardReport` are sent to the parent process using the provided queue.
+    """
+    # Forward the log records to the parent process
+    root = logging.getLogger()
+    root.handlers = [QueueHandler(queue)]
+    root.setLevel(log_level)
+
+    report = ShardReport(index=index)
+    try:
+        runner = AntaRunner(settings=AntaRunnerSettings(**settings))
+        ctx = asyncio.run(runner.run(inventory, catalog, filters=filters, result_callbacks=[lambda result: queue.put((index, result))]))
+        report.devices_unreachable_at_setup = ctx.devices_unreachable_at_setup
+        report.warnings_at_setup = ctx.warnings_at_setup
+        report.statistics = ctx.statistics
+    except Exception as exc:  # noqa: BLE001
+        # Catch everything to always send the report to the parent process
+        anta_log_exception(exc, f"An error occurred when running inventory shard {index}", logger)
+        report.error = exc_to_str(exc)
+    finally:
+        queue.put(report)
+
+
+def _get_shard_messages(queue: ProcessQueue[Any], max_messages: int = 1000) -> list[Any]:
+    """Get the pending messages sent by the worker processes of a sharded run. Executed in a thread.
+
+    Wait up to `SHARD_POLL_INTERVAL` seconds for the first message. Returns an empty list if there is no message.
+    """
+    try:
+        messages = [queue.get(timeout=SHARD_POLL_INTERVAL)]
+    except Empty:
+        return []
+    with suppress(Empty):
+        while len(messages) < max_messages:
+            messages.append(queue.get_nowait())
+    return messages
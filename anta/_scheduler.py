@@ -0,0 +1,350 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""ANTA scheduler classes."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from statistics import quantiles
+from time import monotonic
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from anta.device import AntaDevice
+
+logger = logging.getLogger(__name__)
+
+ADAPTIVE_INITIAL_LIMIT = 10
+"""Initial number of concurrent requests per device of an adaptive run."""
+
+ADAPTIVE_MIN_WINDOW = 10
+"""Minimum number of completed requests before an `AdaptiveLimiter` evaluates the latency."""
+
+GLOBAL_LIMITER_NAME = "global"
+"""Name of the `AdaptiveLimiter` limiting the concurrent requests across all the devices of an adaptive run."""
+
+
+@dataclass
+class DeviceQueue:
+    """Store the scheduling state of a device.
+
+    Attributes
+    ----------
+    max_concurrency : int | None
+        Maximum number of tests running concurrently on the device. None means no per-device limit.
+    in_flight : int
+        Number of tests currently running on the device.
+    waiters : deque[asyncio.Future[None]]
+        Futures of the tests waiting for a slot on the device, in arrival order.
+    """
+
+    max_concurrency: int | None = None
+    in_flight: int = 0
+    waiters: deque[asyncio.Future[None]] = field(default_factory=deque)
+
+    @property
+    def eligible(self) -> bool:
+        """Return True if a test is waiting and the device has a free slot."""
+        return bool(self.waiters) and (self.max_concurrency is None or self.in_flight < self.max_concurrency)
+
+
+class AntaScheduler:
+    """Schedule ANTA tests across devices.
+
+    Tests wait for a slot using the `slot()` asynchronous context manager. Slots are granted in a round-robin
+    fashion across devices, within the global `max_concurrency` limit and the per-device limit of each device.
+    This prevents a device with many tests from using all the slots while the tests of other devices are waiting.
+    Tests not bound to a device (device is None) are scheduled as a device of their own.
+
+    Attributes
+    ----------
+    max_concurrency : int
+        Maximum number of tests running concurrently across all devices.
+    device_max_concurrency : int | None
+        Default maximum number of tests running concurrently per device. Overridden by the `max_concurrency`
+        attribute of the device if set. None means no per-device limit.
+    """
+
+    def __init__(self, max_concurrency: int, device_max_concurrency: int | None = None) -> None:
+        """Initialize an AntaScheduler."""
+        self.max_concurrency = max_concurrency
+        self.device_max_concurrency = device_max_concurrency
+        self._queues: dict[AntaDevice | None, DeviceQueue] = {}
+        # Devices in round-robin order, the next device to be served is on the left
+        self._rotation: deque[AntaDevice | None] = deque()
+        self._in_flight = 0
+        self._dispatch_scheduled = False
+
+    @property
+    def in_flight(self) -> dict[str, int]:
+        """Number of tests currently running per device name."""
+        return {device.name: queue.in_flight for device, queue in self._queues.items() if device is not None}
+
+    @property
+    def queue_depth(self) -> dict[str, int]:
+        """Number of tests waiting for a slot per device name."""
+        return {device.name: len(queue.waiters) for device, queue in self._queues.items() if device is not None}
+
+    @asynccontextmanager
+    async def slot(self, device: AntaDevice | None, timeout: float | None = None) -> AsyncIterator[None]:
+        """Wait for a slot to run a test on the provided device and release it on exit.
+
+        Raises `asyncio.TimeoutError` if no slot is granted within `timeout` seconds. None means no timeout.
+        """
+        if timeout is None:
+            await self._acquire(device)
+        else:
+            await asyncio.wait_for(self._acquire(device), timeout)
+        try:
+            yield
+        finally:
+            self._release(device)
+
+    def _get_queue(self, device: AntaDevice | None) -> DeviceQueue:
+        """Return the queue of a device, creating it if needed."""
+        if (queue := self._queues.get(device)) is None:
+            max_concurrency = self.device_max_concurrency
+            if device is not None and device.max_concurrency is not None:
+                max_concurrency = device.max_concurrency
+            queue = self._queues[device] = DeviceQueue(max_concurrency=max_concurrency)
+            self._rotation.append(device)
+        return queue
+
+    async def _acquire(self, device: AntaDevice | None) -> None:
+        """Wait until a slot is granted for the provided device."""
+        queue = self._get_queue(device)
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        queue.waiters.append(waiter)
+        self._schedule_dispatch()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot has been granted before the cancellation, give it back
+                self._release(device)
+            else:
+                queue.waiters.remove(waiter)
+            raise
+
+    def _release(self, device: AntaDevice | None) -> None:
+        """Release a slot of the provided device."""
+        self._queues[device].in_flight -= 1
+        self._in_flight -= 1
+        self._schedule_dispatch()
+
+    def _schedule_dispatch(self) -> None:
+        """Schedule the dispatch of the free slots on the next iteration of the event loop.
+
+        Deferring the dispatch lets all the tests scheduled at the same time enqueue before any slot is granted.
+        """
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            asyncio.get_running_loop().call_soon(self._dispatch)
+
+    def _dispatch(self) -> None:
+        """Grant the free slots to the waiting tests in a round-robin fashion across devices."""
+        self._dispatch_scheduled = False
+        while self._in_flight < self.max_concurrency:
+            for _ in range(len(self._rotation)):
+                device = self._rotation[0]
+                self._rotation.rotate(-1)
+                queue = self._queues[device]
+                if queue.eligible:
+                    queue.waiters.popleft().set_result(None)
+                    queue.in_flight += 1
+                    self._in_flight += 1
+                    break
+            else:
+                # No device has both a waiting test and a free slot
+                return
+
+
+@dataclass
+class ConcurrencyAdjustment:
+    """Record a change of the limit of an `AdaptiveLimiter`.
+
+    Attributes
+    ----------
+    name : str
+        Name of the limiter, i.e. a device name or `global`.
+    previous_limit : int
+        Limit before the adjustment.
+    limit : int
+        Limit after the adjustment.
+    reason : str
+        Reason of the adjustment.
+    timestamp : datetime
+        Time of the adjustment.
+    """
+
+    name: str
+    previous_limit: int
+    limit: int
+    reason: str
+    timestamp: datetime = field(default_factory=lambda: datetime.now(tz=timezone.utc))
+
+
+class AdaptiveLimiter:
+    """Limit the number of concurrent requests with an AIMD (additive increase, multiplicative decrease) controller.
+
+    The limit is evaluated after each window of completed requests, a window being at least the current limit.
+    It starts at `initial_limit` and is doubled after each window (slow start) until the p95 latency of a window
+    exceeds `latency_tolerance` times the lowest p95 latency observed. It is then increased by one per window while
+    the p95 latency is stable. The limit is halved when a request fails with an overload signal, e.g. a timeout or
+    an HTTP 5xx response. The requests in flight at that time are then ignored, so the limit backs off once per round
+    of requests instead of once per failed request.
+
+    If `parent` is set, a request also waits for a slot of the parent limiter, e.g. a global limit across devices,
+    and the failures are reported to the parent.
+
+    Attributes
+    ----------
+    name : str
+        Name of the limiter, i.e. a device name or `global`.
+    limit : int
+        Current maximum number of concurrent requests.
+    min_limit : int
+        Lower bound of the limit.
+    max_limit : int
+        Upper bound of the limit.
+    latency_tolerance : float
+        Ratio of the p95 latency of a window to the lowest p95 latency above which the limit is not increased.
+    parent : AdaptiveLimiter | None
+        Parent limiter. None if there is no parent.
+    adjustments : list[ConcurrencyAdjustment]
+        Changes of the limit, can be shared between limiters.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int,
+        max_limit: int,
+        *,
+        min_limit: int = 1,
+        latency_tolerance: float = 1.5,
+        parent: AdaptiveLimiter | None = None,
+        adjustments: list[ConcurrencyAdjustment] | None = None,
+    ) -> None:
+        """Initialize an AdaptiveLimiter."""
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = max(min_limit, min(initial_limit, max_limit))
+        self.latency_tolerance = latency_tolerance
+        self.parent = parent
+        self.adjustments = adjustments if adjustments is not None else []
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._latencies: list[float] = []
+        self._baseline: float | None = None
+        self._slow_start = True
+        # Number of completed requests to ignore after a decrease
+        self._cooldown = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently running."""
+        return self._in_flight
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait for a slot of this limiter and of the parent limiter if any, and release them on exit.
+
+        The latency of the request is measured once the slots are granted.
+        """
+        await self._acquire()
+        latency: float | None = None
+        try:
+            if self.parent is not None:
+                await self.parent._acquire()  # noqa: SLF001
+            start = monotonic()
+            try:
+                yield
+            finally:
+                latency = monotonic() - start
+                if self.parent is not None:
+                    self.parent._release(latency)  # noqa: SLF001
+        finally:
+            self._release(latency)
+
+    def record_failure(self, reason: str) -> None:
+        """Halve the limit after a request failed with an overload signal and report the failure to the parent limiter."""
+        if self.parent is not None:
+            self.parent.record_failure(f"{reason} on {self.name}")
+        if self._cooldown > 0:
+            return
+        self._slow_start = False
+        self._latencies.clear()
+        # The requests in flight were sent with the previous limit
+        self._cooldown = self._in_flight
+        self._set_limit(max(self.min_limit, self.limit // 2), reason)
+
+    async def _acquire(self) -> None:
+        """Wait until a slot is granted."""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot has been granted before the cancellation, give it back
+                self._release(None)
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def _release(self, latency: float | None) -> None:
+        """Release a slot and evaluate the limit with the latency of the request if provided."""
+        self._in_flight -= 1
+        if latency is not None:
+            self._record_latency(latency)
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        """Grant the free slots to the waiting requests in arrival order."""
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                self._in_flight += 1
+
+    def _record_latency(self, latency: float) -> None:
+        """Record the latency of a completed request and increase the limit at the end of a window if the latency is stable."""
+        if self._cooldown > 0:
+            self._cooldown -= 1
+            return
+        self._latencies.append(latency)
+        if len(self._latencies) < max(self.limit, ADAPTIVE_MIN_WINDOW):
+            return
+        p95 = quantiles(self._latencies, n=20)[-1]
+        self._latencies.clear()
+        if self._baseline is None or p95 < self._baseline:
+            self._baseline = p95
+        if p95 > self._baseline * self.latency_tolerance:
+            if self._slow_start:
+                self._slow_start = False
+                logger.debug("%s: p95 latency increased to %.3fs, ending slow start at %d concurrent requests", self.name, p95, self.limit)
+            return
+        new_limit = min(self.max_limit, self.limit * 2 if self._slow_start else self.limit + 1)
+        self._set_limit(new_limit, f"p95 latency stable at {p95:.3f}s")
+
+    def _set_limit(self, limit: int, reason: str) -> None:
+        """Set the limit and record the adjustment if the limit changed."""
+        if limit == self.limit:
+            return
+        self.adjustments.append(ConcurrencyAdjustment(name=self.name, previous_limit=self.limit, limit=limit, reason=reason))
+        logger.debug("%s: concurrent requests limit adjusted from %d to %d: %s", self.name, self.limit, limit, reason)
+        self.limit = limit
+        self._wake_up()
@@ -0,0 +1,172 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""ANTA run statistics classes."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from anta._scheduler import GLOBAL_LIMITER_NAME
+
+if TYPE_CHECKING:
+    from anta._cost import RunCostEstimate
+    from anta._scheduler import ConcurrencyAdjustment
+
+
+@dataclass
+class PrefetchStatistics:
+    """Statistics of the commands prefetch stage of an ANTA run.
+
+    Attributes
+    ----------
+    prefetched_commands: dict[str, int]
+        Mapping of device names to the number of unique commands collected during the prefetch stage.
+    deduplicated_commands: dict[str, int]
+        Mapping of device names to the number of duplicate commands served from a shared output during the prefetch stage.
+    """
+
+    prefetched_commands: dict[str, int] = field(default_factory=dict)
+    deduplicated_commands: dict[str, int] = field(default_factory=dict)
+
+    def merge(self, other: PrefetchStatistics) -> None:
+        """Merge the statistics of another inventory shard."""
+        self.prefetched_commands.update(other.prefetched_commands)
+        self.deduplicated_commands.update(other.deduplicated_commands)
+
+
+@dataclass
+class WorkerPoolStatistics:
+    """Memory statistics of the test coroutines of an ANTA run.
+
+    In a sharded run, the worker processes run concurrently: the statistics of the shards add up, and the peak memory
+    also includes the parent process.
+
+    Attributes
+    ----------
+    peak_tests_in_memory: int
+        Maximum number of `AntaTest` instances alive at the same time during the run.
+    peak_memory: int | None
+        Peak resident set size of the ANTA processes in bytes, measured at the end of the run. None if not available.
+    """
+
+    peak_tests_in_memory: int = 0
+    peak_memory: int | None = None
+
+    def merge(self, other: WorkerPoolStatistics) -> None:
+        """Merge the statistics of another inventory shard."""
+        self.peak_tests_in_memory += other.peak_tests_in_memory
+        self.add_peak_memory(other.peak_memory)
+
+    def add_peak_memory(self, peak_memory: int | None) -> None:
+        """Add the peak memory of a process to the peak memory of the run. A None value is ignored."""
+        if peak_memory is not None:
+            self.peak_memory = peak_memory if self.peak_memory is None else self.peak_memory + peak_memory
+
+
+@dataclass
+class ConcurrencyStatistics:
+    """Statistics of the adaptive concurrency controller of an ANTA run.
+
+    Attributes
+    ----------
+    limits: dict[str, int]
+        Mapping of device names to the final limit of concurrent requests chosen by the adaptive concurrency controller.
+        The `global` key holds the limit across all the devices. Empty if adaptive concurrency is disabled.
+    adjustments: list[ConcurrencyAdjustment]
+        Changes of the concurrent requests limits made by the adaptive concurrency controller during the run.
+    """
+
+    limits: dict[str, int] = field(default_factory=dict)
+    adjustments: list[ConcurrencyAdjustment] = field(default_factory=list)
+
+    def merge(self, other: ConcurrencyStatistics) -> None:
+        """Merge the statistics of another inventory shard. The global limits of the shards add up."""
+        self.adjustments.extend(other.adjustments)
+        self.adjustments.sort(key=lambda adjustment: adjustment.timestamp)
+        for name, limit in other.limits.items():
+            self.limits[name] = self.limits.get(name, 0) + limit if name == GLOBAL_LIMITER_NAME else limit
+
+
+@dataclass
+class TransportStatistics:
+    """Statistics of the retry policies and circuit breakers of the devices of an ANTA run.
+
+    Attributes
+    ----------
+    retries: dict[str, dict[str, int]]
+        Mapping of device names to the retry statistics of the device, see `RetryPolicy.statistics`. Empty if retries are disabled.
+    circuit_breakers: dict[str, dict[str, int]]
+        Mapping of device names to the circuit breaker statistics of the device, see `CircuitBreaker.statistics`.
+        Empty if the circuit breakers are disabled.
+    """
+
+    retries: dict[str, dict[str, int]] = field(default_factory=dict)
+    circuit_breakers: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    def merge(self, other: TransportStatistics) -> None:
+        """Merge the statistics of another inventory shard."""
+        self.retries.update(other.retries)
+        self.circuit_breakers.update(other.circuit_breakers)
+
+
+@dataclass
+class SweepStatistics:
+    """Statistics of the management port sweep of an ANTA run.
+
+    Attributes
+    ----------
+    swept_devices: int
+        Number of devices whose management port was checked. 0 if the sweep is disabled.
+    live_devices: int
+        Number of devices accepting connections on their management port.
+    duration: float
+        Duration of the sweep in seconds. In a sharded run, the duration of the slowest shard.
+    """
+
+    swept_devices: int = 0
+    live_devices: int = 0
+    duration: float = 0.0
+
+    def merge(self, other: SweepStatistics) -> None:
+        """Merge the statistics of another inventory shard."""
+        self.swept_devices += other.swept_devices
+        self.live_devices += other.live_devices
+        self.duration = max(self.duration, other.duration)
+
+
+@dataclass
+class AntaRunStatistics:
+    """Statistics and estimates recorded during an ANTA run, grouped by run stage.
+
+    Attributes
+    ----------
+    prefetch: PrefetchStatistics
+        Statistics of the commands prefetch stage.
+    worker_pool: WorkerPoolStatistics
+        Memory statistics of the test coroutines.
+    concurrency: ConcurrencyStatistics
+        Statistics of the adaptive concurrency controller.
+    transport: TransportStatistics
+        Statistics of the retry policies and circuit breakers of the devices.
+    sweep: SweepStatistics
+        Statistics of the management port sweep.
+    cost: RunCostEstimate | None
+        Cost estimate of the run: requests, bytes and connections per device. Only computed in dry-run mode.
+    """
+
+    prefetch: PrefetchStatistics = field(default_factory=PrefetchStatistics)
+    worker_pool: WorkerPoolStatistics = field(default_factory=WorkerPoolStatistics)
+    concurrency: ConcurrencyStatistics = field(default_factory=ConcurrencyStatistics)
+    transport: TransportStatistics = field(default_factory=TransportStatistics)
+    sweep: SweepStatistics = field(default_factory=SweepStatistics)
+    cost: RunCostEstimate | None = None
+
+    def merge(self, other: AntaRunStatistics) -> None:
+        """Merge the statistics of another inventory shard, e.g. sent by a worker process of a sharded run."""
+        self.prefetch.merge(other.prefetch)
+        self.worker_pool.merge(other.worker_pool)
+        self.concurrency.merge(other.concurrency)
+        self.transport.merge(other.transport)
+        self.sweep.merge(other.sweep)
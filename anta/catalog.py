@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import importlib
 import logging
 import math
@@ -15,7 +16,7 @@ from json import load as json_load
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, RootModel, ValidationError, ValidationInfo, field_validator, model_serializer, model_validator
+from pydantic import BaseModel, ConfigDict, PrivateAttr, RootModel, ValidationError, ValidationInfo, field_validator, model_serializer, model_validator
 from pydantic.types import ImportString
 from pydantic_core import PydanticCustomError
 from typing_extensions import deprecated
@@ -57,6 +58,9 @@ class AntaTestDefinition(BaseModel):
 
     test: type[AntaTest]
     inputs: AntaTest.Input
+    _fingerprint: str | None = PrivateAttr(default=None)
+    # Test class, inputs and input values the fingerprint was computed from
+    _fingerprint_state: tuple[Any, ...] = PrivateAttr(default=())
 
     @model_serializer()
     def serialize_model(self) -> dict[str, AntaTest.Input]:
@@ -86,6 +90,41 @@ class AntaTestDefinition(BaseModel):
             context={"test": data["test"]},
         )
         super(BaseModel, self).__init__()
+        # Compute the fingerprint once when the test definition is loaded
+        _ = self.fingerprint
+
+    @property
+    def fingerprint(self) -> str:
+        """Fingerprint of this test definition, built from the test class and the test inputs.
+
+        It is computed when the test definition is instantiated and used to hash and compare test definitions. It is computed
+        again if the test class, the inputs or an input field is replaced afterwards, e.g. by `model_copy(update=...)` or by
+        assigning an input field. Changes inside an input field, e.g. appending to a list, are not detected.
+        """
+        state = (self.test, self.inputs, *self.inputs.__dict__.values())
+        if (
+            self._fingerprint is None
+            or len(state) != len(self._fingerprint_state)
+            or any(value is not previous for value, previous in zip(state, self._fingerprint_state))
+        ):
+            self._fingerprint = self._compute_fingerprint()
+            self._fingerprint_state = state
+        return self._fingerprint
+
+    def _compute_fingerprint(self) -> str:
+        """Compute the fingerprint of this test definition."""
+        data = f"{self.test.__module__}.{self.test.__name__}:{self.inputs.model_dump_json()}"
+        return hashlib.sha256(data.encode("UTF-8")).hexdigest()
+
+    def __hash__(self) -> int:
+        """Implement hashing for AntaTestDefinition using its fingerprint."""
+        return hash(self.fingerprint)
+
+    def __eq__(self, other: object) -> bool:
+        """Implement equality for AntaTestDefinition using its fingerprint."""
+        if not isinstance(other, AntaTestDefinition):
+            return NotImplemented
+        return self.fingerprint == other.fingerprint
 
     @field_validator("inputs", mode="before")
     @classmethod
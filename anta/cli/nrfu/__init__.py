@@ -5,10 +5,12 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import click
 
+from anta._replay import ReplayArchive
 from anta.cli.nrfu import commands
 from anta.cli.utils import AliasedGroup, catalog_options, inventory_options
 from anta.result_manager import ResultManager
@@ -54,6 +56,16 @@ HIDE_STATUS: list[str] = list(AntaTestStatus)
 HIDE_STATUS.remove("unset")
 
 
+def parse_statuses(ctx: click.Context, param: click.Option, value: str) -> set[AntaTestStatus]:
+    # ruff: noqa: ARG001
+    """Click option callback to parse a comma-separated list of test statuses."""
+    try:
+        return {AntaTestStatus(status.strip().lower()) for status in value.split(",")}
+    except ValueError as e:
+        msg = f"'{value}' is not a valid list of statuses. Valid statuses are: {', '.join(HIDE_STATUS)}."
+        raise click.BadParameter(msg) from e
+
+
 @click.group(invoke_without_command=True, cls=IgnoreRequiredWithHelp)
 @click.pass_context
 @inventory_options
@@ -98,12 +110,110 @@ HIDE_STATUS.remove("unset")
 )
 @click.option(
     "--dry-run",
-    help="Run anta nrfu command but stop before starting to execute the tests. Considers all devices as connected.",
+    help="Run anta nrfu command but stop before starting to execute the tests and print a cost estimate of the run. Considers all devices as connected.",
     type=str,
     show_envvar=True,
     is_flag=True,
     default=False,
 )
+@click.option(
+    "--workers",
+    help="Number of worker processes to run the tests. The inventory is sharded across the worker processes. Overrides ANTA_WORKERS.",
+    type=click.IntRange(min=1),
+    show_envvar=True,
+    default=None,
+    required=False,
+)
+@click.option(
+    "--deadline",
+    help="Maximum duration of the run in seconds. Tests not started before the deadline or still running at the deadline are reported as error. "
+    "Overrides ANTA_DEADLINE.",
+    type=click.FloatRange(min=0, min_open=True),
+    metavar="SECONDS",
+    show_envvar=True,
+    required=False,
+)
+@click.option(
+    "--test-timeout",
+    help="Maximum duration of a test in seconds. Tests running longer are reported as error. Overrides ANTA_TEST_TIMEOUT.",
+    type=click.FloatRange(min=0, min_open=True),
+    metavar="SECONDS",
+    show_envvar=True,
+    required=False,
+)
+@click.option(
+    "--journal",
+    help="Write each test result to this journal file as soon as the test completes, to resume the run with --resume if it is interrupted.",
+    type=click.Path(file_okay=True, dir_okay=False, exists=False, writable=True, path_type=Path),
+    show_envvar=True,
+    required=False,
+)
+@click.option(
+    "--resume",
+    help="Resume a run from a journal file: the tests recorded in the journal are not run again and their results are merged with the new results. "
+    "The new results are appended to the journal unless --journal is set.",
+    type=click.Path(file_okay=True, dir_okay=False, exists=True, readable=True, path_type=Path),
+    show_envvar=True,
+    required=False,
+)
+@click.option(
+    "--rerun-from",
+    help="Run again only the tests of a JSON report generated by `anta nrfu json` with the statuses of --status. "
+    "Only the devices of these tests are connected and the new results replace the results of the report.",
+    type=click.Path(file_okay=True, dir_okay=False, exists=True, readable=True, path_type=Path),
+    show_envvar=True,
+    required=False,
+)
+@click.option(
+    "--status",
+    help="Comma-separated list of the statuses of the tests to run again with --rerun-from.",
+    type=str,
+    default="failure,error",
+    show_default=True,
+    show_envvar=True,
+    callback=parse_statuses,
+    required=False,
+)
+@click.option(
+    "--history",
+    help="JSON report generated by `anta nrfu json` used to estimate the duration of the run in dry-run mode.",
+    type=click.Path(file_okay=True, dir_okay=False, exists=True, readable=True, path_type=Path),
+    show_envvar=True,
+    required=False,
+)
+@click.option(
+    "--watch",
+    help="Run the tests every SECONDS seconds until interrupted, keeping the device sessions open. "
+    "Only the results whose status changed since the previous run are rendered, except for the periodic snapshots of all the results.",
+    type=click.FloatRange(min=0, min_open=True),
+    metavar="SECONDS",
+    show_envvar=True,
+    required=False,
+)
+@click.option(
+    "--snapshot-every",
+    help="Render all the results every N runs in watch mode. The results of the first run are always rendered.",
+    type=click.IntRange(min=1),
+    default=12,
+    show_default=True,
+    show_envvar=True,
+    required=False,
+)
+@click.option(
+    "--watch-count",
+    help="Stop the watch mode after N runs.",
+    type=click.IntRange(min=1),
+    show_envvar=True,
+    required=False,
+)
+@click.option(
+    "--replay-dir",
+    help="Directory generated by `anta exec snapshot`, or ZIP archive of such a directory, to replay instead of connecting to the devices. "
+    "The inventory devices are replayed by name and the credentials are not used.",
+    type=click.Path(file_okay=True, dir_okay=True, exists=True, readable=True, path_type=Path),
+    show_envvar=True,
+    required=False,
+)
 def nrfu(
     ctx: click.Context,
     inventory: AntaInventory,
@@ -112,6 +222,18 @@ def nrfu(
     device: tuple[str],
     test: tuple[str],
     hide: tuple[str],
+    workers: int | None,
+    deadline: float | None,
+    test_timeout: float | None,
+    journal: Path | None,
+    resume: Path | None,
+    rerun_from: Path | None,
+    status: set[AntaTestStatus],
+    history: Path | None,
+    watch: float | None,
+    snapshot_every: int,
+    watch_count: int | None,
+    replay_dir: Path | None,
     *,
     ignore_status: bool,
     ignore_error: bool,
@@ -131,11 +253,23 @@ def nrfu(
     ctx.obj["hide"] = set(hide) if hide else None
     ctx.obj["catalog"] = catalog
     ctx.obj["catalog_format"] = catalog_format
+    if replay_dir is not None:
+        # The archive is shared by the replayed devices and closed when the command exits
+        inventory = inventory.replay(ctx.with_resource(ReplayArchive(replay_dir)) if replay_dir.is_file() else replay_dir)
     ctx.obj["inventory"] = inventory
     ctx.obj["tags"] = tags
     ctx.obj["device"] = device
     ctx.obj["test"] = test
     ctx.obj["dry_run"] = dry_run
+    ctx.obj["workers"] = workers
+    ctx.obj["deadline"] = deadline
+    ctx.obj["test_timeout"] = test_timeout
+    ctx.obj["journal"] = journal
+    ctx.obj["resume"] = resume
+    ctx.obj["rerun_from"] = rerun_from
+    ctx.obj["status"] = status
+    ctx.obj["history"] = history
+    ctx.obj["watch"] = watch
 
     # Invoke `anta nrfu table` if no command is passed
     if not ctx.invoked_subcommand:
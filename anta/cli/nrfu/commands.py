@@ -29,8 +29,7 @@ logger = logging.getLogger(__name__)
 )
 def table(ctx: click.Context, group_by: Literal["device", "test"] | None) -> None:
     """ANTA command to check network state with table results."""
-    run_tests(ctx)
-    print_table(ctx, group_by=group_by)
+    run_tests(ctx, render=lambda _: print_table(ctx, group_by=group_by))
     exit_with_code(ctx)
 
 
@@ -49,8 +48,7 @@ def json(ctx: click.Context, output: pathlib.Path | None) -> None:
 
     If no `--output` is specified, the output is printed to stdout.
     """
-    run_tests(ctx)
-    print_json(ctx, output=output)
+    run_tests(ctx, render=lambda _: print_json(ctx, output=output))
     exit_with_code(ctx)
 
 
@@ -58,8 +56,7 @@ def json(ctx: click.Context, output: pathlib.Path | None) -> None:
 @click.pass_context
 def text(ctx: click.Context) -> None:
     """ANTA command to check network state with text results."""
-    run_tests(ctx)
-    print_text(ctx)
+    run_tests(ctx, render=lambda _: print_text(ctx))
     exit_with_code(ctx)
 
 
@@ -80,8 +77,7 @@ def text(ctx: click.Context) -> None:
 )
 def csv(ctx: click.Context, csv_output: pathlib.Path) -> None:
     """ANTA command to check network state with CSV report."""
-    run_tests(ctx)
-    save_to_csv(ctx, csv_file=csv_output)
+    run_tests(ctx, render=lambda _: save_to_csv(ctx, csv_file=csv_output))
     exit_with_code(ctx)
 
 
@@ -105,8 +101,7 @@ def csv(ctx: click.Context, csv_output: pathlib.Path) -> None:
 )
 def tpl_report(ctx: click.Context, template: pathlib.Path, output: pathlib.Path | None) -> None:
     """ANTA command to check network state with templated report."""
-    run_tests(ctx)
-    print_jinja(results=ctx.obj["result_manager"], template=template, output=output)
+    run_tests(ctx, render=lambda _: print_jinja(results=ctx.obj["result_manager"], template=template, output=output))
     exit_with_code(ctx)
 
 
@@ -121,6 +116,5 @@ def tpl_report(ctx: click.Context, template: pathlib.Path, output: pathlib.Path
 )
 def md_report(ctx: click.Context, md_output: pathlib.Path) -> None:
     """ANTA command to check network state with Markdown report."""
-    run_context = run_tests(ctx)
-    save_markdown_report(ctx, md_output=md_output, run_context=run_context)
+    run_tests(ctx, render=lambda run_context: save_markdown_report(ctx, md_output=md_output, run_context=run_context))
     exit_with_code(ctx)
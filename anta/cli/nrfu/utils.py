@@ -8,63 +8,247 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import rich
 from rich.panel import Panel
 from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn, TimeRemainingColumn
 
 from anta import __version__ as anta_version
+from anta._cost import RunCostEstimate
 from anta._runner import AntaRunContext, AntaRunFilters, AntaRunner
 from anta.cli.console import console
 from anta.cli.utils import ExitCode
+from anta.logger import anta_log_exception
 from anta.models import AntaTest
 from anta.reporter import ReportJinja, ReportTable
 from anta.reporter.csv_reporter import ReportCsv
 from anta.reporter.md_reporter import MDReportGenerator
+from anta.result_manager import ResultManager
+from anta.result_manager.journal import ResultJournal
+from anta.result_manager.models import TestResult
+from anta.settings import AntaRunnerSettings
 
 if TYPE_CHECKING:
     import pathlib
+    from collections.abc import Callable
 
     import click
 
     from anta.catalog import AntaCatalog
     from anta.inventory import AntaInventory
-    from anta.result_manager import ResultManager
 
 logger = logging.getLogger(__name__)
 
 
-def run_tests(ctx: click.Context) -> AntaRunContext:
-    """Run the tests."""
+def run_tests(ctx: click.Context, render: Callable[[AntaRunContext], None] | None = None) -> AntaRunContext | None:
+    """Run the tests.
+
+    If provided, `render` is called with the run context to render the results once the tests are done.
+    With `--watch`, the tests are run on schedule and `render` is called after each run.
+    """
     # Digging up the parameters from the parent context
     if ctx.parent is None:
         ctx.exit()
     nrfu_ctx_params = ctx.parent.params
-    tags = nrfu_ctx_params["tags"]
-    device = nrfu_ctx_params["device"] or None
-    test = nrfu_ctx_params["test"] or None
+    if nrfu_ctx_params["watch"] is not None:
+        return watch_tests(ctx, render)
     dry_run = nrfu_ctx_params["dry_run"]
+    resume = nrfu_ctx_params["resume"]
+    rerun_from = nrfu_ctx_params["rerun_from"]
 
     catalog = ctx.obj["catalog"]
     inventory = ctx.obj["inventory"]
 
+    # Results of the tests recorded in the journal of the resumed run if any
+    resumed_manager = ResultJournal.load(resume) if resume is not None else ResultManager()
+    if resume is not None:
+        logger.info("Resuming the run from journal %s with %d recorded test results", resume, len(resumed_manager))
+    # Results of the previous run if the tests are run again
+    previous_manager = load_results(ctx, rerun_from) if rerun_from is not None else None
+
     print_settings(inventory, catalog)
-    with anta_progress_bar() as AntaTest.progress:
-        runner = AntaRunner()
-        filters = AntaRunFilters(
-            devices=set(device) if device else None,
-            tests=set(test) if test else None,
-            tags=tags,
-        )
-        run_ctx = asyncio.run(runner.run(inventory=inventory, catalog=catalog, result_manager=ctx.obj["result_manager"], filters=filters, dry_run=dry_run))
+    journal = None if dry_run else open_journal(ctx, resumed_manager)
+    try:
+        with anta_progress_bar() as AntaTest.progress:
+            runner = AntaRunner(settings=_get_settings(ctx))
+            filters = _get_filters(ctx, resumed_manager, previous_manager)
+            run_ctx = asyncio.run(
+                runner.run(
+                    inventory=inventory,
+                    catalog=catalog,
+                    result_manager=ctx.obj["result_manager"],
+                    filters=filters,
+                    dry_run=dry_run,
+                    result_callbacks=[journal.add] if journal is not None else None,
+                )
+            )
+    finally:
+        if journal is not None:
+            journal.close()
 
     if dry_run:
+        print_cost_estimate(ctx, run_ctx)
         ctx.exit()
 
+    if resume is not None:
+        # Merge the results of the resumed run with the new results
+        ctx.obj["result_manager"] = ResultManager.merge_results([resumed_manager, ctx.obj["result_manager"]])
+    if previous_manager is not None:
+        # Replace the results of the tests run again in the results of the previous run
+        ctx.obj["result_manager"] = merge_rerun_results(previous_manager, ctx.obj["result_manager"])
+
+    if render is not None:
+        render(run_ctx)
     return run_ctx
 
 
+def watch_tests(ctx: click.Context, render: Callable[[AntaRunContext], None] | None) -> AntaRunContext | None:
+    """Run the tests every `--watch` seconds until interrupted or until `--watch-count` runs are done.
+
+    The device sessions are kept open between the runs. After each run, only the results whose status changed since
+    the previous run are rendered, except for the first run and every `--snapshot-every` runs where all the results are rendered.
+    The result manager of the Click context holds all the results of the last run when returning.
+    """
+    if ctx.parent is None:
+        ctx.exit()
+    nrfu_ctx_params = ctx.parent.params
+    for param in ("dry_run", "journal", "resume", "rerun_from"):
+        if nrfu_ctx_params[param]:
+            console.print(f"--{param.replace('_', '-')} is not supported with --watch ❌", style="cyan")
+            ctx.exit(ExitCode.USAGE_ERROR)
+
+    inventory = ctx.obj["inventory"]
+    catalog = ctx.obj["catalog"]
+    snapshot_every = nrfu_ctx_params["snapshot_every"]
+    runner = AntaRunner(settings=_get_settings(ctx))
+    filters = _get_filters(ctx, ResultManager(), None)
+    print_settings(inventory, catalog)
+    # Context of the last run, updated by the watch coroutine
+    runs: list[AntaRunContext] = []
+
+    async def watch() -> None:
+        iteration = 0
+        async for run_ctx in runner.watch(inventory, catalog, nrfu_ctx_params["watch"], filters=filters, iterations=nrfu_ctx_params["watch_count"]):
+            snapshot = iteration % snapshot_every == 0
+            iteration += 1
+            manager = run_ctx.manager if snapshot else get_status_changes(runs[-1].manager, run_ctx.manager)
+            runs[:] = [run_ctx]
+            ctx.obj["result_manager"] = manager
+            if not snapshot and len(manager) == 0:
+                console.print(f"{run_ctx.start_time:%Y-%m-%d %H:%M:%S} • No test status changed since the previous run", style="cyan")
+                continue
+            title = "All test results" if snapshot else f"{len(manager)} test status changes"
+            console.print(Panel(f"{run_ctx.start_time:%Y-%m-%d %H:%M:%S} • {title}", style="cyan"))
+            if render is not None:
+                render(run_ctx)
+
+    try:
+        asyncio.run(watch())
+    except KeyboardInterrupt:
+        logger.info("Watch mode interrupted")
+
+    if not runs:
+        ctx.obj["result_manager"] = ResultManager()
+        return None
+    ctx.obj["result_manager"] = runs[-1].manager
+    return runs[-1]
+
+
+def _get_settings(ctx: click.Context) -> AntaRunnerSettings | None:
+    """Get the runner settings overridden by the CLI options. Returns None if no setting is overridden."""
+    if ctx.parent is None:
+        ctx.exit()
+    nrfu_ctx_params = ctx.parent.params
+    overrides: dict[str, Any] = {name: nrfu_ctx_params[name] for name in ("workers", "deadline", "test_timeout") if nrfu_ctx_params[name] is not None}
+    if ctx.obj.get("plan_cache") is not None:
+        overrides["plan_cache"] = ctx.obj["plan_cache"]
+    return AntaRunnerSettings(**overrides) if overrides else None
+
+
+def _get_filters(ctx: click.Context, resumed_manager: ResultManager, previous_manager: ResultManager | None) -> AntaRunFilters:
+    """Get the filters of the run from the Click context, the results of the resumed run and the results of the previous run to run again."""
+    if ctx.parent is None:
+        ctx.exit()
+    nrfu_ctx_params = ctx.parent.params
+    device = nrfu_ctx_params["device"] or None
+    test = nrfu_ctx_params["test"] or None
+
+    included_tests: set[tuple[str, str, str | None]] | None = None
+    if previous_manager is not None:
+        statuses = nrfu_ctx_params["status"]
+        included_tests = {(result.name, result.test, result.fingerprint) for result in previous_manager.get_results(status=statuses)}
+        logger.info("Running again %d tests with status %s from %s", len(included_tests), ", ".join(sorted(statuses)), nrfu_ctx_params["rerun_from"])
+
+    return AntaRunFilters(
+        devices=set(device) if device else None,
+        tests=set(test) if test else None,
+        tags=nrfu_ctx_params["tags"],
+        included_tests=included_tests,
+        excluded_tests=ResultJournal.get_recorded_tests(resumed_manager) or None,
+    )
+
+
+def load_results(ctx: click.Context, path: pathlib.Path) -> ResultManager:
+    """Load the test results of a JSON report generated by `anta nrfu json`."""
+    manager = ResultManager()
+    try:
+        with path.open(encoding="UTF-8") as file:
+            manager.results = [TestResult.model_validate(result) for result in json.load(file)]
+    except (OSError, ValueError, TypeError) as e:
+        # ValidationError and JSONDecodeError are subclasses of ValueError
+        anta_log_exception(e, f"Unable to load the test results from {path}", logger)
+        ctx.exit(ExitCode.USAGE_ERROR)
+    return manager
+
+
+def merge_rerun_results(previous_manager: ResultManager, manager: ResultManager) -> ResultManager:
+    """Merge the results of a previous run with the results of the tests run again.
+
+    The results of the previous run are replaced by the new results of the same device, test and test definition fingerprint.
+    A result of the previous run without fingerprint is replaced by the new results of the same device and test.
+    """
+    new_keys = {(result.name, result.test, result.fingerprint) for result in manager.results} | {(result.name, result.test, None) for result in manager.results}
+    merged_manager = ResultManager()
+    merged_manager.results = [result for result in previous_manager.results if (result.name, result.test, result.fingerprint) not in new_keys] + manager.results
+    return merged_manager
+
+
+def get_status_changes(previous_manager: ResultManager, manager: ResultManager) -> ResultManager:
+    """Get the results whose status changed since a previous run.
+
+    The results are matched by device, test and test definition fingerprint. The results without a match in the previous run are included.
+    """
+    previous_statuses = {(result.name, result.test, result.fingerprint): result.result for result in previous_manager.results}
+    changed_manager = ResultManager()
+    changed_manager.results = [result for result in manager.results if previous_statuses.get((result.name, result.test, result.fingerprint)) != result.result]
+    return changed_manager
+
+
+def open_journal(ctx: click.Context, resumed_manager: ResultManager) -> ResultJournal | None:
+    """Open the journal of the run if `--journal` or `--resume` is set.
+
+    The new results are appended to the journal of the resumed run, unless another journal is provided.
+    In that case, the results of the resumed run are written first to the new journal.
+    """
+    journal_path = ctx.obj.get("journal")
+    resume = ctx.obj.get("resume")
+    if journal_path is None and resume is None:
+        return None
+
+    append = journal_path is None or (resume is not None and journal_path.resolve() == resume.resolve())
+    journal = ResultJournal(journal_path if journal_path is not None else resume, append=append)
+    try:
+        journal.open()
+    except OSError:
+        console.print(f"Failed to open journal {journal.path} ❌", style="cyan")
+        ctx.exit(ExitCode.USAGE_ERROR)
+    if not append:
+        for result in resumed_manager.results:
+            journal.add(result)
+    return journal
+
+
 def _get_result_manager(ctx: click.Context, *, apply_hide_filter: bool = True) -> ResultManager:
     """Get a ResultManager instance based on Click context."""
     if apply_hide_filter:
@@ -99,21 +283,42 @@ def print_table(ctx: click.Context, group_by: Literal["device", "test"] | None =
 def print_json(ctx: click.Context, output: pathlib.Path | None = None) -> None:
     """Print results as JSON. If output is provided, save to file instead."""
     results = _get_result_manager(ctx)
+    _print_json(ctx, results.json, "JSON results", output=output)
 
+
+def _print_json(ctx: click.Context, content: str, title: str, output: pathlib.Path | None = None) -> None:
+    """Print a JSON content. If output is provided, save to file instead."""
     if output is None:
         console.print()
-        console.print(Panel("JSON results", style="cyan"))
-        rich.print_json(results.json)
+        console.print(Panel(title, style="cyan"))
+        rich.print_json(content)
     else:
         try:
             with output.open(mode="w", encoding="utf-8") as file:
-                file.write(results.json)
-            console.print(f"JSON results saved to {output} ✅", style="cyan")
+                file.write(content)
+            console.print(f"{title} saved to {output} ✅", style="cyan")
         except OSError:
-            console.print(f"Failed to save JSON results to {output} ❌", style="cyan")
+            console.print(f"Failed to save {title} to {output} ❌", style="cyan")
             ctx.exit(ExitCode.USAGE_ERROR)
 
 
+def print_cost_estimate(ctx: click.Context, run_ctx: AntaRunContext) -> None:
+    """Print the cost estimate of a dry run as a table, or as JSON with the `json` command.
+
+    If `--history` is set, the duration is estimated from the test results of the provided JSON report.
+    """
+    if run_ctx.statistics.cost is None:
+        return
+    if ctx.parent is not None and (history := ctx.parent.params["history"]) is not None:
+        run_ctx.statistics.cost.request_latency = RunCostEstimate.get_request_latency(load_results(ctx, history))
+
+    if ctx.command.name == "json":
+        _print_json(ctx, run_ctx.statistics.cost.json, "JSON cost estimate", output=ctx.params.get("output"))
+    else:
+        console.print()
+        console.print(ReportTable().report_cost(run_ctx.statistics.cost))
+
+
 def print_text(ctx: click.Context) -> None:
     """Print results as simple text."""
     console.print()
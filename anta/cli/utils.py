@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING, Any, Callable, Literal
 import click
 from yaml import YAMLError
 
+from anta._plan_cache import RunPlanCache
 from anta.catalog import AntaCatalog
 from anta.inventory import AntaInventory
 from anta.inventory.exceptions import InventoryIncorrectSchemaError, InventoryRootKeyError
@@ -183,6 +184,15 @@ def core_options(f: Callable[..., Any]) -> Callable[..., Any]:
         is_flag=True,
         default=False,
     )
+    @click.option(
+        "--http2",
+        help="Multiplex the eAPI requests of each device over a single HTTP/2 connection, falling back to HTTP/1.1 if not supported.",
+        show_envvar=True,
+        envvar="ANTA_HTTP2",
+        show_default=True,
+        is_flag=True,
+        default=False,
+    )
     @click.option(
         "--inventory",
         "-i",
@@ -214,6 +224,7 @@ def core_options(f: Callable[..., Any]) -> Callable[..., Any]:
         timeout: float,
         insecure: bool,
         disable_cache: bool,
+        http2: bool,
         inventory_format: Literal["json", "yaml"],
         **kwargs: dict[str, Any],
     ) -> Any:
@@ -250,6 +261,7 @@ def core_options(f: Callable[..., Any]) -> Callable[..., Any]:
                 timeout=timeout,
                 insecure=insecure,
                 disable_cache=disable_cache,
+                http2=http2,
                 file_format=inventory_format,
             )
         except (TypeError, ValueError, YAMLError, OSError, InventoryIncorrectSchemaError, InventoryRootKeyError) as e:
@@ -318,6 +330,14 @@ def catalog_options(*, required: bool = True) -> Callable[..., Callable[..., Any
             default="yaml",
             type=click.Choice(["yaml", "json"], case_sensitive=False),
         )
+        @click.option(
+            "--plan-cache",
+            envvar="ANTA_PLAN_CACHE",
+            show_envvar=True,
+            help="Directory of the run plan cache. The parsed catalog and the tests selected per device are restored from this directory "
+            "when the catalog, the inventory and the filters did not change.",
+            type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+        )
         @click.pass_context
         @functools.wraps(f)
         def wrapper(
@@ -325,6 +345,7 @@ def catalog_options(*, required: bool = True) -> Callable[..., Callable[..., Any
             *args: tuple[Any],
             catalog: Path | None,
             catalog_format: Literal["yaml", "json"],
+            plan_cache: Path | None,
             **kwargs: dict[str, Any],
         ) -> Any:
             # If help is invoke somewhere, do not parse catalog
@@ -332,9 +353,13 @@ def catalog_options(*, required: bool = True) -> Callable[..., Callable[..., Any
                 return f(*args, catalog=None, **kwargs)
             if not catalog and not required:
                 return f(*args, catalog=None, **kwargs)
+            ctx.obj["plan_cache"] = plan_cache
             try:
                 file_format = catalog_format.lower()
-                c = AntaCatalog.parse(catalog, file_format=file_format)  # type: ignore[arg-type]
+                if plan_cache is not None:
+                    c = RunPlanCache(plan_cache).load_catalog(catalog, file_format=file_format)  # type: ignore[arg-type]
+                else:
+                    c = AntaCatalog.parse(catalog, file_format=file_format)  # type: ignore[arg-type]
             except (TypeError, ValueError, YAMLError, OSError) as e:
                 anta_log_exception(e, f"Failed to parse the catalog: {catalog}", logger)
                 ctx.exit(ExitCode.USAGE_ERROR)
@@ -49,6 +49,12 @@ MD_REPORT_TOC_WITH_RUN_OVERVIEW = """**Table of Contents:**
   - [Test Results](#test-results)"""
 """Table of Contents for the Markdown report, including Run Overview."""
 
+MD_REPORT_TOC_TEST_TIMINGS = """  - [Test Timings](#test-timings)
+    - [Slowest Tests](#slowest-tests)
+    - [Slowest Devices](#slowest-devices)
+    - [Test Duration Percentiles](#test-duration-percentiles)"""
+"""Table of Contents entries of the Test Timings section of the Markdown report, inserted before the Test Results entry when the results have a timing."""
+
 KNOWN_EOS_ERRORS = [
     r"BGP inactive",
     r"VRF '.*' is not active",
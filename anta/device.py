@@ -6,26 +6,45 @@
 from __future__ import annotations
 
 import asyncio
+import importlib.util
+import json
 import logging
+import re
+import sqlite3
+import zipfile
+import zlib
 from abc import ABC, abstractmethod
 from collections import OrderedDict, defaultdict
+from functools import cache
 from time import monotonic
 from typing import TYPE_CHECKING, Any, Literal
 
 import asyncssh
 import httpcore
 from asyncssh import SSHClientConnection, SSHClientConnectionOptions
-from httpx import ConnectError, HTTPError, TimeoutException
+from httpx import ConnectError, HTTPError, HTTPStatusError, TimeoutException
 
 import asynceapi
 from anta import __DEBUG__
+from anta._circuit_breaker import CircuitOpenError
+from anta._disk_cache import DiskCacheStore
+from anta._replay import ReplayArchive
 from anta.logger import anta_log_exception, exc_to_str
 from anta.models import AntaCommand
+from anta.settings import AntaCacheSettings
+from anta.tools import safe_command
+from asynceapi.aio_portcheck import port_check_url
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
+    from contextlib import AbstractAsyncContextManager
     from pathlib import Path
 
+    from httpx import Response
+
+    from anta._circuit_breaker import CircuitBreaker
+    from anta._retry import RetryPolicy
+    from anta._scheduler import AdaptiveLimiter
     from asynceapi._types import EapiComplexCommand, EapiSimpleCommand
 
 logger = logging.getLogger(__name__)
@@ -42,6 +61,19 @@ MAX_CONCURRENT_REQUESTS = 100
 class AntaCache:
     """Class to be used as cache.
 
+    The cache stores the command outputs of a device in memory. Each entry expires after its own time to live, given
+    when the entry is set or resolved from the TTL rules of the cache with `get_ttl()`. The cache is bounded by a number of
+    entries and optionally by a memory budget: the size of an entry is the length of its text output or of the JSON
+    serialization of its JSON output, and the least recently used entries are evicted to stay within the bounds. Entries
+    larger than `compress_threshold` are stored compressed with zlib and decompressed when read. JSON outputs are only
+    serialized to compute their size when a memory budget or a compression threshold is set, otherwise they are not
+    counted in the `bytes` statistics.
+
+    Subclasses can override `get()`, `set()` and `clear()` to store the entries in another backend, e.g. `AntaDiskCache`.
+
+    The `locks` attribute is kept for backward compatibility: `AntaDevice.collect()` coalesces the concurrent collections
+    of a command instead of locking the cache.
+
     Example
     -------
 
@@ -53,13 +85,43 @@ class AntaCache:
     ```
     """
 
-    def __init__(self, device: str, max_size: int = 128, ttl: int = 60) -> None:
-        """Initialize the cache."""
+    def __init__(
+        self,
+        device: str,
+        max_size: int = 128,
+        ttl: int = 60,
+        *,
+        max_bytes: int | None = None,
+        ttl_rules: dict[str, int] | None = None,
+        compress_threshold: int | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Parameters
+        ----------
+        device
+            Name of the device, used for logging.
+        max_size
+            Maximum number of entries of the cache.
+        ttl
+            Default time in seconds an entry is kept in the cache.
+        max_bytes
+            Maximum total size in bytes of the entries of the cache. None means no memory budget.
+        ttl_rules
+            Mapping of regular expressions to times to live in seconds. The output of a command matching one of the expressions
+            from its start is kept for the time to live of the first matching expression instead of `ttl`.
+        compress_threshold
+            Size in bytes above which the entries are compressed. None means no compression.
+        """
         self.device = device
-        self.cache: OrderedDict[str, Any] = OrderedDict()
+        self.cache: OrderedDict[str, tuple[float, Any, int, bool]] = OrderedDict()
         self.locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self.max_size = max_size
         self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.ttl_rules = [(re.compile(pattern), rule_ttl) for pattern, rule_ttl in (ttl_rules or {}).items()]
+        self.compress_threshold = compress_threshold
+        self._ttls: dict[str, int] = {}
 
         # Stats
         self.stats: dict[str, int] = {}
@@ -68,31 +130,71 @@ class AntaCache:
     def _init_stats(self) -> None:
         """Initialize the stats."""
         self.stats["hits"] = 0
+        self.stats["misses"] = 0
+        self.stats["evictions"] = 0
+        self.stats["bytes"] = 0
         self.stats["total"] = 0
 
+    def get_ttl(self, command: str) -> int:
+        """Return the time to live in seconds of the output of the provided command, from the TTL rules of the cache."""
+        if (ttl := self._ttls.get(command)) is None:
+            ttl = next((rule_ttl for pattern, rule_ttl in self.ttl_rules if pattern.match(command)), self.ttl)
+            self._ttls[command] = ttl
+        return ttl
+
     async def get(self, key: str) -> Any:  # noqa: ANN401
         """Return the cached entry for key."""
         self.stats["total"] += 1
         if key in self.cache:
-            timestamp, value = self.cache[key]
-            if monotonic() - timestamp < self.ttl:
+            expires, value, _, compressed = self.cache[key]
+            if monotonic() < expires:
                 # checking the value is still valid
                 self.cache.move_to_end(key)
                 self.stats["hits"] += 1
-                return value
+                return json.loads(zlib.decompress(value)) if compressed else value
             # Time expired
-            del self.cache[key]
-            del self.locks[key]
+            self._remove(key)
+            self.locks.pop(key, None)
+        self.stats["misses"] += 1
         return None
 
-    async def set(self, key: str, value: Any) -> bool:  # noqa: ANN401
-        """Set the cached entry for key to value."""
-        timestamp = monotonic()
-        if len(self.cache) > self.max_size:
-            self.cache.popitem(last=False)
-        self.cache[key] = timestamp, value
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:  # noqa: ANN401
+        """Set the cached entry for key to value for `ttl` seconds, or the default time to live of the cache if None.
+
+        Returns False if the entry is larger than the memory budget of the cache and is not cached.
+        """
+        if isinstance(value, str):
+            size = len(value)
+        elif self.max_bytes is None and self.compress_threshold is None:
+            # The size of a JSON output is only needed by the memory budget and the compression, do not serialize it
+            size = 0
+        else:
+            data = json.dumps(value)
+            size = len(data)
+        compressed = self.compress_threshold is not None and size > self.compress_threshold
+        if compressed:
+            # Always serialize in JSON to restore the type of the output when decompressed, JSON outputs are not serialized again
+            value = zlib.compress((json.dumps(value) if isinstance(value, str) else data).encode(), level=1)
+            size = len(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            logger.debug("Output of %s on %s is larger than the cache memory budget (%d bytes), not caching it", key, self.device, size)
+            return False
+
+        if key in self.cache:
+            self._remove(key)
+        while self.cache and (len(self.cache) >= self.max_size or (self.max_bytes is not None and self.stats["bytes"] + size > self.max_bytes)):
+            _, (_, _, evicted_size, _) = self.cache.popitem(last=False)
+            self.stats["bytes"] -= evicted_size
+            self.stats["evictions"] += 1
+        self.cache[key] = monotonic() + (ttl if ttl is not None else self.ttl), value, size, compressed
+        self.stats["bytes"] += size
         return True
 
+    def _remove(self, key: str) -> None:
+        """Remove the entry of key from the cache."""
+        _, _, size, _ = self.cache.pop(key)
+        self.stats["bytes"] -= size
+
     def clear(self) -> None:
         """Empty the cache."""
         logger.debug("Clearing cache for device %s", self.device)
@@ -100,6 +202,127 @@ class AntaCache:
         self._init_stats()
 
 
+class AntaDiskCache(AntaCache):
+    """Cache persisting the command outputs of a device in a SQLite database shared across ANTA runs.
+
+    The outputs are stored in a `DiskCacheStore` under the namespace of the device, built from the `_keys` of the device
+    so the outputs of a device are found again by the next runs using the same inventory. The `evictions` and `bytes`
+    statistics are the ones of the whole database.
+
+    The outputs are read and written in a thread, so the collections of the other devices are not blocked while the
+    database is locked, e.g. by the worker processes of a sharded run. `clear()` does not access the database: the outputs
+    stored before the clear are not read anymore by this cache, but are kept in the database for the other runs.
+
+    Example
+    -------
+
+    ```python
+    # Create cache
+    cache = AntaDiskCache("device1", Path("anta-cache.db"), get_namespace=lambda: "device1")
+    with cache.locks[key]:
+        command_output = cache.get(key)
+    ```
+    """
+
+    def __init__(
+        self,
+        device: str,
+        path: Path,
+        *,
+        get_namespace: Callable[[], str],
+        max_size: int = 256 * 1024 * 1024,
+        ttl: int = 60,
+        ttl_rules: dict[str, int] | None = None,
+        compress_threshold: int | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Parameters
+        ----------
+        device
+            Name of the device, used for logging.
+        path
+            Path of the SQLite database file.
+        get_namespace
+            Callable returning the namespace of the device in the database. Called on first use of the cache, so it can rely
+            on attributes of the device set after the initialization of the cache.
+        max_size
+            Maximum total size in bytes of the outputs of the database.
+        ttl
+            Default time in seconds an output is kept in the database.
+        ttl_rules
+            Mapping of regular expressions to times to live in seconds, see `AntaCache`.
+        compress_threshold
+            Size in bytes above which the outputs are compressed. None means no compression.
+        """
+        super().__init__(device, ttl=ttl, ttl_rules=ttl_rules, compress_threshold=compress_threshold)
+        self.store = DiskCacheStore.open(path, max_size)
+        self._get_namespace = get_namespace
+        self._namespace: str | None = None
+        # UIDs of the outputs stored since the last clear, None if the cache was never cleared
+        self._fresh_uids: set[str] | None = None
+
+    @property
+    def namespace(self) -> str:
+        """Namespace of the device in the database."""
+        if self._namespace is None:
+            self._namespace = self._get_namespace()
+        return self._namespace
+
+    async def get(self, key: str) -> Any:  # noqa: ANN401
+        """Return the cached entry for key."""
+        self.stats["total"] += 1
+        if self._fresh_uids is not None and key not in self._fresh_uids:
+            # Stored before the last clear
+            self.stats["misses"] += 1
+            return None
+        try:
+            # The database is accessed in a thread so a database locked by another process does not block the event loop
+            value = await asyncio.to_thread(self.store.get, self.namespace, key)
+        except sqlite3.Error as e:
+            logger.warning("Could not read the cache %s for device %s: %s", self.store.path, self.device, exc_to_str(e))
+            value = None
+        self.stats["hits" if value is not None else "misses"] += 1
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:  # noqa: ANN401
+        """Set the cached entry for key to value for `ttl` seconds, or the default time to live of the cache if None."""
+        try:
+            await asyncio.to_thread(self.store.set, self.namespace, key, value, ttl if ttl is not None else self.ttl, compress_threshold=self.compress_threshold)
+        except sqlite3.Error as e:
+            logger.warning("Could not write the cache %s for device %s: %s", self.store.path, self.device, exc_to_str(e))
+            return False
+        if self._fresh_uids is not None:
+            self._fresh_uids.add(key)
+        self.stats["bytes"] = self.store.size
+        self.stats["evictions"] = self.store.evictions
+        return True
+
+    def clear(self) -> None:
+        """Empty the cache of the device for this run.
+
+        The outputs of the device stored in the database are not deleted, they are kept for the other runs and processes
+        sharing the database and replaced when collected again.
+        """
+        super().clear()
+        self._fresh_uids = set()
+
+
+@cache
+def _get_cache_settings() -> AntaCacheSettings:
+    """Return the cache settings, loaded once per process from the environment variables."""
+    return AntaCacheSettings()
+
+
+@cache
+def _is_http2_available() -> bool:
+    """Return True if the `h2` package required by HTTPX for HTTP/2 is installed, logging a warning once per process otherwise."""
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP/2 is enabled but the 'h2' package is not installed, falling back to HTTP/1.1. Install it with `pip install anta[http2]`")
+        return False
+    return True
+
+
 class AntaDevice(ABC):
     """Abstract class representing a device in ANTA.
 
@@ -122,14 +345,28 @@ class AntaDevice(ABC):
         In-memory cache for this device (None if cache is disabled).
     cache_locks : defaultdict[str, asyncio.Lock] | None
         Dictionary mapping keys to asyncio locks to guarantee exclusive access to the cache if not disabled.
-        Deprecated, will be removed in ANTA v2.0.0, use self.cache.locks instead.
+        Deprecated, will be removed in ANTA v2.0.0. Not used by `collect()` anymore, which coalesces the concurrent calls.
+    coalesced_commands : int
+        Number of commands that shared the output of a concurrent in-flight collection of the same command.
     max_connections : int | None
         For informational/logging purposes only. Can be used by the runner to verify that
         the total potential connections of a run do not exceed the system file descriptor limit.
         This does **not** affect the actual device configuration. None if not available.
+    max_concurrency : int | None
+        Maximum number of tests running concurrently on this device during a run. None means the
+        runner default applies.
+    request_limiter : AdaptiveLimiter | None
+        Adaptive limit of the concurrent requests sent to this device, set by the runner when adaptive concurrency
+        is enabled. Implementations are responsible for using it, e.g. `AsyncEOSDevice`. None if not set.
+    retry_policy : RetryPolicy | None
+        Retry policy of the requests failing with a transient error, set by the runner when retries are enabled.
+        Implementations are responsible for using it, e.g. `AsyncEOSDevice`. None if not set.
+    circuit_breaker : CircuitBreaker | None
+        Circuit breaker failing fast the requests after repeated transport errors, set by the runner when the circuit breaker
+        is enabled. Implementations are responsible for using it, e.g. `AsyncEOSDevice`. None if not set.
     """
 
-    def __init__(self, name: str, tags: set[str] | None = None, *, disable_cache: bool = False) -> None:
+    def __init__(self, name: str, tags: set[str] | None = None, *, disable_cache: bool = False, max_concurrency: int | None = None) -> None:
         """Initialize an AntaDevice.
 
         Parameters
@@ -140,6 +377,8 @@ class AntaDevice(ABC):
             Tags for this device.
         disable_cache
             Disable caching for all commands for this device.
+        max_concurrency
+            Maximum number of tests running concurrently on this device during a run. None means the runner default applies.
 
         """
         self.name: str = name
@@ -149,9 +388,16 @@ class AntaDevice(ABC):
         self.tags.add(self.name)
         self.is_online: bool = False
         self.established: bool = False
+        self.max_concurrency: int | None = max_concurrency
+        self.request_limiter: AdaptiveLimiter | None = None
+        self.retry_policy: RetryPolicy | None = None
+        self.circuit_breaker: CircuitBreaker | None = None
         self.cache: AntaCache | None = None
         # Keeping cache_locks for backward compatibility.
         self.cache_locks: defaultdict[str, asyncio.Lock] | None = None
+        self.coalesced_commands: int = 0
+        # Shared futures of the commands being collected, keyed by command UID
+        self._inflight: dict[str, asyncio.Future[AntaCommand | None]] = {}
 
         # Initialize cache if not disabled
         if not disable_cache:
@@ -176,8 +422,30 @@ class AntaDevice(ABC):
         return hash(self._keys)
 
     def _init_cache(self) -> None:
-        """Initialize cache for the device, can be overridden by subclasses to manipulate how it works."""
-        self.cache = AntaCache(device=self.name, ttl=60)
+        """Initialize cache for the device, can be overridden by subclasses to manipulate how it works.
+
+        The cache is configured with the `AntaCacheSettings` environment variables: when `ANTA_CACHE_PATH` is set, the outputs
+        are persisted across runs in an `AntaDiskCache`, otherwise they are kept in memory in an `AntaCache`.
+        """
+        settings = _get_cache_settings()
+        if settings.path is not None:
+            self.cache = AntaDiskCache(
+                self.name,
+                settings.path,
+                get_namespace=lambda: repr(self._keys),
+                max_size=settings.max_size,
+                ttl=settings.ttl,
+                ttl_rules=settings.ttl_rules,
+                compress_threshold=settings.compress_threshold,
+            )
+        else:
+            self.cache = AntaCache(
+                device=self.name,
+                ttl=settings.ttl,
+                max_bytes=settings.max_memory,
+                ttl_rules=settings.ttl_rules,
+                compress_threshold=settings.compress_threshold,
+            )
         self.cache_locks = self.cache.locks
 
     @property
@@ -186,7 +454,15 @@ class AntaDevice(ABC):
         if self.cache is not None:
             stats = self.cache.stats
             ratio = stats["hits"] / stats["total"] if stats["total"] > 0 else 0
-            return {"total_commands_sent": stats["total"], "cache_hits": stats["hits"], "cache_hit_ratio": f"{ratio * 100:.2f}%"}
+            return {
+                "total_commands_sent": stats["total"],
+                "cache_hits": stats["hits"],
+                "cache_misses": stats["misses"],
+                "cache_evictions": stats["evictions"],
+                "cache_bytes": stats["bytes"],
+                "coalesced_commands": self.coalesced_commands,
+                "cache_hit_ratio": f"{ratio * 100:.2f}%",
+            }
         return None
 
     def __rich_repr__(self) -> Iterator[tuple[str, Any]]:
@@ -240,9 +516,12 @@ class AntaDevice(ABC):
         When caching is activated on both the device and the command,
         this method prioritizes retrieving the output from the cache. In cases where the output isn't cached yet,
         it will be freshly collected and then stored in the cache for future access.
-        The method employs asynchronous locks based on the command's UID to guarantee exclusive access to the cache.
 
-        When caching is NOT enabled, either at the device or command level, the method directly collects the output
+        Concurrent calls for commands with the same UID are coalesced, whether caching is enabled on the device or not:
+        the first call collects the command and the other calls await its completion and share its output. If the first
+        call fails to complete, e.g. if it is cancelled, the waiting calls collect the command again.
+
+        When caching is NOT enabled at the command level, the method directly collects the output
         via the private `_collect` method without interacting with the cache.
 
         Parameters
@@ -252,18 +531,45 @@ class AntaDevice(ABC):
         collection_id
             An identifier used to build the eAPI request ID.
         """
-        if self.cache is not None and command.use_cache:
-            async with self.cache.locks[command.uid]:
-                cached_output = await self.cache.get(command.uid)
+        if not command.use_cache:
+            await self._collect(command=command, collection_id=collection_id)
+            return
+
+        while (inflight := self._inflight.get(command.uid)) is not None:
+            # Shield the shared future so cancelling this call does not cancel the other calls
+            leader = await asyncio.shield(inflight)
+            if leader is not None:
+                logger.debug("Coalesced %s with an in-flight request on %s", command.command, self.name)
+                self.coalesced_commands += 1
+                command.output = leader.output
+                command.errors = list(leader.errors)
+                return
 
-                if cached_output is not None:
-                    logger.debug("Cache hit for %s on %s", command.command, self.name)
-                    command.output = cached_output
-                else:
-                    await self._collect(command=command, collection_id=collection_id)
-                    await self.cache.set(command.uid, command.output)
+        future: asyncio.Future[AntaCommand | None] = asyncio.get_running_loop().create_future()
+        self._inflight[command.uid] = future
+        collected: AntaCommand | None = None
+        try:
+            await self._collect_or_get_cached(command, collection_id=collection_id)
+            collected = command
+        finally:
+            del self._inflight[command.uid]
+            future.set_result(collected)
+
+    async def _collect_or_get_cached(self, command: AntaCommand, *, collection_id: str | None = None) -> None:
+        """Retrieve the output of the command from the cache if available, otherwise collect it and store it in the cache."""
+        if self.cache is None:
+            await self._collect(command=command, collection_id=collection_id)
+            return
+
+        cached_output = await self.cache.get(command.uid)
+        if cached_output is not None:
+            logger.debug("Cache hit for %s on %s", command.command, self.name)
+            command.output = cached_output
+            command.cache_hit = True
         else:
             await self._collect(command=command, collection_id=collection_id)
+            if command.collected:
+                await self.cache.set(command.uid, command.output, ttl=self.cache.get_ttl(command.command))
 
     async def collect_commands(self, commands: list[AntaCommand], *, collection_id: str | None = None) -> None:
         """Collect multiple commands.
@@ -277,6 +583,62 @@ class AntaDevice(ABC):
         """
         await asyncio.gather(*(self.collect(command=command, collection_id=collection_id) for command in commands))
 
+    async def _collect_batch(self, commands: list[AntaCommand], *, collection_id: str | None = None) -> None:
+        """Collect device outputs of multiple commands sharing the same output format and version.
+
+        This default implementation collects each command individually using the `_collect()` coroutine.
+        Subclasses can override this coroutine to collect all the commands in a single request.
+
+        The `_collect_batch()` implementation needs to populate the `output` or `errors` attribute
+        of every `AntaCommand` object passed as argument.
+
+        Parameters
+        ----------
+        commands
+            The commands to collect. All commands have the same `ofmt` and `version` attributes.
+        collection_id
+            An identifier used to build the eAPI request ID.
+        """
+        await asyncio.gather(*(self._collect(command=command, collection_id=collection_id) for command in commands))
+
+    async def collect_batch(self, commands: list[AntaCommand], *, batch_size: int, collection_id: str | None = None) -> None:
+        """Collect multiple commands using multi-command requests.
+
+        When caching is activated on both the device and the command, the output is retrieved from the cache if available.
+        The remaining commands are grouped by output format and version, then split in batches of at most `batch_size`
+        commands. Each batch is collected via the private `_collect_batch()` method and the collected outputs are stored
+        in the cache for future access.
+
+        Parameters
+        ----------
+        commands
+            The commands to collect.
+        batch_size
+            Maximum number of commands per request.
+        collection_id
+            An identifier used to build the eAPI request ID.
+        """
+        pending: list[AntaCommand] = []
+        for command in commands:
+            if self.cache is not None and command.use_cache and (cached_output := await self.cache.get(command.uid)) is not None:
+                logger.debug("Cache hit for %s on %s", command.command, self.name)
+                command.output = cached_output
+                command.cache_hit = True
+            else:
+                pending.append(command)
+
+        # eAPI requests have a single output format and version for all commands
+        groups: defaultdict[tuple[str, int | str], list[AntaCommand]] = defaultdict(list)
+        for command in pending:
+            groups[(command.ofmt, command.version)].append(command)
+        batches = [group[index : index + batch_size] for group in groups.values() for index in range(0, len(group), batch_size)]
+        await asyncio.gather(*(self._collect_batch(batch, collection_id=collection_id) for batch in batches))
+
+        if self.cache is not None:
+            for command in pending:
+                if command.use_cache and command.collected:
+                    await self.cache.set(command.uid, command.output, ttl=self.cache.get_ttl(command.command))
+
     @abstractmethod
     async def refresh(self) -> None:
         """Update attributes of an AntaDevice instance.
@@ -290,6 +652,25 @@ class AntaDevice(ABC):
         - `hw_model`: The hardware model of the device.
         """
 
+    async def check_port(self, timeout: float) -> bool:
+        """Check that the management port of the device accepts connections.
+
+        Used by the reachability sweep of the runner to drop the dead addresses of an inventory before calling `refresh()`.
+        It is not mandatory to implement this for a valid AntaDevice subclass, the device is considered reachable by default.
+
+        Parameters
+        ----------
+        timeout
+            Time in seconds to wait for the port to open.
+
+        Returns
+        -------
+        bool
+            True if the port accepts connections, False otherwise.
+        """
+        _ = timeout
+        return True
+
     async def copy(self, sources: list[Path], destination: Path, direction: Literal["to", "from"] = "from") -> None:
         """Copy files to and from the device, usually through SCP.
 
@@ -325,6 +706,10 @@ class AsyncEOSDevice(AntaDevice):
         Hardware model of the device.
     tags : set[str]
         Tags for this device.
+    http2 : bool
+        True if HTTP/2 is enabled for this device.
+    http_version : str | None
+        HTTP version of the last eAPI response, e.g. `HTTP/2` or `HTTP/1.1`. Only recorded when HTTP/2 is enabled, None otherwise.
     """
 
     def __init__(  # noqa: PLR0913
@@ -343,6 +728,8 @@ class AsyncEOSDevice(AntaDevice):
         enable: bool = False,
         insecure: bool = False,
         disable_cache: bool = False,
+        max_concurrency: int | None = None,
+        http2: bool = False,
     ) -> None:
         """Instantiate an AsyncEOSDevice.
 
@@ -374,6 +761,11 @@ class AsyncEOSDevice(AntaDevice):
             Disable SSH Host Key validation.
         disable_cache
             Disable caching for all commands for this device.
+        max_concurrency
+            Maximum number of tests running concurrently on this device during a run. None means the runner default applies.
+        http2
+            Multiplex the concurrent eAPI requests over a single HTTP/2 connection. The device falls back to HTTP/1.1 if
+            HTTP/2 is not negotiated with EOS, if `proto` is 'http' or if the `h2` package is not installed.
         """
         if host is None:
             message = "'host' is required to create an AsyncEOSDevice"
@@ -381,7 +773,7 @@ class AsyncEOSDevice(AntaDevice):
             raise ValueError(message)
         if name is None:
             name = f"{host}{f':{port}' if port else ''}"
-        super().__init__(name, tags, disable_cache=disable_cache)
+        super().__init__(name, tags, disable_cache=disable_cache, max_concurrency=max_concurrency)
         if username is None:
             message = f"'username' is required to instantiate device '{self.name}'"
             logger.error(message)
@@ -392,7 +784,15 @@ class AsyncEOSDevice(AntaDevice):
             raise ValueError(message)
         self.enable = enable
         self._enable_password = enable_password
-        self._session: asynceapi.Device = asynceapi.Device(host=host, port=port, username=username, password=password, proto=proto, timeout=timeout)
+        self.http2 = http2
+        self.http_version: str | None = None
+        session_kwargs: dict[str, Any] = {}
+        if http2 and _is_http2_available():
+            # HTTP/2 is negotiated with TLS ALPN, HTTPX falls back to HTTP/1.1 if EOS does not support it
+            session_kwargs = {"http2": True, "event_hooks": {"response": [self._record_http_version]}}
+        self._session: asynceapi.Device = asynceapi.Device(
+            host=host, port=port, username=username, password=password, proto=proto, timeout=timeout, **session_kwargs
+        )
         ssh_params: dict[str, Any] = {}
         if insecure:
             ssh_params["known_hosts"] = None
@@ -404,6 +804,40 @@ class AsyncEOSDevice(AntaDevice):
         # TODO: Once we drop Python 3.9 support, initialize the semaphore here
         self._command_semaphore: asyncio.Semaphore | None = None
 
+        # Keep the instantiation parameters to re-create the device when unpickled
+        self._init_kwargs: dict[str, Any] = {
+            "host": host,
+            "username": username,
+            "password": password,
+            "name": name,
+            "enable_password": enable_password,
+            "port": port,
+            "ssh_port": ssh_port,
+            "tags": tags,
+            "timeout": timeout,
+            "proto": proto,
+            "enable": enable,
+            "insecure": insecure,
+            "disable_cache": disable_cache,
+            "max_concurrency": max_concurrency,
+            "http2": http2,
+        }
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of the AsyncEOSDevice instance for pickling.
+
+        The eAPI session and the SSH options cannot be pickled. Only the instantiation parameters and the current
+        `max_concurrency` are pickled and the device is re-created with new sessions when unpickled, e.g. in a worker process.
+
+        The runtime state is not pickled: the unpickled device is not online nor established, has no hardware model,
+        no recorded HTTP version and an empty cache. It must be refreshed before collecting commands.
+        """
+        return {**self._init_kwargs, "max_concurrency": self.max_concurrency}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Re-create the AsyncEOSDevice instance from the pickled instantiation parameters."""
+        self.__init__(**state)  # type: ignore[misc]  # pylint: disable=unnecessary-dunder-call
+
     def __rich_repr__(self) -> Iterator[tuple[str, Any]]:
         """Implement Rich Repr Protocol.
 
@@ -450,12 +884,21 @@ class AsyncEOSDevice(AntaDevice):
 
     @property
     def max_connections(self) -> int | None:
-        """Maximum number of concurrent connections allowed by the device. Returns None if not available."""
+        """Maximum number of concurrent connections allowed by the device. Returns None if not available.
+
+        Once HTTP/2 has been negotiated with the device, the concurrent requests are multiplexed over a single connection.
+        """
+        if self.http_version == "HTTP/2":
+            return 1
         try:
             return self._session._transport._pool._max_connections  # type: ignore[attr-defined]  # noqa: SLF001
         except AttributeError:
             return None
 
+    async def _record_http_version(self, response: Response) -> None:
+        """Record the HTTP version negotiated with the device, used as HTTPX response event hook."""
+        self.http_version = response.http_version
+
     async def _get_semaphore(self) -> asyncio.Semaphore:
         """Return the semaphore, initializing it if needed.
 
@@ -479,12 +922,83 @@ class AsyncEOSDevice(AntaDevice):
         collection_id
             An identifier used to build the eAPI request ID.
         """
+        await self._collect_batch([command], collection_id=collection_id)
+
+    async def _collect_batch(self, commands: list[AntaCommand], *, collection_id: str | None = None) -> None:
+        """Collect device outputs of multiple commands from EOS in a single eAPI request using aio-eapi.
+
+        If a command fails, the commands before it are populated with their outputs and the commands
+        after it, which are not executed by EOS, are collected in a new request.
+
+        If the `retry_policy` attribute is set, a request failing with a retryable transport error is sent again
+        after the backoff delay of the policy. The number of retries is recorded in the `retries` attribute of the commands.
+
+        If the `circuit_breaker` attribute is set and open, the request is not sent and the commands fail immediately.
+
+        Parameters
+        ----------
+        commands
+            The commands to collect. All commands have the same `ofmt` and `version` attributes.
+        collection_id
+            An identifier used to build the eAPI request ID.
+        """
+        not_executed = await self._send_batch_with_retries(commands, collection_id=collection_id)
+
+        if not_executed:
+            await self._collect_batch(not_executed, collection_id=collection_id)
+
+        for command in commands:
+            logger.debug("%s: %s", self.name, command)
+
+    async def _send_batch_with_retries(self, commands: list[AntaCommand], *, collection_id: str | None = None) -> list[AntaCommand]:
+        """Send an eAPI request to collect the provided commands, retried according to the retry policy, and return the commands that have not been executed.
+
+        The commands of a request that could not be sent are populated with the error.
+        """
+        if self.retry_policy is not None:
+            self.retry_policy.requests += 1
+        attempt = 1
+        while True:
+            try:
+                not_executed = await self._send_batch(commands, collection_id=collection_id)
+            except CircuitOpenError as e:  # noqa: PERF203
+                for command in commands:
+                    command.errors = [str(e)]
+                return []
+            except (HTTPError, OSError) as e:
+                # This block catches most of the httpx Exceptions and OSError.
+                delay = self.retry_policy.get_delay(e, attempt) if self.retry_policy is not None else None
+                self._record_transport_failure(e, retried=delay is not None)
+                if delay is None:
+                    self._handle_transport_error(commands, e)
+                    return []
+                logger.debug("Attempt %d of a request to %s failed, retrying in %.2f seconds: %s", attempt, self.name, delay, exc_to_str(e))
+                for command in commands:
+                    command.retries += 1
+                attempt += 1
+                # The request slot is released while waiting
+                await asyncio.sleep(delay)
+            else:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_success()
+                return not_executed
+
+    async def _send_batch(self, commands: list[AntaCommand], *, collection_id: str | None = None) -> list[AntaCommand]:
+        """Send a single eAPI request to collect the provided commands and return the commands that have not been executed.
+
+        Transport errors are raised to the caller, as well as `CircuitOpenError` if the circuit breaker is open.
+        """
+        not_executed: list[AntaCommand] = []
         semaphore = await self._get_semaphore()
+        request_slot: AbstractAsyncContextManager[Any] = self.request_limiter.slot() if self.request_limiter is not None else semaphore
 
-        async with semaphore:
-            commands: list[EapiComplexCommand | EapiSimpleCommand] = []
+        async with request_slot:
+            # Checked once the slot is granted, so the requests queued while the breaker opened fail immediately
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.before_request()
+            eapi_commands: list[EapiComplexCommand | EapiSimpleCommand] = []
             if self.enable and self._enable_password is not None:
-                commands.append(
+                eapi_commands.append(
                     {
                         "cmd": "enable",
                         "input": str(self._enable_password),
@@ -492,50 +1006,88 @@ class AsyncEOSDevice(AntaDevice):
                 )
             elif self.enable:
                 # No password
-                commands.append({"cmd": "enable"})
-            commands += [{"cmd": command.command, "revision": command.revision}] if command.revision else [{"cmd": command.command}]
+                eapi_commands.append({"cmd": "enable"})
+            # Number of outputs to discard from the response
+            offset = len(eapi_commands)
+            eapi_commands += [{"cmd": command.command, "revision": command.revision} if command.revision else {"cmd": command.command} for command in commands]
             try:
                 response = await self._session.cli(
-                    commands=commands,
-                    ofmt=command.ofmt,
-                    version=command.version,
-                    req_id=f"ANTA-{collection_id}-{id(command)}" if collection_id else f"ANTA-{id(command)}",
+                    commands=eapi_commands,
+                    ofmt=commands[0].ofmt,
+                    version=commands[0].version,
+                    req_id=f"ANTA-{collection_id}-{id(commands[0])}" if collection_id else f"ANTA-{id(commands[0])}",
                 )
                 # Do not keep response of 'enable' command
-                command.output = response[-1]
+                for index, command in enumerate(commands, start=len(response) - len(commands)):
+                    command.output = response[index]
             except asynceapi.EapiCommandError as e:
                 # This block catches exceptions related to EOS issuing an error.
+                not_executed = self._handle_eapi_command_error(commands, e, offset)
+        return not_executed
+
+    def _handle_eapi_command_error(self, commands: list[AntaCommand], e: asynceapi.EapiCommandError, offset: int) -> list[AntaCommand]:
+        """Populate the commands of a failed eAPI request and return the commands that have not been executed.
+
+        Parameters
+        ----------
+        commands
+            The commands of the failed eAPI request.
+        e
+            The exception raised by EOS.
+        offset
+            Number of commands sent before the commands to collect, i.e. the 'enable' command.
+        """
+        failed_index = len(e.passed) - offset
+        if failed_index < 0:
+            # The 'enable' command failed, no command has been executed
+            for command in commands:
                 self._log_eapi_command_error(command, e)
-            except TimeoutException as e:
-                # This block catches Timeout exceptions.
-                command.errors = [exc_to_str(e)]
-                timeouts = self._session.timeout.as_dict()
-                logger.error(
-                    "%s occurred while sending a command to %s. Consider increasing the timeout.\nCurrent timeouts: Connect: %s | Read: %s | Write: %s | Pool: %s",
-                    exc_to_str(e),
-                    self.name,
-                    timeouts["connect"],
-                    timeouts["read"],
-                    timeouts["write"],
-                    timeouts["pool"],
-                )
-            except (ConnectError, OSError) as e:
-                # This block catches OSError and socket issues related exceptions.
-                command.errors = [exc_to_str(e)]
-                # pylint: disable=no-member
-                if (isinstance(exc := e.__cause__, httpcore.ConnectError) and isinstance(os_error := exc.__context__, OSError)) or isinstance(
-                    os_error := e, OSError
-                ):
-                    if isinstance(os_error.__cause__, OSError):
-                        os_error = os_error.__cause__
-                    logger.error("A local OS error occurred while connecting to %s: %s.", self.name, os_error)
-                else:
-                    anta_log_exception(e, f"An error occurred while issuing an eAPI request to {self.name}", logger)
-            except HTTPError as e:
-                # This block catches most of the httpx Exceptions and logs a general message.
-                command.errors = [exc_to_str(e)]
+            return []
+        for index, command in enumerate(commands[:failed_index], start=offset):
+            command.output = e.passed[index]
+        self._log_eapi_command_error(commands[failed_index], e)
+        return commands[failed_index + 1 :]
+
+    def _record_transport_failure(self, e: HTTPError | OSError, *, retried: bool) -> None:
+        """Report a failed attempt of an eAPI request to the request limiter if the error is an overload signal, and to the circuit breaker if not retried.
+
+        A request recovered by a retry is not a failure for the circuit breaker, so only the final attempt of a request is reported to it.
+        """
+        if self.circuit_breaker is not None and not retried and not (isinstance(e, HTTPStatusError) and e.response.is_client_error):
+            # HTTP 4xx errors, e.g. authentication failures, are sent by a responsive device
+            self.circuit_breaker.record_failure()
+        if self.request_limiter is not None and (isinstance(e, TimeoutException) or (isinstance(e, HTTPStatusError) and e.response.is_server_error)):
+            # The device is overloaded, reduce the number of concurrent requests
+            self.request_limiter.record_failure(exc_to_str(e))
+
+    def _handle_transport_error(self, commands: list[AntaCommand], e: HTTPError | OSError) -> None:
+        """Populate the errors of the commands of an eAPI request that could not be sent and log the error appropriately."""
+        for command in commands:
+            command.errors = [exc_to_str(e)]
+        if isinstance(e, TimeoutException):
+            # This block catches Timeout exceptions.
+            timeouts = self._session.timeout.as_dict()
+            logger.error(
+                "%s occurred while sending a command to %s. Consider increasing the timeout.\nCurrent timeouts: Connect: %s | Read: %s | Write: %s | Pool: %s",
+                exc_to_str(e),
+                self.name,
+                timeouts["connect"],
+                timeouts["read"],
+                timeouts["write"],
+                timeouts["pool"],
+            )
+        elif isinstance(e, (ConnectError, OSError)):
+            # This block catches OSError and socket issues related exceptions.
+            # pylint: disable=no-member
+            if (isinstance(exc := e.__cause__, httpcore.ConnectError) and isinstance(os_error := exc.__context__, OSError)) or isinstance(os_error := e, OSError):
+                if isinstance(os_error.__cause__, OSError):
+                    os_error = os_error.__cause__
+                logger.error("A local OS error occurred while connecting to %s: %s.", self.name, os_error)
+            else:
                 anta_log_exception(e, f"An error occurred while issuing an eAPI request to {self.name}", logger)
-            logger.debug("%s: %s", self.name, command)
+        else:
+            # Log a general message for other httpx Exceptions.
+            anta_log_exception(e, f"An error occurred while issuing an eAPI request to {self.name}", logger)
 
     def _log_eapi_command_error(self, command: AntaCommand, e: asynceapi.EapiCommandError) -> None:
         """Appropriately log the eapi command error."""
@@ -584,6 +1136,26 @@ class AsyncEOSDevice(AntaDevice):
         else:
             self.established = True
 
+    async def check_port(self, timeout: float) -> bool:
+        """Check that the eAPI port of the device accepts TCP connections using `asynceapi.aio_portcheck.port_check_url`.
+
+        Parameters
+        ----------
+        timeout
+            Time in seconds to wait for the port to open.
+
+        Returns
+        -------
+        bool
+            True if the port accepts connections, False otherwise.
+        """
+        try:
+            return await port_check_url(self._session.base_url, timeout=timeout)
+        except OSError as e:
+            # Connection refused or host unreachable
+            logger.debug("Port check of %s failed: %s", self.name, exc_to_str(e))
+            return False
+
     async def copy(self, sources: list[Path], destination: Path, direction: Literal["to", "from"] = "from") -> None:
         """Copy files to and from the device using asyncssh.scp().
 
@@ -626,3 +1198,137 @@ class AsyncEOSDevice(AntaDevice):
 
                 return
             await asyncssh.scp(src, dst)
+
+
+class ReplayDevice(AntaDevice):
+    """Implementation of AntaDevice serving the command outputs captured by `anta exec snapshot`, without any network I/O.
+
+    The JSON outputs of a device are read from `<source>/<name>/json/<command>.json` and the text outputs from
+    `<source>/<name>/text/<command>.log`, where `<command>` is the command sanitized with `anta.tools.safe_command()`.
+    The source can also be a ZIP archive of a snapshot directory, see `ReplayArchive`. The version and revision of the
+    commands are ignored, the outputs are the ones captured by the snapshot.
+
+    Attributes
+    ----------
+    name : str
+        Device name.
+    is_online : bool
+        True if the source has outputs for the device.
+    established : bool
+        True if the source has outputs for the device.
+    hw_model : str | None
+        Hardware model of the device, from the `show version` output of the source if captured.
+    tags : set[str]
+        Tags for this device.
+    source : Path
+        Snapshot directory or ZIP archive of a snapshot directory.
+    archive : ReplayArchive | None
+        Archive of the outputs if the source is a ZIP archive, None otherwise.
+    """
+
+    def __init__(
+        self, name: str, source: Path | ReplayArchive, tags: set[str] | None = None, *, disable_cache: bool = False, max_concurrency: int | None = None
+    ) -> None:
+        """Instantiate a ReplayDevice.
+
+        Parameters
+        ----------
+        name
+            Device name, i.e. the name of the directory of the device in the snapshot.
+        source
+            Snapshot directory written by `anta exec snapshot`, ZIP archive of a snapshot directory, or `ReplayArchive` shared
+            by the devices replaying the same archive. An archive opened from a path is owned by the device and closed by `close()`,
+            a shared `ReplayArchive` must be closed by its owner.
+        tags
+            Tags for this device.
+        disable_cache
+            Disable caching for all commands for this device.
+        max_concurrency
+            Maximum number of tests running concurrently on this device during a run. None means the runner default applies.
+        """
+        super().__init__(name, tags, disable_cache=disable_cache, max_concurrency=max_concurrency)
+        self.source: Path
+        self.archive: ReplayArchive | None
+        if isinstance(source, ReplayArchive):
+            self.source, self.archive = source.path, source
+            self._owns_archive = False
+        else:
+            self.source = source
+            self._owns_archive = source.is_file()
+            self.archive = ReplayArchive(source) if self._owns_archive else None
+
+        # Keep the instantiation parameters to re-create the device when unpickled
+        self._init_kwargs: dict[str, Any] = {"name": name, "source": source, "tags": tags, "disable_cache": disable_cache, "max_concurrency": max_concurrency}
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of the ReplayDevice instance for pickling, i.e. its instantiation parameters."""
+        return self._init_kwargs
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Re-create the ReplayDevice instance from the pickled instantiation parameters."""
+        self.__init__(**state)  # type: ignore[misc]  # pylint: disable=unnecessary-dunder-call
+
+    @property
+    def _keys(self) -> tuple[Any, ...]:
+        """Two ReplayDevice objects are equal if they replay the same device of the same source."""
+        return (str(self.source), self.name)
+
+    def close(self) -> None:
+        """Close the archive of the device if it owns it."""
+        if self._owns_archive and self.archive is not None:
+            self.archive.close()
+
+    def _read_output(self, directory: str, filename: str) -> str | None:
+        """Return the content of an output file of the device in the source, None if it does not exist."""
+        if self.archive is not None:
+            return self.archive.read(self.name, directory, filename)
+        try:
+            return (self.source / self.name / directory / filename).read_text(encoding="UTF-8")
+        except FileNotFoundError:
+            return None
+
+    async def _collect(self, command: AntaCommand, *, collection_id: str | None = None) -> None:  # noqa: ARG002
+        """Collect the output of the command from the source.
+
+        Parameters
+        ----------
+        command
+            The command to collect.
+        collection_id
+            Not used by this implementation.
+        """
+        directory, extension = ("json", "json") if command.ofmt == "json" else ("text", "log")
+        try:
+            output = self._read_output(directory, f"{safe_command(command.command)}.{extension}")
+            if output is None:
+                command.errors = [f"Output not found in {self.source}"]
+                logger.error("Output of command '%s' not found for %s in %s", command.command, self.name, self.source)
+                return
+            command.output = json.loads(output) if command.ofmt == "json" else output
+        except (OSError, ValueError, zipfile.BadZipFile) as e:
+            command.errors = [exc_to_str(e)]
+            anta_log_exception(e, f"Cannot read the output of command '{command.command}' for {self.name} in {self.source}", logger)
+
+    async def refresh(self) -> None:
+        """Update attributes of a ReplayDevice instance.
+
+        The device is online and established if the source has outputs for the device. The hardware model is read from
+        the `show version` output of the source if captured.
+        """
+        if self.archive is not None:
+            try:
+                devices = self.archive.devices
+            except (OSError, zipfile.BadZipFile) as e:
+                anta_log_exception(e, f"Cannot open the replay archive {self.source}", logger)
+                devices = set()
+            self.is_online = self.name in devices
+        else:
+            self.is_online = (self.source / self.name).is_dir()
+        self.established = self.is_online
+        if not self.is_online:
+            logger.warning("No outputs found for device %s in %s", self.name, self.source)
+            return
+
+        show_version = AntaCommand(command="show version")
+        await self._collect(show_version)
+        self.hw_model = show_version.json_output.get("modelName") if show_version.collected else None
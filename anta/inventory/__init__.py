@@ -10,16 +10,19 @@ import logging
 from ipaddress import ip_address, ip_network
 from json import load as json_load
 from pathlib import Path
-from typing import Any, ClassVar, Literal
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 from pydantic import ValidationError
 from yaml import YAMLError, safe_load
 
-from anta.device import AntaDevice, AsyncEOSDevice
+from anta.device import AntaDevice, AsyncEOSDevice, ReplayDevice
 from anta.inventory.exceptions import InventoryIncorrectSchemaError, InventoryRootKeyError
 from anta.inventory.models import AntaInventoryHost, AntaInventoryInput
 from anta.logger import anta_log_exception
 
+if TYPE_CHECKING:
+    from anta._replay import ReplayArchive
+
 logger = logging.getLogger(__name__)
 
 
@@ -80,11 +83,13 @@ class AntaInventory(dict[str, AntaDevice]):
 
         for host in inventory_input.hosts:
             updated_kwargs = AntaInventory._update_disable_cache(kwargs, inventory_disable_cache=host.disable_cache)
+            updated_kwargs["http2"] = host.http2 or kwargs.get("http2", False)
             device = AsyncEOSDevice(
                 name=host.name,
                 host=str(host.host),
                 port=host.port,
                 tags=host.tags,
+                max_concurrency=host.max_concurrency,
                 **updated_kwargs,
             )
             inventory.add_device(device)
@@ -118,8 +123,9 @@ class AntaInventory(dict[str, AntaDevice]):
         try:
             for network in inventory_input.networks:
                 updated_kwargs = AntaInventory._update_disable_cache(kwargs, inventory_disable_cache=network.disable_cache)
+                updated_kwargs["http2"] = network.http2 or kwargs.get("http2", False)
                 for host_ip in ip_network(str(network.network)):
-                    device = AsyncEOSDevice(host=str(host_ip), tags=network.tags, **updated_kwargs)
+                    device = AsyncEOSDevice(host=str(host_ip), tags=network.tags, max_concurrency=network.max_concurrency, **updated_kwargs)
                     inventory.add_device(device)
         except ValueError as e:
             message = "Could not parse the network section in the inventory"
@@ -155,12 +161,13 @@ class AntaInventory(dict[str, AntaDevice]):
         try:
             for range_def in inventory_input.ranges:
                 updated_kwargs = AntaInventory._update_disable_cache(kwargs, inventory_disable_cache=range_def.disable_cache)
+                updated_kwargs["http2"] = range_def.http2 or kwargs.get("http2", False)
                 range_increment = ip_address(str(range_def.start))
                 range_stop = ip_address(str(range_def.end))
                 while range_increment <= range_stop:  # type: ignore[operator]
                     # mypy raise an issue about comparing IPv4Address and IPv6Address
                     # but this is handled by the ipaddress module natively by raising a TypeError
-                    device = AsyncEOSDevice(host=str(range_increment), tags=range_def.tags, **updated_kwargs)
+                    device = AsyncEOSDevice(host=str(range_increment), tags=range_def.tags, max_concurrency=range_def.max_concurrency, **updated_kwargs)
                     inventory.add_device(device)
                     range_increment += 1
         except ValueError as e:
@@ -184,6 +191,7 @@ class AntaInventory(dict[str, AntaDevice]):
         enable: bool = False,
         insecure: bool = False,
         disable_cache: bool = False,
+        http2: bool = False,
     ) -> AntaInventory:
         """Create an AntaInventory instance from an inventory file.
 
@@ -209,6 +217,8 @@ class AntaInventory(dict[str, AntaDevice]):
             Disable SSH Host Key validation.
         disable_cache
             Disable cache globally.
+        http2
+            Enable HTTP/2 globally. HTTP/2 can also be enabled per device, network or range in the inventory file.
 
         Raises
         ------
@@ -231,6 +241,7 @@ class AntaInventory(dict[str, AntaDevice]):
             "timeout": timeout,
             "insecure": insecure,
             "disable_cache": disable_cache,
+            "http2": http2,
         }
 
         try:
@@ -333,6 +344,27 @@ class AntaInventory(dict[str, AntaDevice]):
             potential_connections += device.max_connections
         return None if not all_have_connections else potential_connections
 
+    def replay(self, source: Path | ReplayArchive) -> AntaInventory:
+        """Return an inventory replaying the command outputs captured by `anta exec snapshot` for the devices of this inventory.
+
+        Parameters
+        ----------
+        source
+            Snapshot directory, or `ReplayArchive` of a ZIP archive of a snapshot directory. The archive is shared by the
+            devices so it is indexed once, the caller is responsible for closing it.
+
+        Returns
+        -------
+        AntaInventory
+            An inventory of `ReplayDevice` objects with the names, tags and settings of the devices of this inventory.
+        """
+        inventory = AntaInventory()
+        for device in self.devices:
+            inventory.add_device(
+                ReplayDevice(device.name, source, tags=set(device.tags), disable_cache=device.cache is None, max_concurrency=device.max_concurrency)
+            )
+        return inventory
+
     ###########################################################################
     # SET methods
     ###########################################################################
@@ -376,14 +408,22 @@ class AntaInventory(dict[str, AntaDevice]):
 
         Each hosts is dumped individually.
         """
-        hosts = [
-            AntaInventoryHost(
-                name=device.name,
-                host=device.host if hasattr(device, "host") else device.name,
-                port=device.port if hasattr(device, "port") else None,
-                tags=device.tags,
-                disable_cache=device.cache is None,
+        hosts = []
+        for device in self.devices:
+            # Only dump max_concurrency and http2 when set to keep the output of existing inventories unchanged
+            optional_fields: dict[str, Any] = {}
+            if device.max_concurrency is not None:
+                optional_fields["max_concurrency"] = device.max_concurrency
+            if getattr(device, "http2", False):
+                optional_fields["http2"] = True
+            hosts.append(
+                AntaInventoryHost(
+                    name=device.name,
+                    host=device.host if hasattr(device, "host") else device.name,
+                    port=device.port if hasattr(device, "port") else None,
+                    tags=device.tags,
+                    disable_cache=device.cache is None,
+                    **optional_fields,
+                )
             )
-            for device in self.devices
-        ]
         return AntaInventoryInput(hosts=hosts)
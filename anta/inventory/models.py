@@ -9,7 +9,7 @@ import logging
 import math
 
 import yaml
-from pydantic import BaseModel, ConfigDict, FieldSerializationInfo, IPvAnyAddress, IPvAnyNetwork, field_serializer
+from pydantic import BaseModel, ConfigDict, FieldSerializationInfo, IPvAnyAddress, IPvAnyNetwork, PositiveInt, field_serializer
 
 from anta.custom_types import Hostname, Port
 
@@ -43,6 +43,10 @@ class AntaInventoryHost(AntaInventoryBaseModel):
         Tags of the device.
     disable_cache : bool
         Disable cache for this device.
+    max_concurrency : PositiveInt | None
+        Maximum number of tests running concurrently on this device.
+    http2 : bool
+        Enable HTTP/2 for this device.
 
     """
 
@@ -51,6 +55,8 @@ class AntaInventoryHost(AntaInventoryBaseModel):
     port: Port | None = None
     tags: set[str] | None = None
     disable_cache: bool = False
+    max_concurrency: PositiveInt | None = None
+    http2: bool = False
 
 
 class AntaInventoryNetwork(AntaInventoryBaseModel):
@@ -64,12 +70,18 @@ class AntaInventoryNetwork(AntaInventoryBaseModel):
         Tags of the devices in this network.
     disable_cache : bool
         Disable cache for all devices in this network.
+    max_concurrency : PositiveInt | None
+        Maximum number of tests running concurrently on each device in this network.
+    http2 : bool
+        Enable HTTP/2 for all devices in this network.
 
     """
 
     network: IPvAnyNetwork
     tags: set[str] | None = None
     disable_cache: bool = False
+    max_concurrency: PositiveInt | None = None
+    http2: bool = False
 
 
 class AntaInventoryRange(AntaInventoryBaseModel):
@@ -85,6 +97,10 @@ class AntaInventoryRange(AntaInventoryBaseModel):
         Tags of the devices in this IP range.
     disable_cache : bool
         Disable cache for all devices in this IP range.
+    max_concurrency : PositiveInt | None
+        Maximum number of tests running concurrently on each device in this IP range.
+    http2 : bool
+        Enable HTTP/2 for all devices in this IP range.
 
     """
 
@@ -92,6 +108,8 @@ class AntaInventoryRange(AntaInventoryBaseModel):
     end: IPvAnyAddress
     tags: set[str] | None = None
     disable_cache: bool = False
+    max_concurrency: PositiveInt | None = None
+    http2: bool = False
 
 
 class AntaInventoryInput(BaseModel):
@@ -11,14 +11,15 @@ import re
 from abc import ABC, abstractmethod
 from functools import wraps
 from string import Formatter
-from typing import TYPE_CHECKING, Any, Callable, ClassVar, Literal, TypeVar
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Literal, TypeVar, cast
 
-from pydantic import BaseModel, ConfigDict, ValidationError, create_model
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, create_model
 
 from anta.constants import EOS_BLACKLIST_CMDS, KNOWN_EOS_ERRORS, UNSUPPORTED_PLATFORM_ERRORS
 from anta.custom_types import Revision
 from anta.logger import anta_log_exception, exc_to_str
-from anta.result_manager.models import AntaTestStatus, TestResult
+from anta.result_manager.models import AntaTestStatus, TestResult, TestTiming
 
 if TYPE_CHECKING:
     from collections.abc import Coroutine
@@ -165,6 +166,10 @@ class AntaCommand(BaseModel):
         Pydantic Model containing the variables values used to render the template.
     use_cache
         Enable or disable caching for this AntaCommand if the AntaDevice supports it.
+    cache_hit
+        True if the output has been served from the AntaDevice cache. Not serialized.
+    retries
+        Number of times the request of this command has been retried after a transient failure. Not serialized.
 
     """
 
@@ -179,6 +184,8 @@ class AntaCommand(BaseModel):
     errors: list[str] = []
     params: AntaParamsBaseModel = AntaParamsBaseModel()
     use_cache: bool = True
+    cache_hit: bool = Field(default=False, exclude=True)
+    retries: int = Field(default=0, exclude=True)
 
     @property
     def uid(self) -> str:
@@ -223,6 +230,11 @@ class AntaCommand(BaseModel):
         """
         return not self.error and self.output is not None
 
+    @property
+    def blocked(self) -> bool:
+        """Return True if the command matches a blocked keyword, False otherwise."""
+        return any(re.match(pattern, self.command) for pattern in EOS_BLACKLIST_CMDS)
+
     @property
     def requires_privileges(self) -> bool:
         """Return True if the command requires privileged mode, False otherwise.
@@ -358,6 +370,10 @@ class AntaTest(ABC):
     categories: ClassVar[list[str]]
     commands: ClassVar[list[AntaTemplate | AntaCommand]]
 
+    # Static estimate of the duration of the test in seconds, used by the runner to schedule the longest tests first
+    # when no duration has been recorded for the test. Defaults to an estimate based on the number of commands.
+    duration_hint: ClassVar[float | None] = None
+
     # Class attributes to handle the progress bar of ANTA CLI
     progress: Progress | None = None
     nrfu_task: TaskID | None = None
@@ -575,22 +591,26 @@ class AntaTest(ABC):
         """Check if CLI commands contain a blocked keyword."""
         state = False
         for command in self.instance_commands:
-            for pattern in EOS_BLACKLIST_CMDS:
-                if re.match(pattern, command.command):
-                    self.logger.error(
-                        "Command <%s> is blocked for security reason matching %s",
-                        command.command,
-                        EOS_BLACKLIST_CMDS,
-                    )
-                    self.result.is_error(f"<{command.command}> is blocked for security reason")
-                    state = True
+            if command.blocked:
+                self.logger.error(
+                    "Command <%s> is blocked for security reason matching %s",
+                    command.command,
+                    EOS_BLACKLIST_CMDS,
+                )
+                self.result.is_error(f"<{command.command}> is blocked for security reason")
+                state = True
         return state
 
     async def collect(self) -> None:
-        """Collect outputs of all commands of this test class from the device of this test instance."""
+        """Collect outputs of all commands of this test class from the device of this test instance.
+
+        Commands that have already been collected, or that already returned an error, are not collected again.
+        This is the case when the ANTA runner collected the commands beforehand in multi-command requests.
+        """
         try:
             if self.blocked is False:
-                await self.device.collect_commands(self.instance_commands, collection_id=self.name)
+                commands = [command for command in self.instance_commands if not command.collected and not command.error]
+                await self.device.collect_commands(commands, collection_id=self.name)
         except Exception as e:  # noqa: BLE001
             # device._collect() is user-defined code.
             # We need to catch everything if we want the AntaTest object
@@ -638,40 +658,55 @@ class AntaTest(ABC):
             if self.result.result != "unset":
                 return self.result
 
-            # Data
-            if eos_data is not None:
-                self.save_commands_data(eos_data)
-                self.logger.debug("Test %s initialized with input data %s", self.name, eos_data)
-
-            # If some data is missing, try to collect
-            if not self.collected:
-                await self.collect()
-                if self.result.result != "unset":
-                    AntaTest.update_progress()
-                    return self.result
-
-                if self.failed_commands:
-                    self._handle_failed_commands()
-
-                    AntaTest.update_progress()
-                    return self.result
-
+            start = perf_counter()
+            self.result.timing = TestTiming()
             try:
-                function(self, **kwargs)
-            except Exception as e:  # noqa: BLE001
-                # test() is user-defined code.
-                # We need to catch everything if we want the AntaTest object
-                # to live until the reporting
-                message = f"Exception raised for test {self.name} (on device {self.device.name})"
-                anta_log_exception(e, message, self.logger)
-                self.result.is_error(message=exc_to_str(e))
-
-            # TODO: find a correct way to time test execution
+                await self._run_test(function, eos_data, **kwargs)
+            finally:
+                self.result.timing.total = perf_counter() - start
             AntaTest.update_progress()
             return self.result
 
         return wrapper
 
+    async def _run_test(self, function: F, eos_data: list[dict[Any, Any] | str] | None, **kwargs: dict[str, Any]) -> None:
+        """Collect the commands if needed and run the `test()` method, recording the timing of each phase in the test result.
+
+        Called by the `anta_test` decorator. The `timing` attribute of the test result must be set.
+        """
+        timing = cast("TestTiming", self.result.timing)
+
+        # Data
+        if eos_data is not None:
+            self.save_commands_data(eos_data)
+            self.logger.debug("Test %s initialized with input data %s", self.name, eos_data)
+
+        # If some data is missing, try to collect
+        if not self.collected:
+            start = perf_counter()
+            await self.collect()
+            timing.collection = perf_counter() - start
+            timing.cache_hits = sum(command.cache_hit for command in self.instance_commands)
+            timing.retries = sum(command.retries for command in self.instance_commands)
+            if self.result.result != "unset":
+                return
+
+            if self.failed_commands:
+                self._handle_failed_commands()
+                return
+
+        start = perf_counter()
+        try:
+            function(self, **kwargs)
+        except Exception as e:  # noqa: BLE001
+            # test() is user-defined code.
+            # We need to catch everything if we want the AntaTest object
+            # to live until the reporting
+            message = f"Exception raised for test {self.name} (on device {self.device.name})"
+            anta_log_exception(e, message, self.logger)
+            self.result.is_error(message=exc_to_str(e))
+        timing.evaluation = perf_counter() - start
+
     def _handle_failed_commands(self) -> None:
         """Handle failed commands inside a test.
 
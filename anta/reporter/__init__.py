@@ -19,6 +19,7 @@ from anta.tools import convert_categories
 if TYPE_CHECKING:
     import pathlib
 
+    from anta._cost import RunCostEstimate
     from anta.result_manager import ResultManager
     from anta.result_manager.models import AntaTestStatus, TestResult
 
@@ -226,6 +227,62 @@ class ReportTable:
                 )
         return table
 
+    def report_cost(self, estimate: RunCostEstimate, title: str = "Dry-run cost estimate") -> Table:
+        """Create a table report with the cost estimate of an ANTA run per device.
+
+        Create table with full output: Device | # of tests | # of commands | # of unique commands | # of requests | Request bytes |
+        # of batched requests | Batched request bytes | # of connections | Estimated duration
+
+        Parameters
+        ----------
+        estimate
+            A RunCostEstimate instance.
+        title
+            Title for the report. Defaults to 'Dry-run cost estimate'.
+
+        Returns
+        -------
+        Table
+            A fully populated rich `Table`.
+        """
+
+        def format_duration(duration: float | None) -> str:
+            return f"{duration:.1f}s" if duration is not None else "N/A"
+
+        caption = [
+            f"Total eAPI requests: {estimate.total_requests} ({'with' if estimate.batching else 'without'} batching)",
+            f"Expected connections: {estimate.total_connections} (file descriptor limit: {estimate.file_descriptor_limit})",
+            f"Estimated duration: {format_duration(estimate.duration)}",
+        ]
+        table = Table(title=title, caption="\n".join(caption), show_lines=True)
+        headers = [
+            "Device",
+            "# of tests",
+            "# of commands",
+            "# of unique commands",
+            "# of requests",
+            "Request bytes",
+            f"# of batched requests (batch size: {estimate.batch_size if estimate.batch_size is not None else 'unlimited'})",
+            "Batched request bytes",
+            "# of connections",
+            "Estimated duration",
+        ]
+        table = self._build_headers(headers=headers, table=table)
+        for device in estimate.devices:
+            table.add_row(
+                device.name,
+                str(device.tests),
+                str(device.commands),
+                str(device.unique_commands),
+                str(device.requests),
+                str(device.request_bytes),
+                str(device.batched_requests),
+                str(device.batched_request_bytes),
+                str(device.connections),
+                format_duration(estimate.get_device_duration(device)),
+            )
+        return table
+
 
 class ReportJinja:
     """Report builder based on a Jinja2 template."""
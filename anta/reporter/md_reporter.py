@@ -11,9 +11,10 @@ from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, ClassVar, TextIO
 
-from anta.constants import ACRONYM_CATEGORIES, MD_REPORT_TOC, MD_REPORT_TOC_WITH_RUN_OVERVIEW
+from anta.constants import ACRONYM_CATEGORIES, MD_REPORT_TOC, MD_REPORT_TOC_TEST_TIMINGS, MD_REPORT_TOC_WITH_RUN_OVERVIEW
 from anta.logger import anta_log_exception
 from anta.result_manager.models import AntaTestStatus
+from anta.result_manager.timing import ResultTimings
 from anta.tools import convert_categories
 
 if TYPE_CHECKING:
@@ -33,7 +34,7 @@ class MDReportBase(ABC):
     to generate and write content to the provided markdown file.
     """
 
-    def __init__(self, mdfile: TextIO, results: ResultManager, extra_data: dict[str, Any] | None = None) -> None:
+    def __init__(self, mdfile: TextIO, results: ResultManager, extra_data: dict[str, Any] | None = None, *, timings: ResultTimings | None = None) -> None:
         """Initialize the MDReportBase with an open markdown file object to write to and a ResultManager instance.
 
         Parameters
@@ -44,10 +45,20 @@ class MDReportBase(ABC):
             The ResultsManager instance containing all test results.
         extra_data
             Optional extra data dictionary. Can be used by subclasses to render additional data.
+        timings
+            Duration statistics of the results, shared by the sections of a report. Computed from the results on first use if not provided.
         """
         self.mdfile = mdfile
         self.results = results
         self.extra_data = extra_data
+        self._timings = timings
+
+    @property
+    def timings(self) -> ResultTimings:
+        """Duration statistics of the results."""
+        if self._timings is None:
+            self._timings = ResultTimings(self.results.results)
+        return self._timings
 
     @abstractmethod
     def generate_section(self) -> None:
@@ -263,6 +274,9 @@ class ANTAReport(MDReportBase):
         """Generate the `# ANTA Report` section of the markdown report."""
         self.write_heading(heading_level=1)
         toc = MD_REPORT_TOC_WITH_RUN_OVERVIEW if self.extra_data else MD_REPORT_TOC
+        if self.timings:
+            test_results_entry = "  - [Test Results](#test-results)"
+            toc = toc.replace(test_results_entry, f"{MD_REPORT_TOC_TEST_TIMINGS}\n{test_results_entry}")
         self.mdfile.write(toc + "\n\n")
 
 
@@ -390,6 +404,81 @@ class SummaryTotalsPerCategory(MDReportBase):
         self.write_table(table_heading=self.TABLE_HEADING)
 
 
+class TestTimings(MDReportBase):
+    """Generate the `## Test Timings` section of the markdown report. Only generated if the results have a timing."""
+
+    def generate_section(self) -> None:
+        """Generate the `## Test Timings` section of the markdown report."""
+        if self.timings:
+            self.write_heading(heading_level=2)
+
+
+class SlowestTests(MDReportBase):
+    """Generate the `### Slowest Tests` section of the markdown report. Only generated if the results have a timing."""
+
+    TABLE_HEADING: ClassVar[list[str]] = [
+        "| Device Under Test | Test | Total (s) | Queue Wait (s) | Collection (s) | Evaluation (s) | Cache Hits |",
+        "| ----------------- | ---- | --------- | -------------- | -------------- | -------------- | ---------- |",
+    ]
+
+    def generate_rows(self) -> Generator[str, None, None]:
+        """Generate the rows of the slowest tests table."""
+        for result in self.timings.get_slowest_tests():
+            if (timing := result.timing) is None:
+                continue
+            queue_wait = f"{timing.queue_wait:.3f}" if timing.queue_wait is not None else "-"
+            yield (
+                f"| {result.name} | {result.test} | {timing.total:.3f} | {queue_wait} | {timing.collection:.3f} | {timing.evaluation:.3f} | {timing.cache_hits} |\n"
+            )
+
+    def generate_section(self) -> None:
+        """Generate the `### Slowest Tests` section of the markdown report."""
+        if self.timings:
+            self.write_heading(heading_level=3)
+            self.write_table(table_heading=self.TABLE_HEADING)
+
+
+class SlowestDevices(MDReportBase):
+    """Generate the `### Slowest Devices` section of the markdown report. Only generated if the results have a timing."""
+
+    TABLE_HEADING: ClassVar[list[str]] = [
+        "| Device Under Test | Total Tests | Cumulated Duration (s) | Mean (s) | Max (s) |",
+        "| ----------------- | ----------- | ---------------------- | -------- | ------- |",
+    ]
+
+    def generate_rows(self) -> Generator[str, None, None]:
+        """Generate the rows of the slowest devices table."""
+        for device, stat in self.timings.get_slowest_devices().items():
+            yield f"| {device} | {stat.count} | {stat.total:.3f} | {stat.mean:.3f} | {stat.max:.3f} |\n"
+
+    def generate_section(self) -> None:
+        """Generate the `### Slowest Devices` section of the markdown report."""
+        if self.timings:
+            self.write_heading(heading_level=3)
+            self.write_table(table_heading=self.TABLE_HEADING)
+
+
+class TestDurationPercentiles(MDReportBase):
+    """Generate the `### Test Duration Percentiles` section of the markdown report. Only generated if the results have a timing."""
+
+    TABLE_HEADING: ClassVar[list[str]] = [
+        "| Test | Runs | Mean (s) | P50 (s) | P90 (s) | P95 (s) | Max (s) |",
+        "| ---- | ---- | -------- | ------- | ------- | ------- | ------- |",
+    ]
+
+    def generate_rows(self) -> Generator[str, None, None]:
+        """Generate the rows of the test duration percentiles table, slowest tests first."""
+        stats = sorted(self.timings.test_stats.items(), key=lambda item: item[1].p95, reverse=True)
+        for test, stat in stats:
+            yield f"| {test} | {stat.count} | {stat.mean:.3f} | {stat.p50:.3f} | {stat.p90:.3f} | {stat.p95:.3f} | {stat.max:.3f} |\n"
+
+    def generate_section(self) -> None:
+        """Generate the `### Test Duration Percentiles` section of the markdown report."""
+        if self.timings:
+            self.write_heading(heading_level=3)
+            self.write_table(table_heading=self.TABLE_HEADING)
+
+
 class TestResults(MDReportBase):
     """Generates the `## Test Results` section of the markdown report."""
 
@@ -436,6 +525,10 @@ class MDReportGenerator:
         SummaryTotals,
         SummaryTotalsDeviceUnderTest,
         SummaryTotalsPerCategory,
+        TestTimings,
+        SlowestTests,
+        SlowestDevices,
+        TestDurationPercentiles,
         TestResults,
     ]
 
@@ -452,10 +545,12 @@ class MDReportGenerator:
         extra_data
             Optional extra data dictionary that can be used by the section generators to render additional data.
         """
+        # The duration statistics are computed once and shared by the sections
+        timings = ResultTimings(results.results)
         try:
             with md_filename.open("w", encoding="utf-8") as mdfile:
                 for section in cls.DEFAULT_SECTIONS:
-                    section(mdfile, results, extra_data).generate_section()
+                    section(mdfile, results, extra_data, timings=timings).generate_section()
         except OSError as exc:
             message = f"OSError caught while writing the Markdown file '{md_filename.resolve()}'."
             anta_log_exception(exc, message, logger)
@@ -474,10 +569,14 @@ class MDReportGenerator:
         extra_data
             Optional extra data dictionary that can be used by the section generators to render additional data.
         """
+        # The duration statistics are computed once per result manager and shared by its sections
+        timings: dict[int, ResultTimings] = {}
         try:
             with md_filename.open("w", encoding="utf-8") as md_file:
                 for section, rm in sections:
-                    section(md_file, rm, extra_data).generate_section()
+                    if id(rm) not in timings:
+                        timings[id(rm)] = ResultTimings(rm.results)
+                    section(md_file, rm, extra_data, timings=timings[id(rm)]).generate_section()
         except OSError as exc:
             message = f"OSError caught while writing the Markdown file '{md_filename.resolve()}'."
             anta_log_exception(exc, message, logger)
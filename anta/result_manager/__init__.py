@@ -20,6 +20,9 @@ from .models import CategoryStats, DeviceStats, TestStats
 
 logger = logging.getLogger(__name__)
 
+SORTABLE_FIELDS = ("name", "test", "categories", "description", "result", "messages", "custom_field")
+"""TestResult fields accepted to sort the results."""
+
 
 class ResultManager:
     """Manager of ANTA Results.
@@ -248,7 +251,7 @@ class ResultManager:
         results = self._result_entries if status is None else list(chain.from_iterable(self.results_by_status.get(status, []) for status in status))
 
         if sort_by:
-            accepted_fields = TestResult.model_fields.keys()
+            accepted_fields = SORTABLE_FIELDS
             if not set(sort_by).issubset(set(accepted_fields)):
                 msg = f"Invalid sort_by fields: {sort_by}. Accepted fields are: {list(accepted_fields)}"
                 raise ValueError(msg)
@@ -290,7 +293,7 @@ class ResultManager:
         sort_by
             List of TestResult fields to sort the results.
         """
-        accepted_fields = TestResult.model_fields.keys()
+        accepted_fields = SORTABLE_FIELDS
         if not set(sort_by).issubset(set(accepted_fields)):
             msg = f"Invalid sort_by fields: {sort_by}. Accepted fields are: {list(accepted_fields)}"
             raise ValueError(msg)
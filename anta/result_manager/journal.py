@@ -0,0 +1,120 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Result journal module for ANTA."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
+
+from pydantic import ValidationError
+
+from anta.result_manager import ResultManager
+from anta.result_manager.models import TestResult
+
+if TYPE_CHECKING:
+    import sys
+    from types import TracebackType
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+logger = logging.getLogger(__name__)
+
+
+class ResultJournal:
+    """Append-only journal of ANTA test results.
+
+    Each `TestResult` is written to the journal file as a JSON line as soon as it is appended, so the results of
+    an interrupted run can be loaded with `load()` to resume the run. The file is flushed after each line.
+
+    Attributes
+    ----------
+    path : Path
+        Path of the journal file.
+    append : bool
+        If True, the results are appended to the existing journal file. Otherwise, the file is overwritten.
+
+    Examples
+    --------
+    ```python
+    with ResultJournal("journal.jsonl") as journal:
+        asyncio.run(runner.run(inventory, catalog, result_callbacks=[journal.add]))
+    ```
+    """
+
+    def __init__(self, path: str | Path, *, append: bool = False) -> None:
+        """Initialize a ResultJournal instance."""
+        self.path = path if isinstance(path, Path) else Path(path)
+        self.append = append
+        self._file: TextIO | None = None
+
+    def __enter__(self) -> Self:
+        """Open the journal file."""
+        self.open()
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None:
+        """Close the journal file."""
+        self.close()
+
+    def open(self) -> None:
+        """Open the journal file for writing."""
+        self._file = self.path.open(mode="a" if self.append else "w", encoding="UTF-8")
+
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def add(self, result: TestResult) -> None:
+        """Write a test result to the journal file.
+
+        Can be used as a result callback of `AntaRunner.run()`.
+        """
+        if self._file is None:
+            msg = f"Journal {self.path} is not open"
+            raise RuntimeError(msg)
+        self._file.write(f"{result.model_dump_json()}\n")
+        self._file.flush()
+
+    @staticmethod
+    def load(path: str | Path) -> ResultManager:
+        """Load the test results recorded in a journal file.
+
+        Invalid lines are ignored, e.g. the last line of the journal of a run interrupted while writing it.
+
+        Parameters
+        ----------
+        path
+            Path of the journal file.
+
+        Returns
+        -------
+        ResultManager
+            A ResultManager with the test results recorded in the journal.
+        """
+        manager = ResultManager()
+        file = path if isinstance(path, Path) else Path(path)
+        with file.open(encoding="UTF-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    manager.add(TestResult.model_validate_json(line))
+                except ValidationError:
+                    logger.warning("Ignoring invalid test result at line %d of journal %s", line_number, file)
+        return manager
+
+    @staticmethod
+    def get_recorded_tests(manager: ResultManager) -> set[tuple[str, str, str]]:
+        """Return the (device name, test name, test definition fingerprint) tuples of the test results of a journal.
+
+        The results without fingerprint are ignored. It can be used as the `excluded_tests` filter of a resumed run.
+        """
+        return {(result.name, result.test, result.fingerprint) for result in manager.results if result.fingerprint is not None}
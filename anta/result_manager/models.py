@@ -28,6 +28,33 @@ class AntaTestStatus(str, Enum):
         return self.value
 
 
+class TestTiming(BaseModel):
+    """Describe the wall-clock timing of a test, in seconds.
+
+    Attributes
+    ----------
+    queue_wait : float | None
+        Time spent waiting for a slot of the ANTA runner scheduler. None if the test was not scheduled by the runner.
+    collection : float
+        Time spent collecting the commands of the test.
+    evaluation : float
+        Time spent running the `test()` method.
+    total : float
+        Total time of the test, from the start of the test coroutine, excluding `queue_wait`.
+    cache_hits : int
+        Number of commands served from the device cache.
+    retries : int
+        Number of retries of the requests of the test commands after a transient failure.
+    """
+
+    queue_wait: float | None = None
+    collection: float = 0.0
+    evaluation: float = 0.0
+    total: float = 0.0
+    cache_hits: int = 0
+    retries: int = 0
+
+
 class TestResult(BaseModel):
     """Describe the result of a test from a single device.
 
@@ -47,6 +74,11 @@ class TestResult(BaseModel):
         Messages to report after the test, if any.
     custom_field : str | None
         Custom field to store a string for flexibility in integrating with ANTA.
+    timing : TestTiming | None
+        Timing of the test. None if the test has not been run.
+    fingerprint : str | None
+        Fingerprint of the test definition, i.e. the test and its inputs, from the catalog of the run.
+        None if the test has not been run from a catalog.
 
     """
 
@@ -57,6 +89,8 @@ class TestResult(BaseModel):
     result: AntaTestStatus = AntaTestStatus.UNSET
     messages: list[str] = []
     custom_field: str | None = None
+    timing: TestTiming | None = None
+    fingerprint: str | None = None
 
     def is_success(self, message: str | None = None) -> None:
         """Set status to success.
@@ -147,6 +181,19 @@ class CategoryStats:
     tests_unset_count: int = 0
 
 
+@dataclass
+class TimingStats:
+    """Duration statistics of a test or a device for a run of tests, in seconds."""
+
+    count: int = 0
+    total: float = 0.0
+    mean: float = 0.0
+    p50: float = 0.0
+    p90: float = 0.0
+    p95: float = 0.0
+    max: float = 0.0
+
+
 @dataclass
 class TestStats:
     """Test statistics for a run of tests."""
@@ -0,0 +1,111 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Duration statistics of ANTA test results."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from anta.result_manager.models import TimingStats
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from anta.result_manager.models import TestResult
+
+
+class ResultTimings:
+    """Duration statistics of test results, computed once from the results with a timing.
+
+    Results without timing, e.g. results of a previous run loaded from a report, are ignored.
+
+    Attributes
+    ----------
+    ranked_results : list[TestResult]
+        Results with a timing sorted by descending total duration.
+    test_stats : dict[str, TimingStats]
+        Duration statistics of each test across the devices, sorted by test name.
+    device_stats : dict[str, TimingStats]
+        Duration statistics of the tests of each device, sorted by device name.
+    """
+
+    def __init__(self, results: Iterable[TestResult]) -> None:
+        """Initialize a ResultTimings instance.
+
+        Parameters
+        ----------
+        results
+            The test results.
+        """
+        timed_results = [result for result in results if result.timing is not None]
+        self.ranked_results = sorted(timed_results, key=_get_total, reverse=True)
+        self.test_stats = _compute_timing_stats(timed_results, lambda result: result.test)
+        self.device_stats = _compute_timing_stats(timed_results, lambda result: result.name)
+
+    def __bool__(self) -> bool:
+        """Return True if at least one result has a timing."""
+        return bool(self.ranked_results)
+
+    def get_slowest_tests(self, count: int = 10) -> list[TestResult]:
+        """Get the results with the longest total duration.
+
+        Parameters
+        ----------
+        count
+            Maximum number of results to return.
+
+        Returns
+        -------
+        list[TestResult]
+            Results sorted by descending total duration.
+        """
+        return self.ranked_results[:count]
+
+    def get_slowest_devices(self, count: int = 10) -> dict[str, TimingStats]:
+        """Get the duration statistics of the devices with the longest cumulated test duration.
+
+        Parameters
+        ----------
+        count
+            Maximum number of devices to return.
+
+        Returns
+        -------
+        dict[str, TimingStats]
+            Duration statistics per device name, sorted by descending cumulated test duration.
+        """
+        return dict(sorted(self.device_stats.items(), key=lambda item: item[1].total, reverse=True)[:count])
+
+
+def _get_total(result: TestResult) -> float:
+    """Return the total duration of a result, 0 if it has no timing."""
+    return result.timing.total if result.timing is not None else 0.0
+
+
+def _compute_timing_stats(results: list[TestResult], key: Callable[[TestResult], str]) -> dict[str, TimingStats]:
+    """Compute the duration statistics of the results grouped by the provided key function, sorted by key."""
+    durations: defaultdict[str, list[float]] = defaultdict(list)
+    for result in results:
+        durations[key(result)].append(_get_total(result))
+
+    stats: dict[str, TimingStats] = {}
+    for name, values in sorted(durations.items()):
+        values.sort()
+        stats[name] = TimingStats(
+            count=len(values),
+            total=sum(values),
+            mean=sum(values) / len(values),
+            p50=_percentile(values, 50),
+            p90=_percentile(values, 90),
+            p95=_percentile(values, 95),
+            max=values[-1],
+        )
+    return stats
+
+
+def _percentile(sorted_values: list[float], percent: int) -> float:
+    """Return the percentile of a sorted list of values using the nearest-rank method."""
+    rank = max(1, -(-percent * len(sorted_values) // 100))
+    return sorted_values[rank - 1]
@@ -8,11 +8,13 @@ from __future__ import annotations
 import logging
 import os
 import sys
+from pathlib import Path
 from typing import Any
 
-from pydantic import Field, PositiveInt
+from pydantic import Field, PositiveFloat, PositiveInt
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from anta._retry import DEFAULT_RETRY_ON
 from anta.logger import exc_to_str
 
 logger = logging.getLogger(__name__)
@@ -47,12 +49,157 @@ class AntaRunnerSettings(BaseSettings):
         Environment variable: ANTA_MAX_CONCURRENCY
 
         The maximum number of concurrent tests that can run in the event loop. Defaults to 50000.
+
+    device_max_concurrency : PositiveInt | None
+        Environment variable: ANTA_DEVICE_MAX_CONCURRENCY
+
+        The maximum number of concurrent tests that can run on a single device. Can be overridden per device with the
+        `max_concurrency` key of the inventory. Defaults to None (no per-device limit).
+
+    workers : PositiveInt
+        Environment variable: ANTA_WORKERS
+
+        The number of worker processes of the run. When greater than 1, the selected inventory is sharded across the
+        worker processes, each one running the tests of its devices with its own event loop and device sessions.
+        Devices must be picklable, which is the case of `AsyncEOSDevice`. Defaults to 1 (no worker process).
+
+    worker_pool : bool
+        Environment variable: ANTA_WORKER_POOL
+
+        Run the tests with a pool of `max_concurrency` workers that instantiate the tests lazily when a worker is available,
+        so the memory usage scales with the concurrency instead of the total number of tests. Commands are not prefetched
+        in this mode. Defaults to False.
+
+    prefetch : bool
+        Environment variable: ANTA_PREFETCH
+
+        Collect the commands of all the tests scheduled on a device before running the tests. Each unique command
+        is collected only once per device and its output is shared with all the tests. Defaults to False.
+
+    batch_size : PositiveInt | None
+        Environment variable: ANTA_BATCH_SIZE
+
+        The maximum number of commands sent in a single request to a device. When set, the commands are prefetched
+        in multi-command requests, regardless of the `prefetch` setting. Defaults to None (disabled).
+
+    pipeline : bool
+        Environment variable: ANTA_PIPELINE
+
+        Connect to the devices and run the tests in a single pipelined stage: the tests of a device are scheduled as soon
+        as the device is connected instead of waiting for the connection attempts to all the devices. Not supported in
+        worker pool mode. Defaults to False.
+
+    adaptive_concurrency : bool
+        Environment variable: ANTA_ADAPTIVE_CONCURRENCY
+
+        Adapt the number of concurrent requests sent to each device and across all the devices to the observed latency:
+        the limits are raised while the p95 latency is stable and halved on timeouts or HTTP 5xx errors. The adjustments
+        are recorded in the run context. Defaults to False.
+
+    plan_cache : Path | None
+        Environment variable: ANTA_PLAN_CACHE
+
+        Directory of the persistent run plan cache. When set, the parsed test catalog and the tests selected per device
+        are stored in this directory and restored by the next runs if the catalog file, the inventory devices, the filters
+        and the ANTA version did not change. Defaults to None (disabled).
+
+    duration_history : Path | None
+        Environment variable: ANTA_DURATION_HISTORY
+
+        Path of the JSON file recording the durations of the tests per device. When set, the tests with the longest
+        recorded durations are scheduled first, falling back to the `duration_hint` of the test classes, and the file
+        is updated at the end of each run. Defaults to None (catalog order).
+
+    deadline : PositiveFloat | None
+        Environment variable: ANTA_DEADLINE
+
+        The maximum duration of the run in seconds, including the connection to the devices. Tests not started before
+        the deadline or still running at the deadline are marked as error, so the results are reported on time. The
+        tests of the devices still connecting at the deadline are marked as error too.
+        Defaults to None (no deadline).
+
+    test_timeout : PositiveFloat | None
+        Environment variable: ANTA_TEST_TIMEOUT
+
+        The maximum duration of a test in seconds, from the collection of its commands to its evaluation. The time spent
+        waiting for a concurrency slot is not included. Tests running longer are marked as error. Defaults to None (no timeout).
+
+    retry_attempts : PositiveInt
+        Environment variable: ANTA_RETRY_ATTEMPTS
+
+        The maximum number of attempts of an eAPI request failing with a transient error, including the first one.
+        The retries of a device are bounded by a budget proportional to its number of requests, so they do not amplify
+        the load of a struggling device. Defaults to 1 (no retry).
+
+    retry_backoff : PositiveFloat
+        Environment variable: ANTA_RETRY_BACKOFF
+
+        The base delay in seconds of the exponential backoff between the attempts of a request. The delay before a retry
+        is drawn uniformly between 0 and the backoff, which doubles after each attempt. Defaults to 0.5.
+
+    retry_max_backoff : PositiveFloat
+        Environment variable: ANTA_RETRY_MAX_BACKOFF
+
+        The maximum delay in seconds before a retry. Defaults to 10.0.
+
+    retry_on : list[str]
+        Environment variable: ANTA_RETRY_ON
+
+        The names of the retryable exception classes, as a JSON list. A failure is retried if the name of its exception
+        class or of one of its base classes is in this list. Defaults to `["TimeoutException", "NetworkError", "RemoteProtocolError"]`,
+        i.e. the HTTPX timeouts, network errors and protocol errors.
+
+    circuit_breaker_threshold : PositiveInt | None
+        Environment variable: ANTA_CIRCUIT_BREAKER_THRESHOLD
+
+        The number of consecutive transport errors, after the retries, opening the circuit breaker of a device. While the
+        breaker is open, the eAPI requests of the device fail immediately instead of waiting for their own timeout.
+        Defaults to None (no circuit breaker).
+
+    circuit_breaker_cooldown : PositiveFloat
+        Environment variable: ANTA_CIRCUIT_BREAKER_COOLDOWN
+
+        The time in seconds an open circuit breaker waits before sending a single probe request to the device. The breaker
+        closes if the probe succeeds and opens again otherwise. Defaults to 30.0.
+
+    sweep_timeout : PositiveFloat | None
+        Environment variable: ANTA_SWEEP_TIMEOUT
+
+        The timeout in seconds of the TCP port check of the reachability sweep. When set, the management port of each device
+        is checked before connecting to the devices and the devices not accepting connections are removed from the run
+        as unreachable devices, so the empty addresses of the `networks` and `ranges` of an inventory do not wait on the
+        connection timeouts. Defaults to None (no sweep).
+
+    sweep_concurrency : PositiveInt
+        Environment variable: ANTA_SWEEP_CONCURRENCY
+
+        The maximum number of concurrent port checks of the reachability sweep. Each port check opens a file descriptor,
+        see `nofile`. Defaults to 256.
     """
 
     model_config = SettingsConfigDict(env_prefix="ANTA_")
 
     nofile: PositiveInt = Field(default=DEFAULT_NOFILE)
     max_concurrency: PositiveInt = Field(default=DEFAULT_MAX_CONCURRENCY)
+    device_max_concurrency: PositiveInt | None = Field(default=None)
+    workers: PositiveInt = Field(default=1)
+    worker_pool: bool = Field(default=False)
+    prefetch: bool = Field(default=False)
+    batch_size: PositiveInt | None = Field(default=None)
+    pipeline: bool = Field(default=False)
+    adaptive_concurrency: bool = Field(default=False)
+    plan_cache: Path | None = Field(default=None)
+    duration_history: Path | None = Field(default=None)
+    deadline: PositiveFloat | None = Field(default=None)
+    test_timeout: PositiveFloat | None = Field(default=None)
+    retry_attempts: PositiveInt = Field(default=1)
+    retry_backoff: PositiveFloat = Field(default=0.5)
+    retry_max_backoff: PositiveFloat = Field(default=10.0)
+    retry_on: list[str] = Field(default_factory=lambda: list(DEFAULT_RETRY_ON))
+    circuit_breaker_threshold: PositiveInt | None = Field(default=None)
+    circuit_breaker_cooldown: PositiveFloat = Field(default=30.0)
+    sweep_timeout: PositiveFloat | None = Field(default=None)
+    sweep_concurrency: PositiveInt = Field(default=256)
 
     # Computed in post-init
     _file_descriptor_limit: PositiveInt
@@ -85,3 +232,59 @@ class AntaRunnerSettings(BaseSettings):
     def file_descriptor_limit(self) -> PositiveInt:
         """The maximum number of file descriptors available to the process."""
         return self._file_descriptor_limit
+
+
+class AntaCacheSettings(BaseSettings):
+    """Environment variables for configuring the command output cache of the devices.
+
+    Attributes
+    ----------
+    path : Path | None
+        Environment variable: ANTA_CACHE_PATH
+
+        The path of a SQLite database file persisting the command outputs across ANTA runs. The outputs are keyed by
+        the device and the command, so consecutive runs on the same devices, e.g. with different tags, do not collect
+        the outputs again until they expire. Defaults to None (in-memory cache of the process).
+
+    ttl : PositiveInt
+        Environment variable: ANTA_CACHE_TTL
+
+        The time in seconds a command output is kept in the cache. Defaults to 60.
+
+    max_size : PositiveInt
+        Environment variable: ANTA_CACHE_MAX_SIZE
+
+        The maximum total size in bytes of the command outputs of the persistent cache. The least recently used outputs
+        are evicted once the size is exceeded. Defaults to 268435456 (256 MiB).
+
+    max_memory : PositiveInt | None
+        Environment variable: ANTA_CACHE_MAX_MEMORY
+
+        The memory budget in bytes of the in-memory cache of each device. The size of a command output is the length of its
+        text output or of the JSON serialization of its JSON output, once compressed if applicable. The least recently used
+        outputs are evicted to stay within the budget and larger outputs are not cached. The budget applies to each device,
+        the memory used by the cache of an inventory can reach this budget times the number of devices. Setting a budget
+        serializes the JSON outputs when they are cached to compute their size. Defaults to None (no memory budget).
+
+    ttl_rules : dict[str, PositiveInt]
+        Environment variable: ANTA_CACHE_TTL_RULES
+
+        The times to live in seconds of the outputs of specific commands, as a JSON mapping of regular expressions matching
+        the start of the commands to times to live, e.g. `{"show version": 3600, "show interfaces counters": 5}`. The first
+        matching expression applies, the other commands use `ttl`. Defaults to `{}`.
+
+    compress_threshold : PositiveInt | None
+        Environment variable: ANTA_CACHE_COMPRESS_THRESHOLD
+
+        The size in bytes above which the command outputs are compressed with zlib in the cache, trading CPU time for memory
+        or disk space. Defaults to None (no compression).
+    """
+
+    model_config = SettingsConfigDict(env_prefix="ANTA_CACHE_")
+
+    path: Path | None = Field(default=None)
+    ttl: PositiveInt = Field(default=60)
+    max_size: PositiveInt = Field(default=256 * 1024 * 1024)
+    max_memory: PositiveInt | None = Field(default=None)
+    ttl_rules: dict[str, PositiveInt] = Field(default_factory=dict)
+    compress_threshold: PositiveInt | None = Field(default=None)
@@ -33,7 +33,7 @@ __all__ = ["port_check_url"]
 # -----------------------------------------------------------------------------
 
 
-async def port_check_url(url: URL, timeout: int = 5) -> bool:
+async def port_check_url(url: URL, timeout: float = 5) -> bool:
     """Open the port designated by the URL given the timeout in seconds.
 
     Parameters
@@ -57,6 +57,7 @@ async def port_check_url(url: URL, timeout: int = 5) -> bool:
         # MUST close if opened!
         wr.close()
 
-    except TimeoutError:
+    # asyncio.TimeoutError is not the builtin TimeoutError before Python 3.11
+    except asyncio.TimeoutError:
         return False
     return True
@@ -77,6 +77,32 @@ def test__setup_tests(benchmark: BenchmarkFixture, catalog: AntaCatalog, invento
     assert ctx.total_tests_scheduled == len(inventory) * len(catalog.tests)
 
 
+@pytest.mark.parametrize(
+    "inventory",
+    [
+        pytest.param({"count": 10, "disable_cache": True, "reachable": True}, id="10-devices"),
+        pytest.param({"count": 100, "disable_cache": True, "reachable": True}, id="100-devices"),
+    ],
+    indirect=True,
+)
+def test__setup_tests_per_device(benchmark: BenchmarkFixture, catalog: AntaCatalog, inventory: AntaInventory) -> None:
+    """Benchmark `anta._runner.AntaRunner._setup_tests` on larger inventories.
+
+    The test definitions fingerprints are computed when the catalog is loaded, the time per device should be flat in device count.
+    """
+    runner = AntaRunner()
+    ctx = AntaRunContext(inventory=inventory, catalog=catalog, manager=ResultManager(), filters=AntaRunFilters(), selected_inventory=inventory)
+
+    def bench() -> None:
+        catalog.clear_indexes()
+        runner._setup_tests(ctx)
+
+    benchmark(bench)
+
+    assert ctx.total_devices_selected_for_testing == len(inventory)
+    assert ctx.total_tests_scheduled == len(inventory) * len(catalog.tests)
+
+
 def test__get_test_coroutines(benchmark: BenchmarkFixture, catalog: AntaCatalog, inventory: AntaInventory) -> None:
     """Benchmark `anta._runner.AntaRunner._get_test_coroutines`."""
     runner = AntaRunner()
@@ -5,14 +5,21 @@
 
 from __future__ import annotations
 
+import json
+import shutil
 from pathlib import Path
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
+import pytest
+
+from anta._replay import ReplayArchive
+from anta._runner import AntaRunFilters
 from anta.cli import anta
 from anta.cli.utils import ExitCode
+from anta.settings import AntaRunnerSettings
 
 if TYPE_CHECKING:
-    import pytest
     from click.testing import CliRunner
 
 DATA_DIR: Path = Path(__file__).parents[3].resolve() / "data"
@@ -50,6 +57,81 @@ def test_anta_nrfu_dry_run(click_runner: CliRunner) -> None:
     assert "ANTA Inventory contains 3 devices" in result.output
     assert "Tests catalog contains 1 tests" in result.output
     assert "Dry-run" in result.output
+    assert "Dry-run cost estimate" in result.output
+
+
+def test_anta_nrfu_dry_run_history(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test anta nrfu --dry-run with --history and the JSON cost estimate."""
+    report = tmp_path / "results.json"
+    result = click_runner.invoke(anta, ["nrfu", "json", "--output", str(report)])
+    assert result.exit_code == ExitCode.OK
+
+    estimate = tmp_path / "estimate.json"
+    result = click_runner.invoke(anta, ["nrfu", "--dry-run", "--history", str(report), "json", "--output", str(estimate)])
+    assert result.exit_code == ExitCode.OK
+    cost = json.loads(estimate.read_text(encoding="UTF-8"))
+    assert len(cost["devices"]) == 3
+    assert cost["total_requests"] == 3
+    assert cost["request_latency"] is not None
+    assert cost["duration"] is not None
+
+
+def test_anta_nrfu_plan_cache(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test anta nrfu --plan-cache."""
+    result = click_runner.invoke(anta, ["nrfu", "--plan-cache", str(tmp_path), "--dry-run"])
+    assert result.exit_code == ExitCode.OK
+    # The catalog and the tests selection are stored in the cache
+    assert len(list(tmp_path.iterdir())) == 2
+
+    with patch("anta.cli.nrfu.utils.AntaRunnerSettings", wraps=AntaRunnerSettings) as settings:
+        result = click_runner.invoke(anta, ["nrfu", "--plan-cache", str(tmp_path), "--dry-run"])
+    assert result.exit_code == ExitCode.OK
+    settings.assert_called_once_with(plan_cache=tmp_path)
+    assert "Test catalog" in result.output
+    assert "loaded from the plan cache" in result.output
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_anta_nrfu_workers(click_runner: CliRunner) -> None:
+    """Test anta nrfu --workers."""
+    with patch("anta.cli.nrfu.utils.AntaRunnerSettings", wraps=AntaRunnerSettings) as settings:
+        result = click_runner.invoke(anta, ["nrfu", "--dry-run", "--workers", "2"])
+    assert result.exit_code == ExitCode.OK
+    settings.assert_called_once_with(workers=2)
+
+
+def test_anta_nrfu_deadline(click_runner: CliRunner) -> None:
+    """Test anta nrfu --deadline and --test-timeout."""
+    with patch("anta.cli.nrfu.utils.AntaRunnerSettings", wraps=AntaRunnerSettings) as settings:
+        result = click_runner.invoke(anta, ["nrfu", "--deadline", "600", "--test-timeout", "30"])
+    assert result.exit_code == ExitCode.OK
+    settings.assert_called_once_with(deadline=600.0, test_timeout=30.0)
+    assert "VerifyEOSVersion" in result.output
+
+
+@pytest.mark.parametrize("archive", [pytest.param(False, id="directory"), pytest.param(True, id="archive")])
+def test_anta_nrfu_replay_dir(click_runner: CliRunner, tmp_path: Path, *, archive: bool) -> None:
+    """Test anta nrfu --replay-dir."""
+    snapshot = tmp_path / "snapshot"
+    for name, version in (("leaf1", "4.31.1F"), ("leaf2", "4.31.1F"), ("spine1", "4.30.2F")):
+        (snapshot / name / "json").mkdir(parents=True)
+        (snapshot / name / "json" / "show_version.json").write_text(json.dumps({"modelName": "DCS-7280CR3-32P4-F", "version": version}), encoding="UTF-8")
+    if archive:
+        snapshot = Path(shutil.make_archive(str(snapshot), "zip", snapshot))
+    with patch.object(ReplayArchive, "close", autospec=True, side_effect=ReplayArchive.close) as close_mock:
+        result = click_runner.invoke(anta, ["nrfu", "--replay-dir", str(snapshot), "json", "--output", str(tmp_path / "results.json")])
+    assert result.exit_code == ExitCode.TESTS_FAILED
+    # The archive is closed when the command exits
+    assert close_mock.call_count == archive
+    results = json.loads((tmp_path / "results.json").read_text(encoding="UTF-8"))
+    assert sorted((res["name"], res["result"]) for res in results) == [("leaf1", "success"), ("leaf2", "success"), ("spine1", "failure")]
+
+
+def test_anta_nrfu_wrong_workers(click_runner: CliRunner) -> None:
+    """Test anta nrfu --workers with an invalid value."""
+    result = click_runner.invoke(anta, ["nrfu", "--dry-run", "--workers", "0"])
+    assert result.exit_code == ExitCode.USAGE_ERROR
+    assert "Invalid value for '--workers'" in result.output
 
 
 def test_anta_nrfu_wrong_catalog_format(click_runner: CliRunner) -> None:
@@ -143,3 +225,88 @@ def test_invalid_catalog(caplog: pytest.LogCaptureFixture, click_runner: CliRunn
     assert "CRITICAL" in caplog.text
     assert "Failed to parse the catalog" in caplog.text
     assert result.exit_code == ExitCode.USAGE_ERROR
+
+
+def test_anta_nrfu_journal_resume(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test anta nrfu --journal and --resume."""
+    journal = tmp_path / "journal.jsonl"
+    result = click_runner.invoke(anta, ["nrfu", "--journal", str(journal), "json"])
+    assert result.exit_code == ExitCode.OK
+    lines = journal.read_text(encoding="UTF-8").splitlines()
+    assert len(lines) == 3
+
+    # Simulate an interrupted run that recorded the first test result only
+    journal.write_text(f"{lines[0]}\n", encoding="UTF-8")
+    with patch("anta.cli.nrfu.utils.AntaRunFilters", wraps=AntaRunFilters) as filters:
+        result = click_runner.invoke(anta, ["nrfu", "--resume", str(journal), "json", "--output", str(tmp_path / "results.json")])
+    assert result.exit_code == ExitCode.OK
+    recorded = json.loads(lines[0])
+    assert filters.call_args.kwargs["excluded_tests"] == {(recorded["name"], recorded["test"], recorded["fingerprint"])}
+    # The new results are appended to the journal and merged with the recorded results
+    assert len(journal.read_text(encoding="UTF-8").splitlines()) == 3
+    results = json.loads((tmp_path / "results.json").read_text(encoding="UTF-8"))
+    assert results[0]["name"] == recorded["name"]
+    assert sorted(res["name"] for res in results) == sorted(json.loads(line)["name"] for line in lines)
+
+    # The results of the resumed run are written to a new journal
+    new_journal = tmp_path / "new_journal.jsonl"
+    result = click_runner.invoke(anta, ["nrfu", "--resume", str(journal), "--journal", str(new_journal), "json"])
+    assert result.exit_code == ExitCode.OK
+    assert new_journal.read_text(encoding="UTF-8") == journal.read_text(encoding="UTF-8")
+
+
+def test_anta_nrfu_resume_missing_journal(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test anta nrfu --resume with a journal that does not exist."""
+    result = click_runner.invoke(anta, ["nrfu", "--resume", str(tmp_path / "journal.jsonl")])
+    assert result.exit_code == ExitCode.USAGE_ERROR
+    assert "Invalid value for '--resume'" in result.output
+
+
+def test_anta_nrfu_rerun_from(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test anta nrfu --rerun-from."""
+    report = tmp_path / "results.json"
+    result = click_runner.invoke(anta, ["nrfu", "json", "--output", str(report)])
+    assert result.exit_code == ExitCode.OK
+    previous_results = json.loads(report.read_text(encoding="UTF-8"))
+    assert len(previous_results) == 3
+    # A previous run with a failed test on the first device
+    previous_results[0]["result"] = "failure"
+    report.write_text(json.dumps(previous_results), encoding="UTF-8")
+
+    with patch("anta.cli.nrfu.utils.AntaRunFilters", wraps=AntaRunFilters) as filters:
+        result = click_runner.invoke(anta, ["nrfu", "--rerun-from", str(report), "--status", "failure", "json", "--output", str(tmp_path / "rerun.json")])
+    assert result.exit_code == ExitCode.OK
+    assert filters.call_args.kwargs["included_tests"] == {(previous_results[0]["name"], previous_results[0]["test"], previous_results[0]["fingerprint"])}
+    # The result of the test run again replaces the failed result
+    results = json.loads((tmp_path / "rerun.json").read_text(encoding="UTF-8"))
+    assert [(res["name"], res["result"]) for res in results] == [(res["name"], "success") for res in [*previous_results[1:], previous_results[0]]]
+
+
+def test_anta_nrfu_rerun_from_invalid(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test anta nrfu --rerun-from with an invalid report and --status with an invalid status."""
+    report = tmp_path / "results.json"
+    report.write_text('{"not": "a list"}', encoding="UTF-8")
+    result = click_runner.invoke(anta, ["nrfu", "--rerun-from", str(report)])
+    assert result.exit_code == ExitCode.USAGE_ERROR
+    assert f"Unable to load the test results from {report}" in result.output
+
+    result = click_runner.invoke(anta, ["nrfu", "--rerun-from", str(report), "--status", "failure,oops"])
+    assert result.exit_code == ExitCode.USAGE_ERROR
+    assert "'failure,oops' is not a valid list of statuses" in result.output
+
+
+def test_anta_nrfu_watch(click_runner: CliRunner) -> None:
+    """Test anta nrfu --watch."""
+    result = click_runner.invoke(anta, ["nrfu", "--watch", "0.01", "--watch-count", "3", "--snapshot-every", "2", "text"])
+    assert result.exit_code == ExitCode.OK
+    # All the results of the first and third runs are rendered
+    assert result.output.count("All test results") == 2
+    assert result.output.count("No test status changed since the previous run") == 1
+    assert result.output.count("VerifyEOSVersion :: SUCCESS") == 6
+
+
+def test_anta_nrfu_watch_unsupported_option(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test anta nrfu --watch with an unsupported option."""
+    result = click_runner.invoke(anta, ["nrfu", "--watch", "1", "--journal", str(tmp_path / "journal.jsonl")])
+    assert result.exit_code == ExitCode.USAGE_ERROR
+    assert "--journal is not supported with --watch" in result.output
@@ -0,0 +1,28 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Tests for anta.cli.nrfu.utils."""
+
+from __future__ import annotations
+
+from anta.cli.nrfu.utils import get_status_changes
+from anta.result_manager import ResultManager
+from anta.result_manager.models import AntaTestStatus, TestResult
+
+
+def test_get_status_changes() -> None:
+    """Test get_status_changes."""
+    previous = ResultManager()
+    previous.results = [
+        TestResult(name=f"device{index}", test="VerifyTest", categories=["test"], description="Verifies Test", result=AntaTestStatus.SUCCESS, fingerprint="abc")
+        for index in range(3)
+    ]
+
+    results = [result.model_copy() for result in previous.results]
+    results[1].result = AntaTestStatus.FAILURE
+    new_result = results[2].model_copy(update={"test": "NewTest"})
+    manager = ResultManager()
+    manager.results = [*results, new_result]
+
+    assert get_status_changes(previous, manager).results == [results[1], new_result]
+    assert len(get_status_changes(previous, previous)) == 0
@@ -5,7 +5,9 @@
 
 from __future__ import annotations
 
+import json
 import os
+import zipfile
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from unittest import mock
@@ -87,6 +89,27 @@ def yaml_file(request: pytest.FixtureRequest, tmp_path: Path) -> Path:
     return file
 
 
+@pytest.fixture(name="snapshot_dir")
+def snapshot_dir_fixture(tmp_path: Path) -> Path:
+    """Return a snapshot directory as written by `anta exec snapshot` with the outputs of device leaf1."""
+    device_dir = tmp_path / "snapshot" / "leaf1"
+    (device_dir / "json").mkdir(parents=True)
+    (device_dir / "text").mkdir()
+    (device_dir / "json" / "show_version.json").write_text(json.dumps({"modelName": "DCS-7280CR3-32P4-F", "version": "4.31.1F"}), encoding="UTF-8")
+    (device_dir / "text" / "show_running-config_section_router_bgp.log").write_text("router bgp 65101\n", encoding="UTF-8")
+    return tmp_path / "snapshot"
+
+
+@pytest.fixture
+def snapshot_archive(snapshot_dir: Path) -> Path:
+    """Return a ZIP archive of the snapshot directory of the `snapshot_dir` fixture."""
+    archive = snapshot_dir.parent / "snapshot.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        for path in snapshot_dir.rglob("*.*"):
+            zf.write(path, path.relative_to(snapshot_dir.parent))
+    return archive
+
+
 @pytest.fixture
 def setenvvar(monkeypatch: pytest.MonkeyPatch) -> Generator[pytest.MonkeyPatch, None, None]:
     """Fixture to set environment variables for testing."""
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING
 import pytest
 from pydantic import ValidationError
 
+from anta.device import AsyncEOSDevice
 from anta.inventory import AntaInventory
 from anta.inventory.exceptions import InventoryIncorrectSchemaError, InventoryRootKeyError
 
@@ -19,7 +20,7 @@ if TYPE_CHECKING:
 
     from _pytest.mark.structures import ParameterSet
 
-    from anta.device import AntaDevice, AsyncEOSDevice
+    from anta.device import AntaDevice
 
 
 INIT_VALID_PARAMS: list[ParameterSet] = [
@@ -91,6 +92,68 @@ class TestAntaInventory:
             _ = AntaInventory.parse(filename="dummy.yml", username="arista", password="arista123")
         assert "Unable to parse ANTA Device Inventory file" in caplog.records[0].message
 
+    @pytest.mark.parametrize(
+        "yaml_file",
+        [
+            pytest.param(
+                {
+                    "anta_inventory": {
+                        "hosts": [{"host": "192.168.0.17", "max_concurrency": 5}, {"host": "192.168.0.2"}],
+                        "networks": [{"network": "192.168.1.0/30", "max_concurrency": 2}],
+                        "ranges": [{"start": "10.0.0.1", "end": "10.0.0.2", "max_concurrency": 3}],
+                    }
+                },
+                id="Inventory_with_max_concurrency",
+            )
+        ],
+        indirect=["yaml_file"],
+    )
+    def test_parse_max_concurrency(self, yaml_file: Path) -> None:
+        """Parse the per-device max_concurrency from the inventory entries."""
+        inventory = AntaInventory.parse(filename=yaml_file, username="arista", password="arista123")
+
+        assert inventory["192.168.0.17"].max_concurrency == 5
+        assert inventory["192.168.0.2"].max_concurrency is None
+        assert inventory["192.168.1.1"].max_concurrency == 2
+        assert inventory["10.0.0.2"].max_concurrency == 3
+        dumped_hosts = {host.name: host for host in inventory.dump().hosts or []}
+        assert dumped_hosts["192.168.0.17"].max_concurrency == 5
+        # Unset values are not dumped
+        assert "max_concurrency" not in dumped_hosts["192.168.0.2"].model_fields_set
+
+    @pytest.mark.parametrize(
+        "yaml_file",
+        [
+            pytest.param(
+                {
+                    "anta_inventory": {
+                        "hosts": [{"host": "192.168.0.17", "http2": True}, {"host": "192.168.0.2"}],
+                        "networks": [{"network": "192.168.1.0/30", "http2": True}],
+                        "ranges": [{"start": "10.0.0.1", "end": "10.0.0.2"}],
+                    }
+                },
+                id="Inventory_with_http2",
+            )
+        ],
+        indirect=["yaml_file"],
+    )
+    def test_parse_http2(self, yaml_file: Path) -> None:
+        """Parse the per-device http2 setting from the inventory entries and the global setting."""
+        inventory = AntaInventory.parse(filename=yaml_file, username="arista", password="arista123")
+        devices = {name: device for name, device in inventory.items() if isinstance(device, AsyncEOSDevice)}
+
+        assert devices["192.168.0.17"].http2
+        assert not devices["192.168.0.2"].http2
+        assert devices["192.168.1.1"].http2
+        assert not devices["10.0.0.2"].http2
+        dumped_hosts = {host.name: host for host in inventory.dump().hosts or []}
+        assert dumped_hosts["192.168.0.17"].http2
+        # Unset values are not dumped
+        assert "http2" not in dumped_hosts["192.168.0.2"].model_fields_set
+
+        inventory = AntaInventory.parse(filename=yaml_file, username="arista", password="arista123", http2=True)
+        assert all(isinstance(device, AsyncEOSDevice) and device.http2 for device in inventory.devices)
+
     @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
     def test_max_potential_connections(self, inventory: AntaInventory) -> None:
         """Test max_potential_connections property with regular AsyncEOSDevice objects in the inventory."""
@@ -12,6 +12,7 @@ import pytest
 from rich.table import Table
 
 from anta import RICH_COLOR_PALETTE
+from anta._cost import DeviceCostEstimate, RunCostEstimate
 from anta.reporter import ReportJinja, ReportTable
 from anta.result_manager.models import AntaTestStatus
 
@@ -180,6 +181,31 @@ class TestReportTable:
         assert res.title == (title or "Summary per device")
         assert res.row_count == expected_length
 
+    @pytest.mark.parametrize(
+        ("title", "request_latency", "expected_duration"),
+        [
+            pytest.param(None, None, "N/A", id="unknown latency"),
+            pytest.param("Custom title", 0.5, "1.0s", id="Change table title"),
+        ],
+    )
+    def test_report_cost(self, title: str | None, request_latency: float | None, expected_duration: str) -> None:
+        """Test report_cost."""
+        estimate = RunCostEstimate(
+            devices=[DeviceCostEstimate(name="leaf1", tests=2, requests=2, connections=1), DeviceCostEstimate(name="leaf2", tests=1, requests=1, connections=1)],
+            request_latency=request_latency,
+        )
+
+        report = ReportTable()
+        kwargs = {"title": title} if title is not None else {}
+        res = report.report_cost(estimate, **kwargs)
+
+        assert isinstance(res, Table)
+        assert res.title == (title or "Dry-run cost estimate")
+        assert res.row_count == 2
+        assert isinstance(res.caption, str)
+        assert "Total eAPI requests: 3 (without batching)" in res.caption
+        assert f"Estimated duration: {expected_duration}" in res.caption
+
 
 class TestReportJinja:
     """Tests for ReportJinja class."""
@@ -9,12 +9,14 @@ from datetime import datetime, timedelta, timezone
 from io import StringIO
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
+from unittest.mock import patch
 
 import pytest
 
 from anta.reporter.md_reporter import MDReportBase, MDReportGenerator
-from anta.result_manager import ResultManager
+from anta.result_manager import ResultManager, models
 from anta.result_manager.models import AntaTestStatus
+from anta.result_manager.timing import ResultTimings
 from anta.tools import convert_categories
 
 if TYPE_CHECKING:
@@ -128,6 +130,27 @@ def test_md_report_generator_generate_sections(tmp_path: Path, result_manager: R
     assert content == expected_content
 
 
+def test_md_report_generator_generate_with_timing(tmp_path: Path, result_manager: ResultManager) -> None:
+    """Test the MDReportGenerator.generate() class method with timed results."""
+    md_filename = tmp_path / "test.md"
+    for index, result in enumerate(result_manager.results):
+        result.timing = models.TestTiming(queue_wait=0.5, collection=index, evaluation=0.001, total=index + 0.5, cache_hits=1)
+
+    with patch("anta.reporter.md_reporter.ResultTimings", wraps=ResultTimings) as timings:
+        MDReportGenerator.generate(result_manager, md_filename)
+    # The results are ranked once for all the sections of the report
+    timings.assert_called_once()
+
+    content = md_filename.read_text(encoding="utf-8")
+    assert "  - [Test Timings](#test-timings)\n    - [Slowest Tests](#slowest-tests)" in content
+    for heading in ("## Test Timings", "### Slowest Tests", "### Slowest Devices", "### Test Duration Percentiles"):
+        assert f"\n{heading}\n" in content
+    slowest = max(result_manager.results, key=lambda result: result.timing.total if result.timing else 0)
+    assert f"| {slowest.name} | {slowest.test} | {slowest.timing.total:.3f} | 0.500 |" in content  # type: ignore[union-attr]
+    # The Test Results section is still the last one
+    assert content.index("## Test Timings") < content.index("## Test Results\n")
+
+
 def test_md_report_base() -> None:
     """Test the MDReportBase class."""
 
@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING, Callable
 
 import pytest
 
-from anta.result_manager import ResultManager, models
+from anta.result_manager import SORTABLE_FIELDS, ResultManager, models
 from anta.result_manager.models import AntaTestStatus
 
 if TYPE_CHECKING:
@@ -623,3 +623,7 @@ class TestResultManager:
         merged_rm = ResultManager.merge_results([])
         assert isinstance(merged_rm, ResultManager)
         assert len(merged_rm) == 0
+
+    def test_sortable_fields(self) -> None:
+        """Test that the results can be sorted by all the TestResult fields except the timing and the fingerprint."""
+        assert set(SORTABLE_FIELDS) == set(models.TestResult.model_fields) - {"timing", "fingerprint"}
@@ -0,0 +1,63 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta.result_manager.journal.py."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Callable
+
+import pytest
+
+from anta.result_manager.journal import ResultJournal
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    # Import as Result to avoid pytest collection
+    from anta.result_manager.models import TestResult as Result
+
+
+class TestResultJournal:
+    """Test ResultJournal class."""
+
+    def test_add_load(self, tmp_path: Path, list_result_factory: Callable[[int], list[Result]]) -> None:
+        """Test writing test results to a journal and loading them."""
+        path = tmp_path / "journal.jsonl"
+        results = list_result_factory(3)
+        results[0].fingerprint = "abc"
+
+        with ResultJournal(path) as journal:
+            journal.add(results[0])
+            journal.add(results[1])
+        # Results are appended to the existing journal
+        with ResultJournal(path, append=True) as journal:
+            journal.add(results[2])
+
+        manager = ResultJournal.load(path)
+        assert manager.results == results
+        assert ResultJournal.get_recorded_tests(manager) == {(results[0].name, results[0].test, "abc")}
+
+        # The journal is overwritten
+        with ResultJournal(path) as journal:
+            journal.add(results[1])
+        assert ResultJournal.load(path).results == [results[1]]
+
+    def test_load_interrupted(self, caplog: pytest.LogCaptureFixture, tmp_path: Path, list_result_factory: Callable[[int], list[Result]]) -> None:
+        """Test loading a journal whose last line has been partially written."""
+        caplog.set_level(logging.WARNING)
+        path = tmp_path / "journal.jsonl"
+        results = list_result_factory(2)
+        path.write_text(f"{results[0].model_dump_json()}\n\n{results[1].model_dump_json()[:20]}", encoding="UTF-8")
+
+        manager = ResultJournal.load(path)
+
+        assert manager.results == [results[0]]
+        assert f"Ignoring invalid test result at line 3 of journal {path}" in caplog.messages
+
+    def test_add_not_open(self, tmp_path: Path, list_result_factory: Callable[[int], list[Result]]) -> None:
+        """Test writing a test result to a journal that is not open."""
+        journal = ResultJournal(tmp_path / "journal.jsonl")
+        with pytest.raises(RuntimeError, match="is not open"):
+            journal.add(list_result_factory(1)[0])
@@ -0,0 +1,40 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta.result_manager.timing.py."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+from anta.result_manager import models
+from anta.result_manager.timing import ResultTimings
+
+if TYPE_CHECKING:
+    from anta.result_manager.models import TestResult
+
+
+def test_result_timings(test_result_factory: Callable[[], TestResult]) -> None:
+    """Test the duration statistics of the results."""
+    results = []
+    durations = {("device1", "Test1"): 1.0, ("device1", "Test2"): 4.0, ("device2", "Test1"): 3.0, ("device2", "Test2"): 2.5}
+    for (device, test), total in durations.items():
+        result = test_result_factory()
+        result.name = device
+        result.test = test
+        result.timing = models.TestTiming(total=total)
+        results.append(result)
+    # Results without timing are ignored
+    results.append(test_result_factory())
+
+    timings = ResultTimings(results)
+    assert timings
+    assert [(result.name, result.test) for result in timings.get_slowest_tests(count=2)] == [("device1", "Test2"), ("device2", "Test1")]
+    assert list(timings.get_slowest_devices(count=1)) == ["device2"]
+    assert timings.test_stats == {
+        "Test1": models.TimingStats(count=2, total=4.0, mean=2.0, p50=1.0, p90=3.0, p95=3.0, max=3.0),
+        "Test2": models.TimingStats(count=2, total=6.5, mean=3.25, p50=2.5, p90=4.0, p95=4.0, max=4.0),
+    }
+    assert timings.device_stats["device1"] == models.TimingStats(count=2, total=5.0, mean=2.5, p50=1.0, p90=4.0, p95=4.0, max=4.0)
+
+    assert not ResultTimings([test_result_factory()])
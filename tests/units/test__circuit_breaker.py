@@ -0,0 +1,50 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta._circuit_breaker.py."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from anta._circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker class."""
+
+    def test_open(self) -> None:
+        """Test that the breaker opens after `threshold` consecutive transport errors."""
+        breaker = CircuitBreaker("leaf1", threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.before_request()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        with pytest.raises(CircuitOpenError, match="Circuit breaker open after 2 consecutive transport errors on leaf1"):
+            breaker.before_request()
+        assert breaker.statistics == {"opened": 1, "rejected": 1}
+
+    @pytest.mark.parametrize(("success", "state"), [pytest.param(True, CircuitState.CLOSED, id="success"), pytest.param(False, CircuitState.OPEN, id="failure")])
+    def test_half_open(self, success: bool, state: CircuitState) -> None:
+        """Test that the breaker sends a single probe after the cooldown and closes or opens again depending on its outcome."""
+        breaker = CircuitBreaker("leaf1", threshold=1, cooldown=10.0)
+        with patch("anta._circuit_breaker.monotonic", return_value=100.0):
+            breaker.record_failure()
+        with patch("anta._circuit_breaker.monotonic", return_value=111.0):
+            breaker.before_request()
+            assert breaker.state == CircuitState.HALF_OPEN
+            # The other requests fail while the probe is in flight
+            with pytest.raises(CircuitOpenError):
+                breaker.before_request()
+            if success:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+        assert breaker.state == state
+        assert breaker.opened == (1 if success else 2)
@@ -0,0 +1,129 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta._cost.py."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from anta._cost import DeviceCostEstimate, RunCostEstimate
+from anta.device import AsyncEOSDevice
+from anta.result_manager import ResultManager, models
+from anta.result_manager.models import AntaTestStatus
+
+# Import as Result to avoid pytest collection
+from anta.result_manager.models import TestResult as Result
+from anta.tests.interfaces import VerifyInterfaceUtilization
+from anta.tests.system import VerifyReloadCause, VerifyUptime
+
+if TYPE_CHECKING:
+    from anta.models import AntaTest
+
+
+def _device(name: str, *, disable_cache: bool = False) -> AsyncEOSDevice:
+    """Return an AsyncEOSDevice instance."""
+    return AsyncEOSDevice(host=f"{name}.anta.arista.com", username="anta", password="anta", name=name, disable_cache=disable_cache)
+
+
+def _tests(device: AsyncEOSDevice) -> list[AntaTest]:
+    """Return the AntaTest instances of a run on a device. `show uptime` is used by two tests."""
+    return [
+        VerifyUptime(device, inputs={"minimum": 10}),
+        VerifyUptime(device, inputs={"minimum": 20}),
+        VerifyReloadCause(device),
+        VerifyInterfaceUtilization(device),
+    ]
+
+
+class TestRunCostEstimate:
+    """Test RunCostEstimate class."""
+
+    def test_add_tests(self) -> None:
+        """Test the cost estimate of the requests with and without deduplication of the commands."""
+        cached_device = _device("leaf1")
+        uncached_device = _device("leaf2", disable_cache=True)
+        estimate = RunCostEstimate()
+        estimate.add_tests(_tests(cached_device) + _tests(uncached_device), deduplicate=False)
+
+        leaf1, leaf2 = estimate.devices
+        assert (leaf1.name, leaf1.tests, leaf1.commands, leaf1.unique_commands) == ("leaf1", 4, 5, 4)
+        # Commands are deduplicated by the device cache
+        assert leaf1.requests == 4
+        assert leaf2.requests == 5
+        assert leaf2.request_bytes > leaf1.request_bytes > 0
+        # All the commands share the same output format and version
+        assert leaf1.batched_requests == leaf2.batched_requests == 1
+        assert 0 < leaf1.batched_request_bytes < leaf1.request_bytes
+        assert estimate.total_requests == 9
+        assert estimate.total_connections == leaf1.connections + leaf2.connections == 9
+
+        estimate = RunCostEstimate()
+        estimate.add_tests(_tests(uncached_device), deduplicate=True)
+        assert estimate.devices[0].requests == 4
+
+    def test_add_tests_skipped(self) -> None:
+        """Test that the tests with a final result are not counted."""
+        device = _device("leaf1")
+        tests = _tests(device)
+        tests[2].result.result = AntaTestStatus.SKIPPED
+        estimate = RunCostEstimate()
+        estimate.add_tests(tests, deduplicate=True)
+
+        assert estimate.devices[0].tests == 4
+        assert estimate.devices[0].commands == 4
+        assert estimate.devices[0].requests == 3
+
+    def test_batching(self) -> None:
+        """Test the cost estimate of the requests with batching."""
+        estimate = RunCostEstimate(batch_size=3, batching=True)
+        estimate.add_tests(_tests(_device("leaf1")), deduplicate=True)
+
+        assert estimate.devices[0].batched_requests == 2
+        assert estimate.devices[0].connections == 2
+        assert estimate.total_requests == 2
+
+    def test_get_request_latency(self) -> None:
+        """Test the request latency computed from the timing of the test results of a previous run."""
+        manager = ResultManager()
+        assert RunCostEstimate.get_request_latency(manager) is None
+
+        for collection, cache_hits in [(0.1, 0), (0.3, 0), (0.2, 0), (0.0, 1), (5.0, 0)]:
+            manager.add(
+                Result(name="leaf1", test="VerifyUptime", categories=[], description="", timing=models.TestTiming(collection=collection, cache_hits=cache_hits))
+            )
+        manager.add(Result(name="leaf1", test="VerifyUptime", categories=[], description=""))
+
+        assert RunCostEstimate.get_request_latency(manager) == 0.25
+
+    def test_duration(self) -> None:
+        """Test the estimated duration of the run."""
+        estimate = RunCostEstimate(
+            devices=[DeviceCostEstimate(name="leaf1", requests=10, connections=2), DeviceCostEstimate(name="leaf2", requests=4, connections=4)],
+            max_concurrency=4,
+        )
+        assert estimate.duration is None
+        assert estimate.get_device_duration(estimate.devices[0]) is None
+
+        estimate.request_latency = 0.5
+        assert estimate.get_device_duration(estimate.devices[0]) == 2.5
+        assert estimate.get_device_duration(estimate.devices[1]) == 0.5
+        # The requests of leaf1 are the bottleneck
+        assert estimate.duration == 2.5
+
+        # The global concurrency is the bottleneck
+        estimate.max_concurrency = 1
+        assert estimate.duration == 7.0
+
+    def test_json(self) -> None:
+        """Test the JSON representation of the cost estimate."""
+        estimate = RunCostEstimate(devices=[DeviceCostEstimate(name="leaf1", requests=2, connections=1)], request_latency=1.0)
+
+        dump = json.loads(estimate.json)
+
+        assert dump == estimate.dump
+        assert dump["total_requests"] == 2
+        assert dump["duration"] == 2.0
+        assert dump["devices"][0]["name"] == "leaf1"
+        assert dump["devices"][0]["duration"] == 2.0
@@ -0,0 +1,91 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta._disk_cache.py."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from anta._disk_cache import DiskCacheStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestDiskCacheStore:
+    """Test DiskCacheStore class."""
+
+    def test_get_set(self, tmp_path: Path) -> None:
+        """Test that the outputs are persisted across stores of the same database file."""
+        path = tmp_path / "cache" / "anta.db"
+        store = DiskCacheStore.open(path, max_size=1024)
+        assert DiskCacheStore.open(path, max_size=1024) is store
+        store.set("leaf1", "uid1", {"modelName": "pytest"}, ttl=60)
+        store.set("leaf1", "uid2", "text output", ttl=60)
+        store.close()
+
+        store = DiskCacheStore.open(path, max_size=1024)
+        assert store.get("leaf1", "uid1") == {"modelName": "pytest"}
+        assert store.get("leaf1", "uid2") == "text output"
+        assert store.get("leaf2", "uid1") is None
+        store.delete("leaf1")
+        assert store.get("leaf1", "uid1") is None
+        store.close()
+
+    def test_expired(self, tmp_path: Path) -> None:
+        """Test that the expired outputs are not returned."""
+        store = DiskCacheStore.open(tmp_path / "anta.db", max_size=1024)
+        with patch("anta._disk_cache.time", return_value=100.0):
+            store.set("leaf1", "uid1", "output", ttl=10)
+        with patch("anta._disk_cache.time", return_value=109.0):
+            assert store.get("leaf1", "uid1") == "output"
+        with patch("anta._disk_cache.time", return_value=110.0):
+            assert store.get("leaf1", "uid1") is None
+        store.close()
+
+    def test_purge(self, tmp_path: Path) -> None:
+        """Test that the least recently used outputs are evicted once the maximum size is exceeded."""
+        store = DiskCacheStore.open(tmp_path / "anta.db", max_size=30)
+        # Each output is 12 bytes once serialized
+        for index, timestamp in enumerate((100.0, 101.0)):
+            with patch("anta._disk_cache.time", return_value=timestamp):
+                store.set("leaf1", f"uid{index}", "0123456789", ttl=60)
+        with patch("anta._disk_cache.time", return_value=102.0):
+            # uid0 becomes the most recently used output
+            assert store.get("leaf1", "uid0") is not None
+            store.set("leaf1", "uid2", "0123456789", ttl=60)
+
+            assert store.get("leaf1", "uid1") is None
+            assert store.get("leaf1", "uid0") is not None
+            assert store.get("leaf1", "uid2") is not None
+        store.close()
+
+    def test_size(self, tmp_path: Path) -> None:
+        """Test that the size of the deleted and expired outputs is deducted from the size of the store."""
+        store = DiskCacheStore.open(tmp_path / "anta.db", max_size=1024)
+        # Each output is 12 bytes once serialized
+        with patch("anta._disk_cache.time", return_value=100.0):
+            store.set("leaf1", "uid1", "0123456789", ttl=60)
+            store.set("leaf1", "uid2", "0123456789", ttl=60)
+            store.set("leaf2", "uid1", "0123456789", ttl=10)
+        assert store.size == 36
+
+        store.delete("leaf1")
+        assert store.size == 12
+        with patch("anta._disk_cache.time", return_value=110.0):
+            assert store.get("leaf2", "uid1") is None
+        assert store.size == 0
+        store.close()
+
+    def test_compression(self, tmp_path: Path) -> None:
+        """Test that the outputs larger than the compression threshold are stored compressed."""
+        store = DiskCacheStore.open(tmp_path / "anta.db", max_size=1024)
+        store.set("leaf1", "uid1", "0" * 1000, ttl=60, compress_threshold=100)
+        store.set("leaf1", "uid2", {"key": "value"}, ttl=60, compress_threshold=100)
+
+        assert store.size < 100
+        assert store.get("leaf1", "uid1") == "0" * 1000
+        assert store.get("leaf1", "uid2") == {"key": "value"}
+        store.close()
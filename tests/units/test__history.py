@@ -0,0 +1,78 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta._history.py."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from anta._history import DEFAULT_COMMAND_DURATION, DurationHistory
+from anta.catalog import AntaTestDefinition
+
+# Import as Result to avoid pytest collection
+from anta.result_manager.models import TestResult as Result
+from anta.result_manager.models import TestTiming
+from anta.tests.interfaces import VerifyInterfaceUtilization
+from anta.tests.system import VerifyUptime
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def _result(name: str, fingerprint: str | None, total: float | None) -> Result:
+    """Return a TestResult instance."""
+    timing = TestTiming(total=total) if total is not None else None
+    return Result(name=name, test="VerifyUptime", categories=[], description="", fingerprint=fingerprint, timing=timing)
+
+
+class TestDurationHistory:
+    """Test DurationHistory class."""
+
+    def test_update_save_load(self, tmp_path: Path) -> None:
+        """Test recording the durations of test results, saving and loading the history file."""
+        path = tmp_path / "history" / "durations.json"
+        history = DurationHistory(path)
+        history.load()
+        assert history.durations == {}
+
+        history.update([_result("leaf1", "abc", 4.0), _result("leaf1", None, 1.0), _result("leaf2", "abc", None)])
+        assert history.durations == {"leaf1": {"abc": 4.0}}
+        # Exponential moving average of the durations
+        history.update([_result("leaf1", "abc", 2.0)])
+        assert history.durations == {"leaf1": {"abc": 3.0}}
+        history.save()
+
+        new_history = DurationHistory(path)
+        new_history.load()
+        assert new_history.durations == history.durations
+
+    def test_load_invalid(self, caplog: pytest.LogCaptureFixture, tmp_path: Path) -> None:
+        """Test loading an invalid history file."""
+        caplog.set_level(logging.WARNING)
+        path = tmp_path / "durations.json"
+        path.write_text('{"leaf1": ["not", "a", "mapping"]}', encoding="UTF-8")
+        history = DurationHistory(path)
+
+        history.load()
+
+        assert history.durations == {}
+        assert f"Ignoring invalid test duration history {path}" in caplog.text
+
+    def test_estimate(self) -> None:
+        """Test the estimated duration of a test with and without recorded duration."""
+        uptime = AntaTestDefinition(test=VerifyUptime, inputs={"minimum": 10})
+        utilization = AntaTestDefinition(test=VerifyInterfaceUtilization, inputs=None)
+        history = DurationHistory("durations.json")
+        history.durations = {"leaf1": {uptime.fingerprint: 5.0}}
+
+        assert history.estimate("leaf1", uptime) == 5.0
+        assert history.estimate("leaf2", uptime) == DEFAULT_COMMAND_DURATION
+        assert history.estimate("leaf1", utilization) == 2 * DEFAULT_COMMAND_DURATION
+        # The duration hint of the test class is used when set
+        with patch.object(VerifyUptime, "duration_hint", 3.0):
+            assert history.estimate("leaf2", uptime) == 3.0
@@ -0,0 +1,168 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta._plan_cache.py."""
+
+from __future__ import annotations
+
+import logging
+import shutil
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from anta._plan_cache import RunPlanCache
+from anta._runner import AntaRunContext, AntaRunFilters
+from anta.catalog import AntaCatalog
+from anta.inventory import AntaInventory
+from anta.result_manager import ResultManager
+
+if TYPE_CHECKING:
+    import pytest
+
+DATA_DIR: Path = Path(__file__).parent.parent.resolve() / "data"
+
+CUSTOM_TEST_MODULE = '''
+"""Custom ANTA tests."""
+
+from typing import ClassVar
+
+from anta.models import AntaCommand, AntaTemplate, AntaTest
+
+from . import input_models  # noqa: F401
+
+
+class VerifyCustom(AntaTest):
+    """Custom ANTA test."""
+
+    categories: ClassVar[list[str]] = []
+    commands: ClassVar[list[AntaCommand | AntaTemplate]] = []
+
+    class Input(AntaTest.Input):
+        """Inputs for VerifyCustom test."""
+
+        minimum: int
+
+    @AntaTest.anta_test
+    def test(self) -> None:
+        """Test function."""
+        self.result.is_success()
+'''
+
+
+def _context(catalog: AntaCatalog, filters: AntaRunFilters | None = None) -> AntaRunContext:
+    """Return an AntaRunContext instance with all the devices of the inventory selected."""
+    inventory = AntaInventory.parse(filename=DATA_DIR / "test_inventory_with_tags.yml", username="anta", password="anta")
+    ctx = AntaRunContext(inventory=inventory, catalog=catalog, manager=ResultManager(), filters=filters if filters is not None else AntaRunFilters())
+    ctx.selected_inventory = inventory
+    return ctx
+
+
+class TestRunPlanCache:
+    """Test RunPlanCache class."""
+
+    def test_get_key(self) -> None:
+        """Test the keys of the cache entries."""
+        assert RunPlanCache.get_key("catalog", b"content") == RunPlanCache.get_key("catalog", "content")
+        assert RunPlanCache.get_key("ab", "c") != RunPlanCache.get_key("a", "bc")
+        # The key changes with the ANTA version
+        key = RunPlanCache.get_key("catalog")
+        with patch("anta._plan_cache.anta_version", "0.0.0"):
+            assert RunPlanCache.get_key("catalog") != key
+
+    def test_load_catalog(self, caplog: pytest.LogCaptureFixture, tmp_path: Path) -> None:
+        """Test loading a catalog from the cache."""
+        caplog.set_level(logging.INFO)
+        catalog_path = tmp_path / "catalog.yml"
+        shutil.copy(DATA_DIR / "test_catalog_with_tags.yml", catalog_path)
+        cache = RunPlanCache(tmp_path / "cache")
+
+        catalog = cache.load_catalog(catalog_path)
+        assert len(list((tmp_path / "cache").iterdir())) == 1
+        assert f"Test catalog {catalog_path} loaded from the plan cache" not in caplog.messages
+
+        with patch("anta._plan_cache.AntaCatalog.parse") as parse:
+            cached_catalog = cache.load_catalog(catalog_path)
+        parse.assert_not_called()
+        assert cached_catalog.tests == catalog.tests
+        assert f"Test catalog {catalog_path} loaded from the plan cache" in caplog.messages
+
+        # The catalog file changed, the catalog is parsed again
+        catalog_path.write_text(catalog_path.read_text(encoding="UTF-8").replace("minimum: 10", "minimum: 11"), encoding="UTF-8")
+        catalog = cache.load_catalog(catalog_path)
+        assert catalog.tests != cached_catalog.tests
+        assert len(list((tmp_path / "cache").iterdir())) == 2
+
+    def test_load_catalog_test_package_changed(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a cached catalog is parsed again when the package defining its tests changes."""
+        package = tmp_path / "custom_anta_tests"
+        package.mkdir()
+        (package / "__init__.py").write_text(CUSTOM_TEST_MODULE, encoding="UTF-8")
+        (package / "input_models.py").write_text("", encoding="UTF-8")
+        catalog_path = tmp_path / "catalog.yml"
+        catalog_path.write_text("custom_anta_tests:\n  - VerifyCustom:\n      minimum: 10\n", encoding="UTF-8")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        cache = RunPlanCache(tmp_path / "cache")
+
+        try:
+            cache.load_catalog(catalog_path)
+            with patch("anta._plan_cache.AntaCatalog.parse", wraps=AntaCatalog.parse) as parse:
+                cache.load_catalog(catalog_path)
+                parse.assert_not_called()
+
+                # Another module of the package changed, e.g. defining models used by the test inputs
+                (package / "input_models.py").write_text("MAXIMUM = 100\n", encoding="UTF-8")
+                catalog = cache.load_catalog(catalog_path)
+                parse.assert_called_once()
+        finally:
+            sys.modules.pop("custom_anta_tests", None)
+            sys.modules.pop("custom_anta_tests.input_models", None)
+
+        assert len(catalog.tests) == 1
+
+    def test_load_catalog_invalid_entry(self, caplog: pytest.LogCaptureFixture, tmp_path: Path) -> None:
+        """Test loading a catalog with an invalid cache entry."""
+        caplog.set_level(logging.WARNING)
+        catalog_path = DATA_DIR / "test_catalog_with_tags.yml"
+        cache = RunPlanCache(tmp_path)
+        cache.load_catalog(catalog_path)
+        entry = next(tmp_path.iterdir())
+        entry.write_bytes(b"not a pickle")
+
+        catalog = cache.load_catalog(catalog_path)
+
+        assert catalog.tests == AntaCatalog.parse(catalog_path).tests
+        assert f"Ignoring invalid plan cache entry {entry}" in caplog.text
+
+    def test_selected_tests(self, tmp_path: Path) -> None:
+        """Test saving and loading the tests selected per device."""
+        catalog = AntaCatalog.parse(DATA_DIR / "test_catalog_with_tags.yml")
+        cache = RunPlanCache(tmp_path)
+        ctx = _context(catalog)
+        key = cache.get_selection_key(ctx)
+        assert not cache.load_selected_tests(ctx, key)
+
+        device = next(iter(ctx.selected_inventory.devices))
+        ctx.selected_tests[device] = {catalog.tests[0], catalog.tests[2]}
+        cache.save_selected_tests(ctx, key)
+
+        new_ctx = _context(catalog)
+        assert cache.get_selection_key(new_ctx) == key
+        assert cache.load_selected_tests(new_ctx, key)
+        assert new_ctx.selected_tests == ctx.selected_tests
+
+    def test_get_selection_key(self) -> None:
+        """Test that the key of the tests selection changes with the catalog, the devices and the filters."""
+        catalog = AntaCatalog.parse(DATA_DIR / "test_catalog_with_tags.yml")
+        cache = RunPlanCache("cache")
+        key = cache.get_selection_key(_context(catalog))
+
+        assert cache.get_selection_key(_context(catalog, AntaRunFilters(tags={"leaf", "spine"}))) == cache.get_selection_key(
+            _context(catalog, AntaRunFilters(tags={"spine", "leaf"}))
+        )
+        assert cache.get_selection_key(_context(catalog, AntaRunFilters(tags={"leaf"}))) != key
+        assert cache.get_selection_key(_context(AntaCatalog(tests=catalog.tests[1:]))) != key
+        ctx = _context(catalog)
+        next(iter(ctx.selected_inventory.devices)).tags.add("new_tag")
+        assert cache.get_selection_key(ctx) != key
@@ -0,0 +1,47 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta._replay.py."""
+
+from __future__ import annotations
+
+import pickle
+import zipfile
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from anta._replay import ReplayArchive
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestReplayArchive:
+    """Test ReplayArchive class."""
+
+    def test_read(self, snapshot_archive: Path) -> None:
+        """Test that the archive is opened and indexed once and closed by the context manager."""
+        with patch("anta._replay.zipfile.ZipFile", wraps=zipfile.ZipFile) as zipfile_mock, ReplayArchive(snapshot_archive) as archive:
+            assert archive.devices == {"leaf1"}
+            assert archive.read("leaf1", "text", "show_running-config_section_router_bgp.log") == "router bgp 65101\n"
+            assert archive.read("leaf1", "json", "show_ip_bgp_summary.json") is None
+            assert archive.read("leaf2", "json", "show_version.json") is None
+            zipfile_mock.assert_called_once_with(snapshot_archive)
+            opened = archive._zipfile
+        assert opened is not None
+        assert opened.fp is None
+        assert archive._zipfile is None
+
+        # A closed archive is opened again on next use
+        assert archive.devices == {"leaf1"}
+        archive.close()
+
+    def test_pickle(self, snapshot_archive: Path) -> None:
+        """Test that only the path of the archive is pickled."""
+        with ReplayArchive(snapshot_archive) as archive:
+            assert archive.devices == {"leaf1"}
+            unpickled = pickle.loads(pickle.dumps(archive))  # noqa: S301
+        assert unpickled.path == snapshot_archive
+        assert unpickled._zipfile is None
+        assert unpickled.devices == {"leaf1"}
+        unpickled.close()
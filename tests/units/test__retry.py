@@ -0,0 +1,62 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta._retry.py."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from httpx import ConnectError, ConnectTimeout, HTTPStatusError, ReadError, Request, Response
+
+from anta._retry import RETRY_BUDGET_MIN, RetryPolicy
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy class."""
+
+    def test_is_retryable(self) -> None:
+        """Test the retryable exceptions, matched by the names of their classes and base classes."""
+        policy = RetryPolicy("leaf1", max_attempts=3)
+        assert policy.is_retryable(ConnectTimeout("Test"))
+        assert policy.is_retryable(ConnectError("Test"))
+        assert policy.is_retryable(ReadError("Test"))
+        assert not policy.is_retryable(HTTPStatusError("Test", request=Request("POST", "https://pytest"), response=Response(503)))
+        assert not policy.is_retryable(OSError("Test"))
+
+        policy = RetryPolicy("leaf1", max_attempts=3, retry_on=["HTTPStatusError"])
+        assert policy.is_retryable(HTTPStatusError("Test", request=Request("POST", "https://pytest"), response=Response(503)))
+        assert not policy.is_retryable(ConnectTimeout("Test"))
+
+    def test_get_delay(self) -> None:
+        """Test the exponential backoff with full jitter."""
+        policy = RetryPolicy("leaf1", max_attempts=10, backoff=1.0, max_backoff=5.0)
+        with patch("anta._retry.random.uniform", side_effect=lambda _low, high: high) as uniform:
+            delays = [policy.get_delay(ConnectTimeout("Test"), attempt) for attempt in range(1, 6)]
+        assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+        assert all(call.args[0] == 0 for call in uniform.call_args_list)
+        assert policy.retries == 5
+
+        # The delay is drawn between 0 and the backoff
+        assert 0 <= (policy.get_delay(ConnectTimeout("Test"), 1) or 0) <= 1.0
+
+    def test_get_delay_exhausted(self) -> None:
+        """Test that a request is not retried after the maximum number of attempts or with an exception that is not retryable."""
+        policy = RetryPolicy("leaf1", max_attempts=2)
+        assert policy.get_delay(ConnectTimeout("Test"), 1) is not None
+        assert policy.get_delay(ConnectTimeout("Test"), 2) is None
+        assert policy.get_delay(OSError("Test"), 1) is None
+        assert policy.statistics == {"requests": 0, "retries": 1, "exhausted": 1}
+
+    def test_get_delay_budget(self) -> None:
+        """Test that the retries are bounded by the retry budget of the device."""
+        policy = RetryPolicy("leaf1", max_attempts=3, budget_ratio=0.5)
+        policy.requests = 10
+        for _ in range(RETRY_BUDGET_MIN + 5):
+            assert policy.get_delay(ConnectTimeout("Test"), 1) is not None
+        assert policy.get_delay(ConnectTimeout("Test"), 1) is None
+        assert policy.exhausted == 1
+
+        # The budget grows with the number of requests
+        policy.requests += 2
+        assert policy.get_delay(ConnectTimeout("Test"), 1) is not None
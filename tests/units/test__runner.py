@@ -5,21 +5,39 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import os
 from collections import defaultdict
 from pathlib import Path
-from typing import ClassVar
+from queue import Queue
+from time import perf_counter
+from typing import Any, ClassVar
+from unittest.mock import patch
 
+import httpx
 import pytest
 import respx
 from pydantic import ValidationError
 
-from anta._runner import AntaRunContext, AntaRunFilters, AntaRunner
+from anta._runner import (
+    DEADLINE_INTERRUPTED_MESSAGE,
+    DEADLINE_NOT_STARTED_MESSAGE,
+    AntaRunContext,
+    AntaRunFilters,
+    AntaRunner,
+    ShardReport,
+    _run_shard,
+)
+from anta._scheduler import AdaptiveLimiter, ConcurrencyAdjustment
+from anta._statistics import AntaRunStatistics, ConcurrencyStatistics, WorkerPoolStatistics
 from anta.catalog import AntaCatalog, AntaTestDefinition
+from anta.device import AsyncEOSDevice
 from anta.inventory import AntaInventory
 from anta.models import AntaCommand, AntaTemplate, AntaTest
 from anta.result_manager import ResultManager
+from anta.result_manager.models import AntaTestStatus
 from anta.result_manager.models import TestResult as AntaTestResult
 from anta.settings import DEFAULT_MAX_CONCURRENCY, DEFAULT_NOFILE, AntaRunnerSettings
 from anta.tests.routing.generic import VerifyRoutingTableEntry
@@ -27,13 +45,36 @@ from anta.tests.routing.generic import VerifyRoutingTableEntry
 DATA_DIR: Path = Path(__file__).parent.parent.resolve() / "data"
 
 
+# pylint: disable=too-many-public-methods
 class TestAntaRunner:
     """Test AntaRunner class."""
 
     def test_init_with_default_settings(self, caplog: pytest.LogCaptureFixture) -> None:
         """Test initialization with default settings."""
         caplog.set_level(logging.DEBUG)
-        default_settings = {"nofile": DEFAULT_NOFILE, "max_concurrency": DEFAULT_MAX_CONCURRENCY}
+        default_settings = {
+            "nofile": DEFAULT_NOFILE,
+            "max_concurrency": DEFAULT_MAX_CONCURRENCY,
+            "device_max_concurrency": None,
+            "workers": 1,
+            "worker_pool": False,
+            "prefetch": False,
+            "batch_size": None,
+            "pipeline": False,
+            "adaptive_concurrency": False,
+            "plan_cache": None,
+            "duration_history": None,
+            "deadline": None,
+            "test_timeout": None,
+            "retry_attempts": 1,
+            "retry_backoff": 0.5,
+            "retry_max_backoff": 10.0,
+            "retry_on": ["TimeoutException", "NetworkError", "RemoteProtocolError"],
+            "circuit_breaker_threshold": None,
+            "circuit_breaker_cooldown": 30.0,
+            "sweep_timeout": None,
+            "sweep_concurrency": 256,
+        }
 
         runner = AntaRunner()
 
@@ -43,9 +84,50 @@ class TestAntaRunner:
     def test_init_with_custom_env_settings(self, caplog: pytest.LogCaptureFixture, setenvvar: pytest.MonkeyPatch) -> None:
         """Test initialization with custom env settings."""
         caplog.set_level(logging.DEBUG)
-        desired_settings = {"nofile": 1048576, "max_concurrency": 10000}
+        desired_settings = {
+            "nofile": 1048576,
+            "max_concurrency": 10000,
+            "device_max_concurrency": 10,
+            "workers": 4,
+            "worker_pool": True,
+            "prefetch": True,
+            "batch_size": 20,
+            "pipeline": True,
+            "adaptive_concurrency": True,
+            "plan_cache": Path("/tmp/anta"),
+            "duration_history": Path("/tmp/anta/durations.json"),
+            "deadline": 600.0,
+            "test_timeout": 30.5,
+            "retry_attempts": 3,
+            "retry_backoff": 0.1,
+            "retry_max_backoff": 2.0,
+            "retry_on": ["TimeoutException"],
+            "circuit_breaker_threshold": 3,
+            "circuit_breaker_cooldown": 5.0,
+            "sweep_timeout": 0.5,
+            "sweep_concurrency": 64,
+        }
         setenvvar.setenv("ANTA_NOFILE", str(desired_settings["nofile"]))
         setenvvar.setenv("ANTA_MAX_CONCURRENCY", str(desired_settings["max_concurrency"]))
+        setenvvar.setenv("ANTA_DEVICE_MAX_CONCURRENCY", str(desired_settings["device_max_concurrency"]))
+        setenvvar.setenv("ANTA_WORKERS", str(desired_settings["workers"]))
+        setenvvar.setenv("ANTA_WORKER_POOL", str(desired_settings["worker_pool"]))
+        setenvvar.setenv("ANTA_PREFETCH", str(desired_settings["prefetch"]))
+        setenvvar.setenv("ANTA_BATCH_SIZE", str(desired_settings["batch_size"]))
+        setenvvar.setenv("ANTA_PIPELINE", str(desired_settings["pipeline"]))
+        setenvvar.setenv("ANTA_ADAPTIVE_CONCURRENCY", str(desired_settings["adaptive_concurrency"]))
+        setenvvar.setenv("ANTA_PLAN_CACHE", str(desired_settings["plan_cache"]))
+        setenvvar.setenv("ANTA_DURATION_HISTORY", str(desired_settings["duration_history"]))
+        setenvvar.setenv("ANTA_DEADLINE", str(desired_settings["deadline"]))
+        setenvvar.setenv("ANTA_TEST_TIMEOUT", str(desired_settings["test_timeout"]))
+        setenvvar.setenv("ANTA_RETRY_ATTEMPTS", str(desired_settings["retry_attempts"]))
+        setenvvar.setenv("ANTA_RETRY_BACKOFF", str(desired_settings["retry_backoff"]))
+        setenvvar.setenv("ANTA_RETRY_MAX_BACKOFF", str(desired_settings["retry_max_backoff"]))
+        setenvvar.setenv("ANTA_RETRY_ON", json.dumps(desired_settings["retry_on"]))
+        setenvvar.setenv("ANTA_CIRCUIT_BREAKER_THRESHOLD", str(desired_settings["circuit_breaker_threshold"]))
+        setenvvar.setenv("ANTA_CIRCUIT_BREAKER_COOLDOWN", str(desired_settings["circuit_breaker_cooldown"]))
+        setenvvar.setenv("ANTA_SWEEP_TIMEOUT", str(desired_settings["sweep_timeout"]))
+        setenvvar.setenv("ANTA_SWEEP_CONCURRENCY", str(desired_settings["sweep_concurrency"]))
 
         runner = AntaRunner()
 
@@ -80,9 +162,34 @@ class TestAntaRunner:
         assert ctx.total_devices_unreachable == 0
         assert ctx.total_devices_selected_for_testing == ctx.total_devices_in_inventory == len(inventory)
         assert ctx.duration is not None
+        assert ctx.statistics.cost is not None
+        assert len(ctx.statistics.cost.devices) == ctx.total_devices_selected_for_testing
+        assert ctx.statistics.cost.total_requests > 0
 
         assert "Dry-run mode, exiting before running the tests." in caplog.messages
 
+    async def test_plan_cache(self, caplog: pytest.LogCaptureFixture, tmp_path: Path) -> None:
+        """Test AntaRunner.run() restoring the tests selection from the plan cache."""
+        caplog.set_level(logging.INFO)
+
+        inventory = AntaInventory.parse(filename=DATA_DIR / "test_inventory_with_tags.yml", username="anta", password="anta")
+        catalog = AntaCatalog.parse(filename=DATA_DIR / "test_catalog_with_tags.yml")
+        runner = AntaRunner(settings=AntaRunnerSettings(plan_cache=tmp_path))
+        filters = AntaRunFilters(tags={"leaf"})
+        ctx = await runner.run(inventory, catalog, filters=filters, dry_run=True)
+        assert "Tests selection loaded from the plan cache" not in caplog.messages
+
+        with patch.object(AntaRunner, "_select_tests") as select_tests:
+            cached_ctx = await runner.run(inventory, catalog, filters=filters, dry_run=True)
+        select_tests.assert_not_called()
+        assert "Tests selection loaded from the plan cache" in caplog.messages
+        assert cached_ctx.selected_tests == ctx.selected_tests
+
+        # The filters changed, the tests are selected again
+        ctx = await runner.run(inventory, catalog, filters=AntaRunFilters(tags={"spine"}), dry_run=True)
+        assert ctx.selected_tests != cached_ctx.selected_tests
+        assert len(list(tmp_path.iterdir())) == 2
+
     @pytest.mark.parametrize(
         ("filters", "expected_devices", "expected_tests"),
         [
@@ -418,6 +525,718 @@ class TestAntaRunner:
         for result in ctx.manager.results:
             assert result.result == "failure"
 
+    @pytest.mark.parametrize(("inventory"), [pytest.param({"count": 1}, id="1-device"), pytest.param({"count": 50}, id="50-devices")], indirect=True)
+    def test_setup_tests_fingerprint(self, inventory: AntaInventory) -> None:
+        """Test that AntaRunner._setup_tests() reuses the fingerprint of each test definition whatever the number of devices."""
+        with patch.object(AntaTestDefinition, "_compute_fingerprint", autospec=True, side_effect=AntaTestDefinition._compute_fingerprint) as fingerprint_mock:
+            tests = [AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": [f"10.1.0.{i}"]}) for i in range(5)]
+            catalog = AntaCatalog(tests=tests)
+            ctx = AntaRunContext(inventory=inventory, catalog=catalog, manager=ResultManager(), filters=AntaRunFilters(), selected_inventory=inventory)
+
+            assert AntaRunner()._setup_tests(ctx)
+
+        assert ctx.total_tests_scheduled == len(inventory) * len(tests)
+        # The fingerprints are computed when the test definitions are loaded, not when selecting the tests of each device
+        assert fingerprint_mock.call_count == len(tests)
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    @respx.mock
+    async def test_run_batch_size(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() with commands collected in batches."""
+
+        def eapi_response(request: httpx.Request) -> httpx.Response:
+            """Return an empty routing table for each command of the request."""
+            cmds = json.loads(request.content)["params"]["cmds"]
+            return httpx.Response(status_code=200, json={"result": [{"vrfs": {"default": {"routes": {}}}} for _ in cmds]})
+
+        route = respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, content__contains="show ip route")
+        route.side_effect = eapi_response
+        tests = [AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": [f"10.1.0.{i}"]}) for i in range(4)]
+        catalog = AntaCatalog(tests=tests)
+        runner = AntaRunner(settings=AntaRunnerSettings(batch_size=2))
+
+        ctx = await runner.run(inventory, catalog)
+
+        # 4 commands per device in batches of 2 commands
+        assert route.call_count == 4
+        assert ctx.total_commands_prefetched == 8
+        assert ctx.total_commands_deduplicated == 0
+        assert len(ctx.manager) == 8
+        for result in ctx.manager.results:
+            assert result.result == "failure"
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    @respx.mock
+    async def test_run_prefetch(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() with commands deduplicated during the prefetch stage."""
+        route = respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default")
+        route.respond(json={"result": [{"vrfs": {"default": {"routes": {}}}}]})
+        tests = [AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": [f"10.1.0.{i}"], "collect": "all"}) for i in range(4)]
+        catalog = AntaCatalog(tests=tests)
+        runner = AntaRunner(settings=AntaRunnerSettings(prefetch=True))
+
+        ctx = await runner.run(inventory, catalog)
+
+        # The device cache is disabled, the same command is collected once per device
+        assert route.call_count == 2
+        assert ctx.statistics.prefetch.prefetched_commands == {"device-0": 1, "device-1": 1}
+        assert ctx.statistics.prefetch.deduplicated_commands == {"device-0": 3, "device-1": 3}
+        assert len(ctx.manager) == 8
+        for result in ctx.manager.results:
+            assert result.result == "failure"
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
+    @respx.mock
+    async def test_run_device_max_concurrency(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() with a per-device concurrency limit."""
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+        tests = [AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": [f"10.1.0.{i}"], "collect": "all"}) for i in range(5)]
+        catalog = AntaCatalog(tests=tests)
+        # The inventory entry overrides the runner default
+        inventory["device-0"].max_concurrency = 1
+        in_flight: defaultdict[str, int] = defaultdict(int)
+        max_in_flight: defaultdict[str, int] = defaultdict(int)
+        original_test = VerifyRoutingTableEntry.test
+
+        async def tracked_test(self: VerifyRoutingTableEntry) -> AntaTestResult:
+            in_flight[self.device.name] += 1
+            max_in_flight[self.device.name] = max(max_in_flight[self.device.name], in_flight[self.device.name])
+            try:
+                return await original_test(self)
+            finally:
+                in_flight[self.device.name] -= 1
+
+        with patch.object(VerifyRoutingTableEntry, "test", tracked_test):
+            ctx = await AntaRunner(settings=AntaRunnerSettings(device_max_concurrency=2)).run(inventory, catalog)
+
+        assert len(ctx.manager) == 15
+        assert max_in_flight == {"device-0": 1, "device-1": 2, "device-2": 2}
+        assert ctx.scheduler is not None
+        assert ctx.scheduler.queue_depth == {"device-0": 0, "device-1": 0, "device-2": 0}
+        assert ctx.scheduler.in_flight == {"device-0": 0, "device-1": 0, "device-2": 0}
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
+    @respx.mock
+    async def test_run_worker_pool(self, caplog: pytest.LogCaptureFixture, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() in worker pool mode."""
+        caplog.set_level(logging.WARNING)
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+        tests = [AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": [f"10.1.0.{i}"], "collect": "all"}) for i in range(5)]
+        catalog = AntaCatalog(tests=tests)
+        sink: list[AntaTestResult] = []
+        runner = AntaRunner(settings=AntaRunnerSettings(worker_pool=True, max_concurrency=4, prefetch=True))
+
+        ctx = await runner.run(inventory, catalog, result_callbacks=[sink.append])
+
+        assert len(ctx.manager) == 15
+        assert len(sink) == 15
+        for result in ctx.manager.results:
+            assert result.result == "failure"
+            # The time spent waiting for a worker slot is recorded
+            assert result.timing is not None
+            assert result.timing.queue_wait is not None
+        # The number of AntaTest instances alive at the same time is bounded by the number of workers
+        assert 0 < ctx.statistics.worker_pool.peak_tests_in_memory <= 4
+        if os.name == "posix":
+            assert ctx.statistics.worker_pool.peak_memory is not None
+            assert ctx.statistics.worker_pool.peak_memory > 0
+        assert ctx.total_commands_prefetched == 0
+        assert "Commands prefetching is not supported in worker pool mode. Commands will be collected by each test." in caplog.messages
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
+    @respx.mock
+    async def test_stream_worker_pool(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.stream() in worker pool mode, stopping before the end of the run."""
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+        tests = [AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": [f"10.1.0.{i}"], "collect": "all"}) for i in range(5)]
+        catalog = AntaCatalog(tests=tests)
+        manager = ResultManager()
+        runner = AntaRunner(settings=AntaRunnerSettings(worker_pool=True, max_concurrency=2))
+
+        stream = runner.stream(inventory, catalog, result_manager=manager)
+        results = []
+        async for result in stream:
+            results.append(result)
+            if len(results) == 3:
+                break
+        await stream.aclose()
+
+        assert len(manager) == 3
+        # The tests of the devices are interleaved, the first 2 workers run the first test of 2 different devices
+        assert {result.name for result in results[:2]} == {"device-0", "device-1"}
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
+    @respx.mock
+    async def test_run_pipelined(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() in pipelined mode with a device connecting after the tests of the other devices."""
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+        tests = [AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": [f"10.1.0.{i}"], "collect": "all"}) for i in range(2)]
+        catalog = AntaCatalog(tests=tests)
+        sink: list[AntaTestResult] = []
+        tests_done = asyncio.Event()
+
+        async def slow_refresh() -> None:
+            # The connection attempt fails once the tests of the other devices are done
+            await tests_done.wait()
+
+        def callback(result: AntaTestResult) -> None:
+            sink.append(result)
+            if len(sink) == 4:
+                tests_done.set()
+
+        runner = AntaRunner(settings=AntaRunnerSettings(pipeline=True, prefetch=True))
+        with patch.object(inventory["device-1"], "refresh", side_effect=slow_refresh):
+            ctx = await runner.run(inventory, catalog, result_callbacks=[callback])
+
+        assert [result.name for result in ctx.manager.results] == ["device-0", "device-0", "device-2", "device-2"]
+        assert ctx.devices_unreachable_at_setup == ["device-1"]
+        assert set(ctx.selected_inventory.keys()) == {"device-0", "device-2"}
+        assert ctx.total_tests_scheduled == 4
+        assert ctx.statistics.prefetch.prefetched_commands == {"device-0": 1, "device-2": 1}
+        assert ctx.statistics.worker_pool.peak_tests_in_memory == 4
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    @respx.mock
+    async def test_stream_pipelined(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.stream() in pipelined mode without removing the unreachable devices."""
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"], "collect": "all"})])
+        tests_done = asyncio.Event()
+
+        async def slow_refresh() -> None:
+            await tests_done.wait()
+
+        runner = AntaRunner(settings=AntaRunnerSettings(pipeline=True))
+        results = []
+        with patch.object(inventory["device-0"], "refresh", side_effect=slow_refresh):
+            async for result in runner.stream(inventory, catalog, filters=AntaRunFilters(established_only=False)):
+                results.append(result)
+                tests_done.set()
+
+        # The tests of device-0 are run once its connection attempt completes, after the tests of device-1
+        assert [result.name for result in results] == ["device-1", "device-0"]
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    async def test_run_pipelined_worker_pool(self, caplog: pytest.LogCaptureFixture, inventory: AntaInventory) -> None:
+        """Test that pipelined mode is ignored in worker pool mode."""
+        caplog.set_level(logging.WARNING)
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"]})])
+        runner = AntaRunner(settings=AntaRunnerSettings(pipeline=True, worker_pool=True))
+
+        ctx = await runner.run(inventory, catalog, dry_run=True)
+
+        assert len(ctx.manager) == 2
+        assert "Pipelined mode is not supported in worker pool mode. Devices are connected before running the tests." in caplog.messages
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    @respx.mock
+    async def test_run_adaptive_concurrency(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() with adaptive concurrency."""
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"], "collect": "all"})])
+        limiters: list[AdaptiveLimiter | None] = []
+        runner = AntaRunner(settings=AntaRunnerSettings(adaptive_concurrency=True))
+
+        ctx = await runner.run(inventory, catalog, result_callbacks=[lambda _: limiters.append(inventory["device-0"].request_limiter)])
+
+        assert len(ctx.manager) == 2
+        # The requests of the devices are limited during the run
+        assert isinstance(limiters[0], AdaptiveLimiter)
+        assert limiters[0].parent is not None
+        assert ctx.statistics.concurrency.limits == {"device-0": 10, "device-1": 10, "global": 20}
+        assert ctx.statistics.concurrency.adjustments == []
+        # The limiters are detached from the devices once the run is completed
+        assert inventory["device-0"].request_limiter is None
+
+    async def test_run_sharded(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test AntaRunner.run() in sharded mode with worker processes."""
+        caplog.set_level(logging.WARNING)
+        # Devices are refused by the local host, the worker processes find them unreachable
+        inventory = AntaInventory()
+        for port in (1, 2, 3):
+            inventory.add_device(AsyncEOSDevice(host="127.0.0.1", port=port, username="anta", password="anta", name=f"device-{port}", proto="http"))
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"]})])
+
+        ctx = await AntaRunner(settings=AntaRunnerSettings(workers=2)).run(inventory, catalog)
+
+        assert len(ctx.manager) == 0
+        assert ctx.devices_unreachable_at_setup == ["device-1", "device-2", "device-3"]
+        assert ctx.total_devices_selected_for_testing == 0
+        assert ctx.total_tests_scheduled == 0
+        assert "No reachable devices found for testing after connectivity checks. Exiting ..." in ctx.warnings_at_setup
+        # Log records of the worker processes are handled by this process
+        assert "Could not connect to device device-1" in caplog.text
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    @pytest.mark.parametrize("ordered", [True, False])
+    async def test_run_sharded_messages(self, caplog: pytest.LogCaptureFixture, inventory: AntaInventory, *, ordered: bool) -> None:
+        """Test the handling of the messages sent by the worker processes of a sharded run."""
+        caplog.set_level(logging.INFO)
+
+        class FakeProcess:  # pylint: disable=too-few-public-methods
+            """Worker process that does not run and exits with an error."""
+
+            pid = None
+            exitcode = 1
+
+            def start(self) -> None:
+                """Do not start the process."""
+
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"]})])
+        runner = AntaRunner(settings=AntaRunnerSettings(workers=2))
+        ctx = runner._create_context(inventory, catalog, None, None)
+        assert await runner._prepare_run(ctx)
+        shard_results = [
+            AntaTestResult(name=device.name, test="VerifyRoutingTableEntry", categories=[], description="", custom_field=None) for device in inventory.devices
+        ]
+        queue: Queue[Any] = Queue()
+        queue.put(logging.LogRecord("anta.device", logging.WARNING, __file__, 0, "Message from a worker", None, None))
+        queue.put((1, shard_results[1]))
+        queue.put((0, shard_results[0]))
+        queue.put(ShardReport(index=0, devices_unreachable_at_setup=[], warnings_at_setup=["Warning from a worker"]))
+        # The second worker process exits without report
+        sink: list[AntaTestResult] = []
+
+        with patch.object(AntaRunner, "_create_shard_processes", return_value=([FakeProcess(), FakeProcess()], queue)):
+            results = [res async for res in runner._run_sharded(ctx, [sink.append], ordered=ordered)]
+
+        assert results == (shard_results if ordered else [shard_results[1], shard_results[0]])
+        assert sink == [shard_results[1], shard_results[0]]
+        assert "Message from a worker" in caplog.messages
+        assert ctx.warnings_at_setup == ["Warning from a worker"]
+        assert "Inventory shard 1 failed to run, test results may be missing for devices" in caplog.text
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    def test_update_context_from_reports_concurrency(self, inventory: AntaInventory) -> None:
+        """Test the merge of the adaptive concurrency limits of the worker processes of a sharded run."""
+        runner = AntaRunner(settings=AntaRunnerSettings(workers=2, adaptive_concurrency=True))
+        ctx = runner._create_context(inventory, AntaCatalog(), None, None)
+        ctx.selected_inventory = inventory
+        adjustments = [ConcurrencyAdjustment(name=f"device-{index}", previous_limit=10, limit=5, reason="TimeoutException") for index in (1, 0)]
+        reports = [
+            ShardReport(
+                index=0, statistics=AntaRunStatistics(concurrency=ConcurrencyStatistics(limits={"device-0": 5, "global": 10}, adjustments=[adjustments[1]]))
+            ),
+            ShardReport(
+                index=1, statistics=AntaRunStatistics(concurrency=ConcurrencyStatistics(limits={"device-1": 5, "global": 10}, adjustments=[adjustments[0]]))
+            ),
+        ]
+
+        runner._update_context_from_reports(ctx, reports, [inventory.get_inventory(devices={name}) for name in ("device-0", "device-1")])
+
+        assert ctx.statistics.concurrency.limits == {"device-0": 5, "device-1": 5, "global": 20}
+        assert ctx.statistics.concurrency.adjustments == adjustments
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    def test_update_context_from_reports_worker_pool(self, inventory: AntaInventory) -> None:
+        """Test the merge of the memory statistics of the worker processes of a sharded run."""
+        runner = AntaRunner(settings=AntaRunnerSettings(workers=2))
+        ctx = runner._create_context(inventory, AntaCatalog(), None, None)
+        ctx.selected_inventory = inventory
+        reports = [
+            ShardReport(index=0, statistics=AntaRunStatistics(worker_pool=WorkerPoolStatistics(peak_tests_in_memory=4, peak_memory=1000))),
+            ShardReport(index=1, statistics=AntaRunStatistics(worker_pool=WorkerPoolStatistics(peak_tests_in_memory=6, peak_memory=2000))),
+        ]
+
+        runner._update_context_from_reports(ctx, reports, [inventory.get_inventory(devices={name}) for name in ("device-0", "device-1")])
+        with patch("anta._runner._get_peak_memory", return_value=500):
+            runner._log_memory_usage(ctx)
+
+        # The worker processes run concurrently, the peak memory includes this process
+        assert ctx.statistics.worker_pool == WorkerPoolStatistics(peak_tests_in_memory=10, peak_memory=3500)
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
+    def test_get_shards(self, inventory: AntaInventory) -> None:
+        """Test the inventory sharding balancing the number of tests per shard."""
+        runner = AntaRunner(settings=AntaRunnerSettings(workers=2))
+        ctx = runner._create_context(inventory, AntaCatalog(), None, None)
+        ctx.selected_inventory = inventory
+        tests = [AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": [f"10.1.0.{i}"]}) for i in range(4)]
+        ctx.selected_tests[inventory["device-0"]] = set(tests[:1])
+        ctx.selected_tests[inventory["device-1"]] = set(tests)
+        ctx.selected_tests[inventory["device-2"]] = set(tests[:2])
+
+        shards = runner._get_shards(ctx)
+
+        assert [sorted(shard.keys()) for shard in shards] == [["device-1"], ["device-0", "device-2"]]
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
+    def test_get_shards_duration_history(self, inventory: AntaInventory, tmp_path: Path) -> None:
+        """Test the inventory sharding balancing the estimated duration of the tests per shard."""
+        tests = [AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": [f"10.1.0.{i}"]}) for i in range(2)]
+        history = tmp_path / "durations.json"
+        history.write_text(
+            json.dumps({"device-0": {tests[0].fingerprint: 30.0}, "device-1": {tests[0].fingerprint: 10.0, tests[1].fingerprint: 10.0}}), encoding="UTF-8"
+        )
+        runner = AntaRunner(settings=AntaRunnerSettings(workers=2, duration_history=history))
+        ctx = runner._create_context(inventory, AntaCatalog(), None, None)
+        ctx.selected_inventory = inventory
+        ctx.selected_tests[inventory["device-0"]] = set(tests[:1])
+        ctx.selected_tests[inventory["device-1"]] = set(tests)
+        ctx.selected_tests[inventory["device-2"]] = set(tests)
+        assert runner._duration_history is not None
+        runner._duration_history.load()
+
+        shards = runner._get_shards(ctx)
+
+        assert [sorted(shard.keys()) for shard in shards] == [["device-0"], ["device-1", "device-2"]]
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    def test_run_shard(self, inventory: AntaInventory) -> None:
+        """Test the target of the worker processes of a sharded run."""
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"], "collect": "all"})])
+        queue: Queue[Any] = Queue()
+        root = logging.getLogger()
+        handlers, level = root.handlers, root.level
+
+        try:
+            _run_shard(1, inventory, catalog, AntaRunFilters(), {"workers": 1}, queue, logging.INFO)  # type: ignore[arg-type]
+        finally:
+            root.handlers, root.level = handlers, level
+
+        messages = list(queue.queue)
+        results = [message for message in messages if isinstance(message, tuple)]
+        assert [(index, result.name) for index, result in results] == [(1, "device-0"), (1, "device-1")]
+        assert any(isinstance(message, logging.LogRecord) for message in messages)
+        report = messages[-1]
+        assert isinstance(report, ShardReport)
+        assert report.index == 1
+        assert report.error is None
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
+    @respx.mock
+    async def test_run_result_callbacks(self, caplog: pytest.LogCaptureFixture, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() with result callbacks."""
+        caplog.set_level(logging.ERROR)
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+        tests = [AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": [f"10.1.0.{i}"], "collect": "all"}) for i in range(5)]
+        catalog = AntaCatalog(tests=tests)
+        sink: list[AntaTestResult] = []
+
+        def failing_callback(result: AntaTestResult) -> None:
+            msg = f"Sink unavailable for {result.name}"
+            raise RuntimeError(msg)
+
+        ctx = await AntaRunner().run(inventory, catalog, result_callbacks=[failing_callback, sink.append])
+
+        assert len(sink) == 15
+        assert sorted(id(result) for result in sink) == sorted(id(result) for result in ctx.manager.results)
+        assert "An error occurred in result callback" in caplog.text
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    @respx.mock
+    async def test_run_excluded_tests(self, caplog: pytest.LogCaptureFixture, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() with excluded tests, e.g. the tests recorded in the journal of a resumed run."""
+        caplog.set_level(logging.INFO)
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+        tests = [AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": [f"10.1.0.{i}"], "collect": "all"}) for i in range(2)]
+        catalog = AntaCatalog(tests=tests)
+        filters = AntaRunFilters(excluded_tests={("device-0", "VerifyRoutingTableEntry", tests[0].fingerprint)})
+
+        ctx = await AntaRunner().run(inventory, catalog, filters=filters)
+
+        assert ctx.total_tests_scheduled == 3
+        assert "1 tests excluded from the run" in caplog.messages
+        assert {(result.name, result.fingerprint) for result in ctx.manager.results} == {
+            ("device-0", tests[1].fingerprint),
+            ("device-1", tests[0].fingerprint),
+            ("device-1", tests[1].fingerprint),
+        }
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
+    @respx.mock
+    async def test_run_included_tests(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() with included tests, e.g. the failed tests of a previous run."""
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+        tests = [AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": [f"10.1.0.{i}"], "collect": "all"}) for i in range(2)]
+        catalog = AntaCatalog(tests=tests)
+        # The test results of device-1 have no fingerprint, all the definitions of the test are included
+        filters = AntaRunFilters(included_tests={("device-0", "VerifyRoutingTableEntry", tests[0].fingerprint), ("device-1", "VerifyRoutingTableEntry", None)})
+
+        with patch.object(AntaInventory, "connect_inventory", autospec=True, side_effect=AntaInventory.connect_inventory) as connect_inventory:
+            ctx = await AntaRunner().run(inventory, catalog, filters=filters)
+
+        # Only the devices of the included tests are connected
+        assert set(connect_inventory.call_args.args[0].keys()) == {"device-0", "device-1"}
+        assert ctx.devices_filtered_at_setup == ["device-2"]
+        assert {(result.name, result.fingerprint) for result in ctx.manager.results} == {
+            ("device-0", tests[0].fingerprint),
+            ("device-1", tests[0].fingerprint),
+            ("device-1", tests[1].fingerprint),
+        }
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    @respx.mock
+    async def test_run_duration_history(self, inventory: AntaInventory, tmp_path: Path) -> None:
+        """Test AntaRunner.run() scheduling the tests with the longest recorded durations first."""
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+        tests = [AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": [f"10.1.0.{i}"], "collect": "all"}) for i in range(3)]
+        catalog = AntaCatalog(tests=tests)
+        history = tmp_path / "durations.json"
+        # device-1 has the longest tests, tests[2] has no recorded duration and falls back to the duration hint
+        history.write_text(
+            json.dumps({"device-0": {tests[0].fingerprint: 1.0, tests[1].fingerprint: 2.0}, "device-1": {tests[0].fingerprint: 10.0, tests[1].fingerprint: 20.0}}),
+            encoding="UTF-8",
+        )
+        completed: list[tuple[str, str | None]] = []
+
+        runner = AntaRunner(settings=AntaRunnerSettings(max_concurrency=1, duration_history=history))
+        await runner.run(inventory, catalog, result_callbacks=[lambda result: completed.append((result.name, result.fingerprint))])
+
+        # The scheduler grants the slots in a round-robin fashion across devices
+        assert completed == [
+            ("device-1", tests[1].fingerprint),
+            ("device-0", tests[1].fingerprint),
+            ("device-1", tests[0].fingerprint),
+            ("device-0", tests[0].fingerprint),
+            ("device-1", tests[2].fingerprint),
+            ("device-0", tests[2].fingerprint),
+        ]
+        # The durations of the run are recorded
+        durations = json.loads(history.read_text(encoding="UTF-8"))
+        assert set(durations["device-0"]) == {test_def.fingerprint for test_def in tests}
+        assert durations["device-1"][tests[1].fingerprint] < 20.0
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    @respx.mock
+    async def test_run_test_timeout(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() with a test running longer than the test timeout."""
+
+        async def slow_response(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "device-0.anta.arista.com":
+                await asyncio.sleep(10)
+            return httpx.Response(200, json={"result": [{"vrfs": {"default": {"routes": {}}}}]})
+
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").mock(
+            side_effect=slow_response
+        )
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"], "collect": "all"})])
+
+        ctx = await AntaRunner(settings=AntaRunnerSettings(test_timeout=0.05)).run(inventory, catalog)
+
+        results = {result.name: result for result in ctx.manager.results}
+        assert results["device-0"].result == AntaTestStatus.ERROR
+        assert results["device-0"].messages == ["Test timed out after 0.05 seconds"]
+        assert results["device-0"].timing is not None
+        assert results["device-1"].result == AntaTestStatus.FAILURE
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 1}], indirect=True)
+    @respx.mock
+    async def test_run_retry(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() retrying the requests failing with a transient error."""
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").mock(
+            side_effect=[httpx.ConnectError("Test"), httpx.Response(200, json={"result": [{"vrfs": {"default": {"routes": {}}}}]})]
+        )
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"], "collect": "all"})])
+
+        ctx = await AntaRunner(settings=AntaRunnerSettings(retry_attempts=2, retry_backoff=0.001)).run(inventory, catalog)
+
+        result = ctx.manager.results[0]
+        assert result.result == AntaTestStatus.FAILURE
+        assert result.timing is not None
+        assert result.timing.retries == 1
+        assert ctx.statistics.transport.retries == {"device-0": {"requests": 1, "retries": 1, "exhausted": 0}}
+        # The retry policies are detached from the devices at the end of the run
+        assert all(device.retry_policy is None for device in inventory.devices)
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 1}], indirect=True)
+    @respx.mock
+    async def test_run_circuit_breaker(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() failing fast the requests of a device after repeated transport errors."""
+        route = respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").mock(
+            side_effect=httpx.ConnectError("Test")
+        )
+        tests = [AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": [f"10.1.0.{i}"], "collect": "all"}) for i in range(3)]
+        catalog = AntaCatalog(tests=tests)
+
+        ctx = await AntaRunner(settings=AntaRunnerSettings(max_concurrency=1, circuit_breaker_threshold=1)).run(inventory, catalog)
+
+        assert route.call_count == 1
+        assert all(result.result == AntaTestStatus.ERROR for result in ctx.manager.results)
+        assert ctx.statistics.transport.circuit_breakers == {"device-0": {"opened": 1, "rejected": 2}}
+        # The circuit breakers are detached from the devices at the end of the run
+        assert all(device.circuit_breaker is None for device in inventory.devices)
+
+    @pytest.mark.parametrize(("inventory", "pipeline"), [({"count": 3}, False), ({"count": 3}, True)], indirect=["inventory"])
+    @respx.mock
+    async def test_run_sweep(self, inventory: AntaInventory, pipeline: bool) -> None:
+        """Test AntaRunner.run() removing the devices not accepting connections during the reachability sweep."""
+
+        async def check_port(device: AsyncEOSDevice, _timeout: float) -> bool:
+            return device.name == "device-0"
+
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"], "collect": "all"})])
+
+        with (
+            patch.object(AsyncEOSDevice, "check_port", check_port),
+            patch.object(AsyncEOSDevice, "refresh", autospec=True, side_effect=AsyncEOSDevice.refresh) as refresh_mock,
+        ):
+            ctx = await AntaRunner(settings=AntaRunnerSettings(sweep_timeout=0.5, pipeline=pipeline)).run(inventory, catalog)
+
+        # Only the devices accepting connections are refreshed
+        assert [call.args[0].name for call in refresh_mock.call_args_list] == ["device-0"]
+        assert ctx.devices_unreachable_at_setup == ["device-1", "device-2"]
+        assert ctx.statistics.sweep.swept_devices == 3
+        assert ctx.statistics.sweep.live_devices == 1
+        assert [result.name for result in ctx.manager.results] == ["device-0"]
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 1}], indirect=True)
+    @respx.mock
+    async def test_run_deadline(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() reporting the tests not completed before the deadline of the run."""
+
+        async def slow_response(_request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(10)
+            return httpx.Response(200, json={"result": [{"vrfs": {"default": {"routes": {}}}}]})
+
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").mock(
+            side_effect=slow_response
+        )
+        tests = [AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": [f"10.1.0.{i}"], "collect": "all"}) for i in range(2)]
+        catalog = AntaCatalog(tests=tests)
+
+        start = perf_counter()
+        ctx = await AntaRunner(settings=AntaRunnerSettings(max_concurrency=1, deadline=0.1, test_timeout=5)).run(inventory, catalog)
+
+        assert perf_counter() - start < 5
+        assert len(ctx.manager) == 2
+        assert all(result.result == AntaTestStatus.ERROR for result in ctx.manager.results)
+        assert sorted(result.messages[0] for result in ctx.manager.results) == [DEADLINE_INTERRUPTED_MESSAGE, DEADLINE_NOT_STARTED_MESSAGE]
+
+    @pytest.mark.parametrize(("inventory", "pipeline"), [({"count": 2}, False), ({"count": 2}, True)], indirect=["inventory"])
+    async def test_run_deadline_connection(self, inventory: AntaInventory, pipeline: bool) -> None:
+        """Test AntaRunner.run() marking as error the tests of the devices still connecting at the deadline of the run."""
+
+        async def refresh(device: AsyncEOSDevice) -> None:
+            if device.name == "device-1":
+                await asyncio.sleep(10)
+            device.established = device.name == "device-0"
+
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"]})])
+
+        start = perf_counter()
+        with patch.object(AsyncEOSDevice, "refresh", autospec=True, side_effect=refresh):
+            ctx = await AntaRunner(settings=AntaRunnerSettings(deadline=0.1, pipeline=pipeline)).run(inventory, catalog)
+
+        assert perf_counter() - start < 5
+        assert ctx.devices_unreachable_at_setup == []
+        assert {result.name for result in ctx.manager.results} == {"device-0", "device-1"}
+        assert all(result.result == AntaTestStatus.ERROR for result in ctx.manager.results)
+        assert [result.messages for result in ctx.manager.results if result.name == "device-1"] == [[DEADLINE_NOT_STARTED_MESSAGE]]
+
+    @pytest.mark.parametrize(("inventory", "pipeline"), [({"count": 2}, False), ({"count": 2}, True)], indirect=["inventory"])
+    @respx.mock
+    async def test_watch(self, inventory: AntaInventory, pipeline: bool) -> None:
+        """Test AntaRunner.watch()."""
+        route = respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"], "collect": "all"})])
+        runner = AntaRunner(settings=AntaRunnerSettings(pipeline=pipeline))
+
+        with (
+            patch.object(AsyncEOSDevice, "refresh", autospec=True, side_effect=AsyncEOSDevice.refresh) as refresh_mock,
+            patch.object(runner, "_setup_tests", wraps=runner._setup_tests) as setup_tests_mock,
+        ):
+            contexts = [ctx async for ctx in runner.watch(inventory, catalog, interval=0.01, iterations=3)]
+
+        assert len(contexts) == 3
+        assert len({id(ctx.manager) for ctx in contexts}) == 3
+        assert all(len(ctx.manager) == 2 for ctx in contexts)
+        assert all(ctx.end_time is not None for ctx in contexts)
+        # The devices are connected and the tests are selected by the first run only
+        assert sorted(call.args[0].name for call in refresh_mock.call_args_list) == ["device-0", "device-1"]
+        setup_tests_mock.assert_called_once()
+        # The device caches are cleared before each run, the commands are collected again
+        assert route.call_count == 6
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2, "reachable": False}], indirect=True)
+    async def test_watch_setup_failed(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.watch() setting up the inventory again when no device was reachable."""
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"]})])
+        runner = AntaRunner()
+
+        with patch.object(runner, "_setup_inventory", wraps=runner._setup_inventory) as setup_inventory_mock:
+            contexts = [ctx async for ctx in runner.watch(inventory, catalog, interval=0.01, iterations=2)]
+
+        assert all(len(ctx.manager) == 0 for ctx in contexts)
+        assert all(ctx.devices_unreachable_at_setup == ["device-0", "device-1"] for ctx in contexts)
+        assert setup_inventory_mock.call_count == 2
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
+    @respx.mock
+    async def test_stream(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.stream()."""
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+        tests = [AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": [f"10.1.0.{i}"], "collect": "all"}) for i in range(5)]
+        catalog = AntaCatalog(tests=tests)
+        manager = ResultManager()
+        sink: list[AntaTestResult] = []
+
+        results = [result async for result in AntaRunner().stream(inventory, catalog, result_manager=manager, result_callbacks=[sink.append])]
+
+        assert len(results) == 15
+        assert len(sink) == 15
+        assert manager.results == results
+        for result in results:
+            assert result.result == "failure"
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
+    @respx.mock
+    async def test_stream_early_exit(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.stream() when the consumer stops iterating before the end of the run."""
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+        tests = [AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": [f"10.1.0.{i}"], "collect": "all"}) for i in range(5)]
+        catalog = AntaCatalog(tests=tests)
+        manager = ResultManager()
+
+        stream = AntaRunner().stream(inventory, catalog, result_manager=manager)
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+        assert len(manager) == 1
+
+    async def test_stream_empty_catalog(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test AntaRunner.stream() with an empty AntaCatalog."""
+        caplog.set_level(logging.WARNING)
+        inventory = AntaInventory.parse(filename=DATA_DIR / "test_inventory_with_tags.yml", username="anta", password="anta")
+
+        results = [result async for result in AntaRunner().stream(inventory, AntaCatalog())]
+
+        assert results == []
+        assert "The list of tests is empty. Exiting ..." in caplog.messages
+
 
 # pylint: disable=too-few-public-methods
 class TestAntaRunContext:
@@ -449,6 +1268,8 @@ class TestAntaRunContext:
         assert len(ctx.devices_unreachable_at_setup) == 0
         assert isinstance(ctx.warnings_at_setup, list)
         assert len(ctx.warnings_at_setup) == 0
+        assert ctx.scheduler is None
+        assert ctx.statistics == AntaRunStatistics()
         assert ctx.start_time is None
         assert ctx.end_time is None
 
@@ -458,4 +1279,6 @@ class TestAntaRunContext:
         assert ctx.total_devices_unreachable == 0
         assert ctx.total_devices_selected_for_testing == 0
         assert ctx.total_tests_scheduled == 0
+        assert ctx.total_commands_prefetched == 0
+        assert ctx.total_commands_deduplicated == 0
         assert ctx.duration is None
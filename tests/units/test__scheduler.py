@@ -0,0 +1,203 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta._scheduler.py."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from anta._scheduler import GLOBAL_LIMITER_NAME, AdaptiveLimiter, AntaScheduler, ConcurrencyAdjustment
+from anta.device import AsyncEOSDevice
+
+
+def _device(name: str, max_concurrency: int | None = None) -> AsyncEOSDevice:
+    """Return an AsyncEOSDevice instance."""
+    return AsyncEOSDevice(host=f"{name}.anta.arista.com", username="anta", password="anta", name=name, max_concurrency=max_concurrency)
+
+
+class TestAntaScheduler:
+    """Test AntaScheduler class."""
+
+    async def test_round_robin(self) -> None:
+        """Test that slots are granted in a round-robin fashion across devices."""
+        scheduler = AntaScheduler(max_concurrency=1)
+        devices = [_device("leaf1"), _device("leaf2"), _device("leaf3")]
+        order: list[str] = []
+
+        async def run(device: AsyncEOSDevice) -> None:
+            async with scheduler.slot(device):
+                order.append(device.name)
+                await asyncio.sleep(0)
+
+        # All the tests of leaf1 are scheduled first
+        await asyncio.gather(*(run(device) for device in devices for _ in range(3)))
+
+        assert order == ["leaf1", "leaf2", "leaf3"] * 3
+
+    async def test_device_max_concurrency(self) -> None:
+        """Test the default and per-device concurrency limits."""
+        scheduler = AntaScheduler(max_concurrency=100, device_max_concurrency=2)
+        devices = [_device("leaf1", max_concurrency=1), _device("leaf2")]
+        in_flight = {"leaf1": 0, "leaf2": 0}
+        max_in_flight = {"leaf1": 0, "leaf2": 0}
+        queue_depths: list[dict[str, int]] = []
+
+        async def run(device: AsyncEOSDevice) -> None:
+            async with scheduler.slot(device):
+                in_flight[device.name] += 1
+                max_in_flight[device.name] = max(max_in_flight[device.name], in_flight[device.name])
+                queue_depths.append(scheduler.queue_depth)
+                await asyncio.sleep(0)
+                in_flight[device.name] -= 1
+
+        await asyncio.gather(*(run(device) for device in devices for _ in range(4)))
+
+        assert max_in_flight == {"leaf1": 1, "leaf2": 2}
+        # First slots granted: 1 test of leaf1 and 2 tests of leaf2 are running
+        assert queue_depths[0] == {"leaf1": 3, "leaf2": 2}
+        assert scheduler.queue_depth == {"leaf1": 0, "leaf2": 0}
+        assert scheduler.in_flight == {"leaf1": 0, "leaf2": 0}
+
+    async def test_global_max_concurrency(self) -> None:
+        """Test the global concurrency limit across devices."""
+        scheduler = AntaScheduler(max_concurrency=2)
+        devices = [_device("leaf1"), _device("leaf2"), _device("leaf3")]
+        in_flight = 0
+        max_in_flight = 0
+
+        async def run(device: AsyncEOSDevice) -> None:
+            nonlocal in_flight, max_in_flight
+            async with scheduler.slot(device):
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0)
+                in_flight -= 1
+
+        await asyncio.gather(*(run(device) for device in devices for _ in range(5)))
+
+        assert max_in_flight == 2
+
+    async def test_cancel_waiting(self) -> None:
+        """Test that a cancelled waiting test is removed from the queue."""
+        scheduler = AntaScheduler(max_concurrency=1)
+        device = _device("leaf1")
+        release = asyncio.Event()
+
+        async def run() -> None:
+            async with scheduler.slot(device):
+                await release.wait()
+
+        running = asyncio.create_task(run())
+        waiting = asyncio.create_task(run())
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert scheduler.in_flight == {"leaf1": 1}
+        assert scheduler.queue_depth == {"leaf1": 1}
+
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+        assert scheduler.queue_depth == {"leaf1": 0}
+
+        release.set()
+        await running
+        assert scheduler.in_flight == {"leaf1": 0}
+
+        # The slot is available again
+        async with scheduler.slot(device):
+            assert scheduler.in_flight == {"leaf1": 1}
+
+    async def test_slot_timeout(self) -> None:
+        """Test that a test waiting for a slot longer than the timeout is removed from the queue."""
+        scheduler = AntaScheduler(max_concurrency=1)
+        device = _device("leaf1")
+
+        async with scheduler.slot(device, timeout=1):
+            with pytest.raises(asyncio.TimeoutError):
+                async with scheduler.slot(device, timeout=0.01):
+                    pass
+            assert scheduler.queue_depth == {"leaf1": 0}
+        assert scheduler.in_flight == {"leaf1": 0}
+
+
+class TestAdaptiveLimiter:
+    """Test AdaptiveLimiter class."""
+
+    def test_increase(self) -> None:
+        """Test the slow start and the additive increase of the limit while the latency is stable."""
+        limiter = AdaptiveLimiter("leaf1", initial_limit=2, max_limit=100)
+        # Slow start, the limit is doubled after each window of 10 requests
+        for _ in range(20):
+            limiter._record_latency(0.1)
+        assert limiter.limit == 8
+        # The latency increases, the slow start ends without changing the limit
+        for _ in range(10):
+            limiter._record_latency(1.0)
+        assert limiter.limit == 8
+        # Additive increase
+        for _ in range(10):
+            limiter._record_latency(0.1)
+        assert limiter.limit == 9
+        assert [(adjustment.previous_limit, adjustment.limit) for adjustment in limiter.adjustments] == [(2, 4), (4, 8), (8, 9)]
+
+    def test_max_limit(self) -> None:
+        """Test that the limit does not exceed the maximum limit."""
+        limiter = AdaptiveLimiter("leaf1", initial_limit=8, max_limit=10)
+        for _ in range(20):
+            limiter._record_latency(0.1)
+        assert limiter.limit == 10
+
+    async def test_record_failure(self) -> None:
+        """Test the multiplicative decrease of the limit on failures, reported to the parent limiter."""
+        adjustments: list[ConcurrencyAdjustment] = []
+        parent = AdaptiveLimiter(GLOBAL_LIMITER_NAME, initial_limit=20, max_limit=100, adjustments=adjustments)
+        limiter = AdaptiveLimiter("leaf1", initial_limit=8, max_limit=100, parent=parent, adjustments=adjustments)
+
+        async def request(*, fail: bool) -> None:
+            async with limiter.slot():
+                await asyncio.sleep(0)
+                if fail:
+                    limiter.record_failure("TimeoutException")
+
+        # The second failure happens during the cooldown of the first one
+        await asyncio.gather(request(fail=True), request(fail=True), request(fail=False))
+        assert limiter.limit == 4
+        assert parent.limit == 10
+        assert [(adjustment.name, adjustment.reason) for adjustment in adjustments] == [
+            (GLOBAL_LIMITER_NAME, "TimeoutException on leaf1"),
+            ("leaf1", "TimeoutException"),
+        ]
+        assert limiter.in_flight == 0
+        assert parent.in_flight == 0
+
+        # The cooldown is over, a new failure halves the limit again
+        await request(fail=True)
+        assert limiter.limit == 2
+
+    async def test_waiting(self) -> None:
+        """Test that the requests wait for a slot when the limit is reached."""
+        limiter = AdaptiveLimiter("leaf1", initial_limit=1, max_limit=100)
+        release = asyncio.Event()
+        running = 0
+        max_running = 0
+
+        async def request() -> None:
+            nonlocal running, max_running
+            async with limiter.slot():
+                running += 1
+                max_running = max(max_running, running)
+                await release.wait()
+                running -= 1
+
+        tasks = [asyncio.create_task(request()) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert limiter.in_flight == 1
+
+        # A cancelled waiting request does not take a slot
+        tasks[1].cancel()
+        release.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        assert max_running == 1
+        assert limiter.in_flight == 0
@@ -0,0 +1,53 @@
+# Copyright (c) 2023-2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta._statistics.py."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from anta._scheduler import ConcurrencyAdjustment
+from anta._statistics import (
+    AntaRunStatistics,
+    ConcurrencyStatistics,
+    PrefetchStatistics,
+    SweepStatistics,
+    TransportStatistics,
+    WorkerPoolStatistics,
+)
+
+
+def test_merge() -> None:
+    """Test AntaRunStatistics.merge() merging the statistics of two inventory shards."""
+    # The adjustment of the second shard happened first
+    adjustments = [
+        ConcurrencyAdjustment(name=name, previous_limit=10, limit=5, reason="TimeoutException", timestamp=datetime(2025, 1, 1, second=second, tzinfo=timezone.utc))
+        for name, second in (("leaf2", 1), ("leaf1", 2))
+    ]
+    statistics = AntaRunStatistics(
+        prefetch=PrefetchStatistics(prefetched_commands={"leaf1": 2}, deduplicated_commands={"leaf1": 1}),
+        worker_pool=WorkerPoolStatistics(peak_tests_in_memory=4),
+        concurrency=ConcurrencyStatistics(limits={"leaf1": 5, "global": 10}, adjustments=[adjustments[1]]),
+        transport=TransportStatistics(retries={"leaf1": {"requests": 2, "retries": 1, "exhausted": 0}}),
+        sweep=SweepStatistics(swept_devices=2, live_devices=1, duration=0.5),
+    )
+    statistics.merge(
+        AntaRunStatistics(
+            prefetch=PrefetchStatistics(prefetched_commands={"leaf2": 3}, deduplicated_commands={"leaf2": 0}),
+            worker_pool=WorkerPoolStatistics(peak_tests_in_memory=8),
+            concurrency=ConcurrencyStatistics(limits={"leaf2": 5, "global": 10}, adjustments=[adjustments[0]]),
+            transport=TransportStatistics(circuit_breakers={"leaf2": {"opened": 1, "rejected": 2}}),
+            sweep=SweepStatistics(swept_devices=2, live_devices=2, duration=1.5),
+        )
+    )
+
+    assert statistics.prefetch == PrefetchStatistics(prefetched_commands={"leaf1": 2, "leaf2": 3}, deduplicated_commands={"leaf1": 1, "leaf2": 0})
+    # The worker processes run concurrently, their memory statistics add up
+    assert statistics.worker_pool == WorkerPoolStatistics(peak_tests_in_memory=12)
+    # The global limits of the shards add up and the adjustments are sorted by timestamp
+    assert statistics.concurrency == ConcurrencyStatistics(limits={"leaf1": 5, "global": 20, "leaf2": 5}, adjustments=adjustments)
+    assert statistics.transport == TransportStatistics(
+        retries={"leaf1": {"requests": 2, "retries": 1, "exhausted": 0}}, circuit_breakers={"leaf2": {"opened": 1, "rejected": 2}}
+    )
+    assert statistics.sweep == SweepStatistics(swept_devices=4, live_devices=3, duration=1.5)
@@ -8,6 +8,7 @@ from __future__ import annotations
 from json import load as json_load
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
+from unittest.mock import patch
 
 import pytest
 from pydantic import ValidationError
@@ -138,6 +139,46 @@ TESTS_SETTER_FAIL_PARAMS: list[ParameterSet] = [
 ]
 
 
+class TestAntaTestDefinition:
+    """Test for anta.catalog.AntaTestDefinition."""
+
+    def test_fingerprint(self) -> None:
+        """Test the fingerprint of AntaTestDefinition used for hashing and equality."""
+        definition1 = AntaTestDefinition(test=VerifyUptime, inputs={"minimum": 10})
+        definition2 = AntaTestDefinition(test=VerifyUptime, inputs=VerifyUptime.Input(minimum=10))
+        definition3 = AntaTestDefinition(test=VerifyUptime, inputs={"minimum": 20})
+        assert definition1.fingerprint == definition2.fingerprint
+        assert definition1 == definition2
+        assert definition1 != definition3
+        assert len({definition1, definition2, definition3}) == 2
+
+    def test_fingerprint_cached(self) -> None:
+        """Test that the inputs are not serialized again when hashing an AntaTestDefinition."""
+        definition = AntaTestDefinition(test=VerifyUptime, inputs={"minimum": 10})
+        with patch.object(VerifyUptime.Input, "model_dump_json") as model_dump_json:
+            for _ in range(10):
+                hash(definition)
+        model_dump_json.assert_not_called()
+
+    def test_fingerprint_inputs_changed(self) -> None:
+        """Test that the fingerprint of an AntaTestDefinition changes when its inputs change."""
+        definition = AntaTestDefinition(test=VerifyUptime, inputs={"minimum": 10})
+        fingerprint = definition.fingerprint
+
+        copied = definition.model_copy(update={"inputs": VerifyUptime.Input(minimum=20)})
+        assert copied.fingerprint != fingerprint
+        assert copied != definition
+        assert len({definition, copied}) == 2
+
+        assert isinstance(definition.inputs, VerifyUptime.Input)
+        definition.inputs.minimum = 20
+        assert definition.fingerprint != fingerprint
+        assert definition == copied
+        # Unchanged inputs keep their fingerprint
+        assert definition.model_copy().fingerprint == definition.fingerprint
+        assert definition.model_copy(deep=True) == definition
+
+
 class TestAntaCatalog:
     """Tests for anta.catalog.AntaCatalog."""
 
@@ -6,6 +6,9 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import pickle
+import sqlite3
 from contextlib import AbstractContextManager
 from contextlib import nullcontext as does_not_raise
 from pathlib import Path
@@ -14,10 +17,15 @@ from unittest.mock import patch
 
 import pytest
 from asyncssh import SSHClientConnection, SSHClientConnectionOptions
-from httpx import ConnectError, HTTPError, TimeoutException
+from httpx import ConnectError, HTTPError, HTTPStatusError, Request, Response, TimeoutException
 from rich import print as rprint
 
-from anta.device import AntaDevice, AsyncEOSDevice
+from anta._circuit_breaker import CircuitBreaker
+from anta._replay import ReplayArchive
+from anta._retry import RetryPolicy
+from anta._scheduler import AdaptiveLimiter
+from anta.device import AntaCache, AntaDevice, AntaDiskCache, AsyncEOSDevice, ReplayDevice, _get_cache_settings, _is_http2_available
+from anta.logger import exc_to_str
 from anta.models import AntaCommand
 from asynceapi import EapiCommandError
 from tests.units.conftest import COMMAND_OUTPUT
@@ -541,11 +549,98 @@ COLLECT_PARAMS: list[ParameterSet] = [
     pytest.param({"disable_cache": True}, {"command": "show version", "use_cache": False}, {}, id="device cache disabled, command cache disabled"),
 ]
 CACHE_STATS_PARAMS: list[ParameterSet] = [
-    pytest.param({"disable_cache": False}, {"total_commands_sent": 0, "cache_hits": 0, "cache_hit_ratio": "0.00%"}, id="with_cache"),
+    pytest.param(
+        {"disable_cache": False},
+        {
+            "total_commands_sent": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "cache_evictions": 0,
+            "cache_bytes": 0,
+            "coalesced_commands": 0,
+            "cache_hit_ratio": "0.00%",
+        },
+        id="with_cache",
+    ),
     pytest.param({"disable_cache": True}, None, id="without_cache"),
 ]
 
 
+class TestAntaCache:
+    """Test for anta.device.AntaCache."""
+
+    async def test_max_size(self) -> None:
+        """Test that the least recently used entries are evicted to stay within the maximum number of entries."""
+        cache = AntaCache("leaf1", max_size=2)
+        await cache.set("uid1", "output")
+        await cache.set("uid2", "output")
+        assert await cache.get("uid1") == "output"
+        await cache.set("uid3", "output")
+
+        assert list(cache.cache) == ["uid1", "uid3"]
+        assert cache.stats == {"hits": 1, "misses": 0, "evictions": 1, "bytes": 12, "total": 1}
+
+    async def test_max_bytes(self) -> None:
+        """Test that the least recently used entries are evicted to stay within the memory budget."""
+        cache = AntaCache("leaf1", max_bytes=20)
+        await cache.set("uid1", "0123456789")
+        await cache.set("uid2", {"key": "value"})
+        assert cache.stats["bytes"] == 16
+        assert await cache.get("uid1") is None
+        assert await cache.get("uid2") == {"key": "value"}
+        # An entry larger than the budget is not cached
+        assert not await cache.set("uid3", "0" * 21)
+        assert cache.stats == {"hits": 1, "misses": 1, "evictions": 1, "bytes": 16, "total": 2}
+
+    async def test_ttl_rules(self) -> None:
+        """Test the time to live of the entries resolved from the TTL rules."""
+        cache = AntaCache("leaf1", ttl=60, ttl_rules={"show version": 3600, r"show interfaces( \S+)? counters": 5})
+        assert cache.get_ttl("show version") == 3600
+        assert cache.get_ttl("show interfaces counters") == 5
+        assert cache.get_ttl("show interfaces Ethernet1 counters rates") == 5
+        assert cache.get_ttl("show interfaces") == 60
+
+        with patch("anta.device.monotonic", return_value=100.0):
+            await cache.set("uid1", "output", ttl=cache.get_ttl("show interfaces counters"))
+            await cache.set("uid2", "output")
+        with patch("anta.device.monotonic", return_value=105.0):
+            assert await cache.get("uid1") is None
+            assert await cache.get("uid2") == "output"
+
+    async def test_compression(self) -> None:
+        """Test that the entries larger than the compression threshold are stored compressed."""
+        cache = AntaCache("leaf1", compress_threshold=100)
+        output = {"interfaces": {f"Ethernet{index}": {"description": "pytest"} for index in range(100)}}
+        await cache.set("uid1", output)
+        await cache.set("uid2", "0" * 1000)
+        await cache.set("uid3", "short")
+
+        assert isinstance(cache.cache["uid1"][1], bytes)
+        assert cache.stats["bytes"] < len(json.dumps(output)) + 1000
+        assert await cache.get("uid1") == output
+        assert await cache.get("uid2") == "0" * 1000
+        assert await cache.get("uid3") == "short"
+
+    @pytest.mark.parametrize(
+        ("settings", "dumps_count", "size"),
+        [
+            pytest.param({}, 0, 0, id="no-budget"),
+            pytest.param({"max_bytes": 10000}, 1, 16, id="max-bytes"),
+            pytest.param({"compress_threshold": 10}, 1, None, id="compression"),
+        ],
+    )
+    async def test_set_serialization(self, settings: dict[str, Any], dumps_count: int, size: int | None) -> None:
+        """Test that JSON outputs are serialized at most once, and only when their size is needed."""
+        cache = AntaCache("leaf1", **settings)
+        with patch("anta.device.json.dumps", wraps=json.dumps) as dumps_mock:
+            assert await cache.set("uid1", {"key": "value"})
+
+        assert dumps_mock.call_count == dumps_count
+        if size is not None:
+            assert cache.stats["bytes"] == size
+        assert await cache.get("uid1") == {"key": "value"}
+
+
 class TestAntaDevice:
     """Test for anta.device.AntaDevice Abstract class."""
 
@@ -584,6 +679,47 @@ class TestAntaDevice:
             assert device.cache is None
             device._collect.assert_called_once_with(command=cmd, collection_id=None)  # type: ignore[attr-defined]
 
+    @pytest.mark.parametrize("device", [{"disable_cache": False}, {"disable_cache": True}], indirect=True)
+    async def test_collect_coalesced(self, device: AntaDevice) -> None:
+        """Test that the concurrent collections of the same command are coalesced, whether caching is enabled or not."""
+
+        async def _collect(command: AntaCommand, **_kwargs: Any) -> None:  # noqa: ANN401
+            await asyncio.sleep(0.01)
+            command.output = COMMAND_OUTPUT
+
+        commands = [AntaCommand(command="show version") for _ in range(3)]
+        uncached = AntaCommand(command="show version", use_cache=False)
+        with patch.object(device, "_collect", side_effect=_collect) as collect_mock:
+            await asyncio.gather(*(device.collect(command) for command in [*commands, uncached]))
+
+        assert collect_mock.await_count == 2
+        assert all(command.output == COMMAND_OUTPUT for command in commands)
+        assert device.coalesced_commands == 2
+        assert not device._inflight
+
+    async def test_collect_coalesced_cancelled(self, device: AntaDevice) -> None:
+        """Test that the coalesced collections collect the command again if the in-flight collection is cancelled."""
+
+        async def _collect(command: AntaCommand, **_kwargs: Any) -> None:  # noqa: ANN401
+            await asyncio.sleep(0.01)
+            command.output = COMMAND_OUTPUT
+
+        leader_command = AntaCommand(command="show version")
+        command = AntaCommand(command="show version")
+        with patch.object(device, "_collect", side_effect=_collect) as collect_mock:
+            leader = asyncio.ensure_future(device.collect(leader_command))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(device.collect(command))
+            await asyncio.sleep(0)
+            leader.cancel()
+            await follower
+
+        assert leader.cancelled()
+        assert collect_mock.await_count == 2
+        assert command.output == COMMAND_OUTPUT
+        assert device.coalesced_commands == 0
+        assert not device._inflight
+
     @pytest.mark.parametrize(("device", "expected"), CACHE_STATS_PARAMS, indirect=["device"])
     def test_cache_statistics(self, device: AntaDevice, expected: dict[str, Any] | None) -> None:
         """Verify that when cache statistics attribute does not exist.
@@ -596,6 +732,102 @@ class TestAntaDevice:
         """Test max_connections property."""
         assert device.max_connections is None
 
+    async def test_collect_batch(self, device: AntaDevice) -> None:
+        """Test AntaDevice.collect_batch behavior."""
+        assert device.cache is not None
+        cached = AntaCommand(command="show version")
+        await device.cache.set(cached.uid, "cached_value")
+        commands = [
+            cached,
+            AntaCommand(command="show interfaces"),
+            AntaCommand(command="show interfaces", use_cache=False),
+            AntaCommand(command="show logging", ofmt="text"),
+            AntaCommand(command="show vlan", version=1),
+        ]
+
+        with patch.object(device, "_collect_batch", wraps=device._collect_batch) as collect_batch_mock:
+            await device.collect_batch(commands, batch_size=1)
+
+        # One batch per command not in the cache
+        assert collect_batch_mock.await_count == 4
+        assert cached.output == "cached_value"
+        for command in commands[1:]:
+            assert command.output == COMMAND_OUTPUT
+        assert await device.cache.get(commands[1].uid) == COMMAND_OUTPUT
+        assert await device.cache.get(commands[3].uid) == COMMAND_OUTPUT
+
+    async def test_cache_default_settings(self) -> None:
+        """Test that the in-memory cache has no memory budget by default, so the JSON outputs are not serialized when cached."""
+        _get_cache_settings.cache_clear()
+        device = AsyncEOSDevice(host="42.42.42.42", username="anta", password="anta", name="leaf1")
+        assert isinstance(device.cache, AntaCache)
+        assert device.cache.max_bytes is None
+
+        with patch("anta.device.json.dumps", wraps=json.dumps) as dumps_mock:
+            assert await device.cache.set("uid", COMMAND_OUTPUT)
+
+        dumps_mock.assert_not_called()
+
+    async def test_disk_cache(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the command outputs are persisted across device instances when ANTA_CACHE_PATH is set."""
+        monkeypatch.setenv("ANTA_CACHE_PATH", str(tmp_path / "anta.db"))
+        _get_cache_settings.cache_clear()
+        try:
+            device = AsyncEOSDevice(host="42.42.42.42", username="anta", password="anta", name="leaf1")
+            assert isinstance(device.cache, AntaDiskCache)
+            await device.cache.set("uid", {"modelName": "pytest"})
+
+            # Another run with the same device keys finds the output
+            device = AsyncEOSDevice(host="42.42.42.42", username="anta", password="anta", name="leaf1-renamed")
+            assert isinstance(device.cache, AntaDiskCache)
+            assert await device.cache.get("uid") == {"modelName": "pytest"}
+            assert await AsyncEOSDevice(host="42.42.42.43", username="anta", password="anta").cache.get("uid") is None  # type: ignore[union-attr]
+            device.cache.store.close()
+        finally:
+            _get_cache_settings.cache_clear()
+
+    async def test_disk_cache_locked(self, tmp_path: Path) -> None:
+        """Test that a database locked by another process does not block the event loop."""
+        path = tmp_path / "anta.db"
+        cache = AntaDiskCache("leaf1", path, get_namespace=lambda: "leaf1")
+        # Another process holds the write lock of the database
+        connection = sqlite3.connect(path, isolation_level=None)
+        connection.execute("BEGIN EXCLUSIVE")
+        try:
+            write = asyncio.ensure_future(cache.set("uid", {"modelName": "pytest"}))
+            # The other coroutines keep running while the write waits for the lock
+            await asyncio.sleep(0.1)
+            assert not write.done()
+        finally:
+            connection.execute("COMMIT")
+            connection.close()
+
+        assert await write
+        assert await cache.get("uid") == {"modelName": "pytest"}
+        cache.store.close()
+
+    async def test_disk_cache_clear(self, tmp_path: Path) -> None:
+        """Test that clearing a persistent cache keeps the outputs stored in the database for the other runs."""
+        path = tmp_path / "anta.db"
+        cache = AntaDiskCache("leaf1", path, get_namespace=lambda: "leaf1")
+        await cache.set("uid1", "output1")
+        await cache.set("uid2", "output2")
+
+        with patch.object(cache.store, "delete") as delete_mock:
+            cache.clear()
+        delete_mock.assert_not_called()
+
+        # The outputs stored before the clear are collected again by this run
+        assert await cache.get("uid1") is None
+        await cache.set("uid1", "fresh output1")
+        assert await cache.get("uid1") == "fresh output1"
+        assert cache.stats["misses"] == 1
+        # Another run still finds the outputs in the database
+        other_cache = AntaDiskCache("leaf1", path, get_namespace=lambda: "leaf1")
+        assert await other_cache.get("uid1") == "fresh output1"
+        assert await other_cache.get("uid2") == "output2"
+        cache.store.close()
+
 
 class TestAsyncEOSDevice:
     """Test for anta.device.AsyncEOSDevice."""
@@ -619,6 +851,33 @@ class TestAsyncEOSDevice:
             with patch("anta.device.__DEBUG__", new=True):
                 rprint(dev)
 
+    async def test_pickle(self) -> None:
+        """Test that an AsyncEOSDevice is re-created with new sessions when unpickled, without its runtime state."""
+        dev = AsyncEOSDevice(host="42.42.42.42", username="anta", password="anta", name="leaf1", port=8443, tags={"leaf"}, enable=True, max_concurrency=5)
+        # State of a refreshed device
+        dev.is_online = True
+        dev.established = True
+        dev.hw_model = "cEOSLab"
+        assert dev.cache is not None
+        await dev.cache.set("uid1", "output")
+        # Configuration changed after instantiation
+        dev.max_concurrency = 10
+
+        new_dev = pickle.loads(pickle.dumps(dev))  # noqa: S301
+
+        assert new_dev == dev
+        assert new_dev.name == "leaf1"
+        assert new_dev.tags == {"leaf", "leaf1"}
+        assert new_dev.enable
+        assert new_dev.max_concurrency == 10
+        assert new_dev._session is not dev._session
+        # The runtime state is not pickled
+        assert not new_dev.is_online
+        assert not new_dev.established
+        assert new_dev.hw_model is None
+        assert new_dev.cache is not None
+        assert await new_dev.cache.get("uid1") is None
+
     @pytest.mark.parametrize(("device1", "device2", "expected"), EQUALITY_PARAMS)
     def test__eq(self, device1: dict[str, Any], device2: dict[str, Any], expected: bool) -> None:
         """Test the AsyncEOSDevice equality."""
@@ -639,6 +898,33 @@ class TestAsyncEOSDevice:
         with patch.object(async_device, "_session", None):
             assert async_device.max_connections is None
 
+    async def test_http2(self) -> None:
+        """Test that HTTP/2 is enabled on the eAPI session and that the negotiated HTTP version is recorded."""
+        with patch("anta.device._is_http2_available", return_value=True), patch("anta.device.asynceapi.Device") as session_mock:
+            device = AsyncEOSDevice("42.42.42.42", "anta", "anta", http2=True)
+        assert session_mock.call_args.kwargs["http2"] is True
+        assert session_mock.call_args.kwargs["event_hooks"] == {"response": [device._record_http_version]}
+        assert pickle.loads(pickle.dumps(device)).http2  # noqa: S301
+
+        device = AsyncEOSDevice("42.42.42.42", "anta", "anta", http2=True)
+        await device._record_http_version(Response(200, extensions={"http_version": b"HTTP/1.1"}))
+        assert device.http_version == "HTTP/1.1"
+        assert device.max_connections == 100
+        # The concurrent requests are multiplexed over a single connection once HTTP/2 is negotiated
+        await device._record_http_version(Response(200, extensions={"http_version": b"HTTP/2"}))
+        assert device.max_connections == 1
+
+    def test_http2_unavailable(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that the device falls back to HTTP/1.1 when the `h2` package is not installed."""
+        _is_http2_available.cache_clear()
+        with patch("anta.device.importlib.util.find_spec", return_value=None), patch("anta.device.asynceapi.Device") as session_mock:
+            AsyncEOSDevice("42.42.42.42", "anta", "anta", http2=True)
+            AsyncEOSDevice("42.42.42.43", "anta", "anta", http2=True)
+        _is_http2_available.cache_clear()
+        assert all("http2" not in call.kwargs for call in session_mock.call_args_list)
+        # The warning is logged once
+        assert caplog.text.count("the 'h2' package is not installed, falling back to HTTP/1.1") == 1
+
     @pytest.mark.parametrize(
         ("async_device", "patch_kwargs", "expected"),
         REFRESH_PARAMS,
@@ -685,6 +971,138 @@ class TestAsyncEOSDevice:
             assert cmd.output == expected["output"]
             assert cmd.errors == expected["errors"]
 
+    @pytest.mark.parametrize(("async_device"), [{"enable": True}], indirect=True)
+    async def test__collect_batch(self, async_device: AsyncEOSDevice) -> None:
+        """Test AsyncEOSDevice._collect_batch() with a failed command in the batch."""
+        commands = [AntaCommand(command="show version"), AntaCommand(command="show bgp summary"), AntaCommand(command="show vlan")]
+        error = EapiCommandError(passed=[{}, {"modelName": "pytest"}], failed="show bgp summary", errors=["BGP inactive"], errmsg="Invalid command", not_exec=[])
+        with patch.object(async_device._session, "cli", side_effect=[error, [{}, {"vlans": {}}]]) as cli_mock:
+            await async_device._collect_batch(commands, collection_id="pytest")
+
+        assert cli_mock.await_count == 2
+        cli_mock.assert_awaited_with(commands=[{"cmd": "enable"}, {"cmd": "show vlan"}], ofmt="json", version="latest", req_id=f"ANTA-pytest-{id(commands[2])}")
+        assert commands[0].output == {"modelName": "pytest"}
+        assert commands[1].output is None
+        assert commands[1].errors == ["BGP inactive"]
+        assert commands[2].output == {"vlans": {}}
+
+    async def test__collect_batch_timeout(self, async_device: AsyncEOSDevice) -> None:
+        """Test AsyncEOSDevice._collect_batch() with a transport error."""
+        commands = [AntaCommand(command="show version"), AntaCommand(command="show vlan")]
+        with patch.object(async_device._session, "cli", side_effect=TimeoutException("Test")):
+            await async_device._collect_batch(commands)
+
+        for command in commands:
+            assert command.output is None
+            assert command.errors == ["TimeoutException: Test"]
+
+    @pytest.mark.parametrize(
+        ("exception", "backoff"),
+        [
+            pytest.param(TimeoutException("Test"), True, id="timeout"),
+            pytest.param(HTTPStatusError("Test", request=Request("POST", "https://pytest"), response=Response(503)), True, id="http-5xx"),
+            pytest.param(HTTPStatusError("Test", request=Request("POST", "https://pytest"), response=Response(401)), False, id="http-4xx"),
+        ],
+    )
+    async def test__collect_batch_request_limiter(self, async_device: AsyncEOSDevice, exception: HTTPError, *, backoff: bool) -> None:
+        """Test that AsyncEOSDevice._collect_batch() reports the overload errors to the request limiter."""
+        async_device.request_limiter = AdaptiveLimiter(async_device.name, initial_limit=8, max_limit=100)
+        with patch.object(async_device._session, "cli", side_effect=exception):
+            await async_device._collect_batch([AntaCommand(command="show version")])
+
+        assert async_device.request_limiter.limit == (4 if backoff else 8)
+        assert async_device.request_limiter.in_flight == 0
+
+    async def test__collect_batch_retry(self, async_device: AsyncEOSDevice) -> None:
+        """Test that AsyncEOSDevice._collect_batch() retries the requests failing with a transient error."""
+        async_device.retry_policy = RetryPolicy(async_device.name, max_attempts=3, backoff=0.001)
+        commands = [AntaCommand(command="show version"), AntaCommand(command="show vlan")]
+        side_effect = [TimeoutException("Test"), ConnectError("Test"), [{"modelName": "pytest"}, {"vlans": {}}]]
+        with patch.object(async_device._session, "cli", side_effect=side_effect) as cli_mock:
+            await async_device._collect_batch(commands)
+
+        assert cli_mock.await_count == 3
+        assert commands[0].output == {"modelName": "pytest"}
+        assert commands[1].output == {"vlans": {}}
+        assert [command.retries for command in commands] == [2, 2]
+        assert async_device.retry_policy.statistics == {"requests": 1, "retries": 2, "exhausted": 0}
+
+    @pytest.mark.parametrize(
+        ("exception", "await_count", "exhausted"),
+        [
+            pytest.param(TimeoutException("Test"), 2, 1, id="retryable"),
+            pytest.param(HTTPStatusError("Test", request=Request("POST", "https://pytest"), response=Response(401)), 1, 0, id="not-retryable"),
+        ],
+    )
+    async def test__collect_batch_retry_failure(self, async_device: AsyncEOSDevice, exception: HTTPError, await_count: int, exhausted: int) -> None:
+        """Test AsyncEOSDevice._collect_batch() with a request failing after all the attempts or with an error that is not retryable."""
+        async_device.retry_policy = RetryPolicy(async_device.name, max_attempts=2, backoff=0.001)
+        command = AntaCommand(command="show version")
+        with patch.object(async_device._session, "cli", side_effect=exception) as cli_mock:
+            await async_device._collect_batch([command])
+
+        assert cli_mock.await_count == await_count
+        assert command.output is None
+        assert command.errors == [exc_to_str(exception)]
+        assert async_device.retry_policy.exhausted == exhausted
+
+    async def test__collect_batch_circuit_breaker(self, async_device: AsyncEOSDevice) -> None:
+        """Test that AsyncEOSDevice._collect_batch() fails fast the requests once the circuit breaker of the device is open."""
+        async_device.circuit_breaker = CircuitBreaker(async_device.name, threshold=2)
+        commands = [AntaCommand(command="show version") for _ in range(3)]
+        with patch.object(async_device._session, "cli", side_effect=ConnectError("Test")) as cli_mock:
+            for command in commands:
+                await async_device._collect_batch([command])
+
+        assert cli_mock.await_count == 2
+        assert commands[2].errors == ["Circuit breaker open after 2 consecutive transport errors on pytest, request not sent"]
+        assert async_device.circuit_breaker.statistics == {"opened": 1, "rejected": 1}
+
+    async def test__collect_batch_circuit_breaker_retry(self, async_device: AsyncEOSDevice) -> None:
+        """Test that AsyncEOSDevice._collect_batch() reports a request to the circuit breaker only once its retries are exhausted."""
+        async_device.retry_policy = RetryPolicy(async_device.name, max_attempts=3, backoff=0.001)
+        async_device.circuit_breaker = CircuitBreaker(async_device.name, threshold=2)
+        commands = [AntaCommand(command="show version"), AntaCommand(command="show vlan")]
+        # The first request succeeds after a retry, the second one fails after all its attempts
+        side_effect = [ConnectError("Test"), [{"modelName": "pytest"}], *[ConnectError("Test")] * 3]
+        with patch.object(async_device._session, "cli", side_effect=side_effect) as cli_mock:
+            for command in commands:
+                await async_device._collect_batch([command])
+
+        assert cli_mock.await_count == 5
+        assert commands[0].output == {"modelName": "pytest"}
+        assert commands[1].errors == ["ConnectError: Test"]
+        # A single request failed, below the threshold of the circuit breaker
+        assert async_device.circuit_breaker.statistics == {"opened": 0, "rejected": 0}
+
+    @pytest.mark.parametrize(
+        ("port_state", "expected"),
+        [
+            pytest.param("open", True, id="open"),
+            pytest.param("refused", False, id="refused"),
+            pytest.param("timeout", False, id="timeout"),
+        ],
+    )
+    async def test_check_port(self, port_state: str, expected: bool) -> None:
+        """Test AsyncEOSDevice.check_port() against a local TCP server."""
+        server = await asyncio.start_server(lambda _reader, writer: writer.close(), host="127.0.0.1", port=0)
+        port = server.sockets[0].getsockname()[1]
+        if port_state != "open":
+            server.close()
+            await server.wait_closed()
+        device = AsyncEOSDevice(host="127.0.0.1", port=port, username="anta", password="anta", proto="http")
+
+        async def hang(*_args: Any, **_kwargs: Any) -> None:  # noqa: ANN401
+            """Never complete the connection, e.g. a dead host dropping the SYN packets."""
+            await asyncio.Event().wait()
+
+        # The timeout of asyncio.wait_for() expires for real
+        with patch("asyncio.open_connection", new=hang) if port_state == "timeout" else does_not_raise():
+            assert await device.check_port(0.1) is expected
+
+        server.close()
+        await server.wait_closed()
+
     @pytest.mark.parametrize(
         ("async_device", "copy"),
         ASYNCEAPI_COPY_PARAMS,
@@ -707,3 +1125,59 @@ class TestAsyncEOSDevice:
                     scp_mock.assert_not_awaited()
                     return
                 scp_mock.assert_awaited_once_with(src, dst)
+
+
+class TestReplayDevice:
+    """Test for anta.device.ReplayDevice."""
+
+    @pytest.mark.parametrize("archive", [pytest.param(False, id="directory"), pytest.param(True, id="archive")])
+    async def test_collect(self, snapshot_dir: Path, snapshot_archive: Path, *, archive: bool) -> None:
+        """Test ReplayDevice.collect() and ReplayDevice.refresh() with a snapshot directory and a ZIP archive of a snapshot directory."""
+        source = snapshot_archive if archive else snapshot_dir
+        device = ReplayDevice("leaf1", source)
+        await device.refresh()
+        assert device.is_online
+        assert device.established
+        assert device.hw_model == "DCS-7280CR3-32P4-F"
+
+        json_command = AntaCommand(command="show version", revision=1)
+        text_command = AntaCommand(command="show running-config section router bgp", ofmt="text")
+        missing_command = AntaCommand(command="show ip bgp summary")
+        await device.collect_commands([json_command, text_command, missing_command])
+        assert json_command.json_output == {"modelName": "DCS-7280CR3-32P4-F", "version": "4.31.1F"}
+        assert text_command.text_output == "router bgp 65101\n"
+        assert not missing_command.collected
+        assert missing_command.errors == [f"Output not found in {source}"]
+
+        # The device owns the archive opened from a path
+        assert (device.archive is not None) is archive
+        device.close()
+        if device.archive is not None:
+            assert device.archive._zipfile is None
+
+    async def test_shared_archive(self, snapshot_archive: Path) -> None:
+        """Test that a ReplayArchive shared by devices is not closed by the devices."""
+        with ReplayArchive(snapshot_archive) as archive:
+            device = ReplayDevice("leaf1", archive)
+            assert device.source == snapshot_archive
+            await device.refresh()
+            assert device.hw_model == "DCS-7280CR3-32P4-F"
+            device.close()
+            assert archive._zipfile is not None
+        assert archive._zipfile is None
+
+    async def test_refresh_missing_device(self, snapshot_dir: Path) -> None:
+        """Test ReplayDevice.refresh() with a device that is not in the snapshot."""
+        device = ReplayDevice("leaf2", snapshot_dir)
+        await device.refresh()
+        assert not device.is_online
+        assert not device.established
+        assert device.hw_model is None
+
+    def test_pickle(self, snapshot_dir: Path) -> None:
+        """Test that the ReplayDevice object can be pickled and unpickled."""
+        device = ReplayDevice("leaf1", snapshot_dir, tags={"leaf"}, disable_cache=True)
+        unpickled = pickle.loads(pickle.dumps(device))  # noqa: S301
+        assert unpickled == device
+        assert unpickled.tags == {"leaf", "leaf1"}
+        assert unpickled.cache is None
@@ -521,6 +521,34 @@ class TestAntaTest:
         assert test.result.description == "a description"
         assert test.result.custom_field == "a custom field"
 
+    def test_timing(self, device: AntaDevice) -> None:
+        """Test the timing recorded in the test result."""
+
+        class FakeTestWithCommand(AntaTest):
+            """Fake Test with a command."""
+
+            categories: ClassVar[list[str]] = []
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaCommand(command="show version")]
+
+            @AntaTest.anta_test
+            def test(self) -> None:
+                self.result.is_success()
+
+        first_test = FakeTestWithCommand(device)
+        asyncio.run(first_test.test())
+        second_test = FakeTestWithCommand(device)
+        asyncio.run(second_test.test())
+
+        assert first_test.result.timing is not None
+        assert first_test.result.timing.queue_wait is None
+        assert first_test.result.timing.cache_hits == 0
+        assert first_test.result.timing.total >= first_test.result.timing.collection + first_test.result.timing.evaluation
+        # The command of the second test is served from the device cache
+        assert second_test.result.timing is not None
+        assert second_test.result.timing.cache_hits == 1
+        assert second_test.instance_commands[0].cache_hit is True
+        assert "cache_hit" not in second_test.instance_commands[0].model_dump()
+
 
 class TestAntaCommand:
     """Test for anta.models.AntaCommand."""